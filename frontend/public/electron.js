@@ -1,9 +1,10 @@
 const { app, BrowserWindow, ipcMain, dialog, shell } = require('electron');
 const path = require('path');
 const isDev = require('electron-is-dev');
-const { spawn, exec } = require('child_process');
+const { spawn, exec, execFile } = require('child_process');
 const fs = require('fs');
 const os = require('os');
+const crypto = require('crypto');
 
 let mainWindow;
 
@@ -157,6 +158,138 @@ ipcMain.handle('check-jiracli', async () => {
   };
 });
 
+// Check that jcli can log in, without starting the helper process
+ipcMain.handle('check-jira-auth', async (event, jcliPath = 'jcli') => {
+  return new Promise((resolve) => {
+    execFile(jcliPath, ['myself'], { timeout: 15000 }, (error, stdout, stderr) => {
+      resolve({
+        authenticated: !error,
+        error: error ? (stderr || error.message).trim() : null
+      });
+    });
+  });
+});
+
+// Wheels for jiracli's dependencies, kept between installs so that reinstalls
+// and updates install from disk and work offline once the cache is filled
+const wheelhouseDir = path.join(os.homedir(), '.local', 'share', 'jiracli-helpers', 'wheelhouse');
+
+// Files that decide what pip installs for jiracli; while their hash matches
+// the one stamped in the venv by the last successful install, pip is skipped
+const dependencyFiles = ['requirements.txt', 'setup.py', 'setup.cfg', 'pyproject.toml'];
+
+function hashDependencies(jiracliDir) {
+  const hash = crypto.createHash('sha256');
+  for (const name of dependencyFiles) {
+    const file = path.join(jiracliDir, name);
+    if (fs.existsSync(file)) {
+      hash.update(`${name}\0`);
+      hash.update(fs.readFileSync(file));
+    }
+  }
+  return hash.digest('hex');
+}
+
+// Run one install command, streaming its output as install progress
+function runInstallStep(command, args, cwd, prefix) {
+  return new Promise((resolve) => {
+    let output = '';
+    const child = spawn(command, args, {
+      cwd: cwd,
+      stdio: ['pipe', 'pipe', 'pipe']
+    });
+
+    const onData = (data) => {
+      const text = data.toString();
+      output += `[${prefix}] ${text}`;
+      mainWindow.webContents.send('install-progress', { step: 'install', data: text });
+    };
+    child.stdout.on('data', onData);
+    child.stderr.on('data', onData);
+
+    child.on('error', (err) => {
+      output += `[${prefix} ERROR] ${err.message}\n`;
+      resolve({ code: -1, output: output });
+    });
+    child.on('close', (code) => {
+      resolve({ code: code, output: output });
+    });
+  });
+}
+
+// Install jiracli and its dependencies into venvDir. Dependencies come from
+// the wheelhouse without touching the network; only when it lacks some are
+// the missing wheels downloaded into it. Resolves to { code, output, skipped }.
+async function installDependencies(jiracliDir, venvDir, prefix) {
+  try {
+    return await installDependenciesInVenv(jiracliDir, venvDir, prefix);
+  } catch (err) {
+    return { code: -1, output: `[${prefix} ERROR] ${err.message}\n`, skipped: false };
+  }
+}
+
+async function installDependenciesInVenv(jiracliDir, venvDir, prefix) {
+  const binPath = (name) => (process.platform === 'win32' ?
+    path.join(venvDir, 'Scripts', name) :
+    path.join(venvDir, 'bin', name));
+  const pipPath = binPath('pip');
+  const stampFile = path.join(venvDir, '.jiracli-dependencies.sha256');
+  const digest = hashDependencies(jiracliDir);
+  const progress = (text) => {
+    mainWindow.webContents.send('install-progress', { step: 'install', data: text });
+    return `[${prefix}] ${text}`;
+  };
+
+  let stamp = null;
+  try {
+    stamp = fs.readFileSync(stampFile, 'utf8').trim();
+  } catch (err) {
+    // No stamp yet: dependencies have never been installed in this venv
+  }
+  const jcliInstalled = fs.existsSync(binPath(process.platform === 'win32' ? 'jcli.exe' : 'jcli'));
+  if (stamp === digest && jcliInstalled) {
+    return {
+      code: 0,
+      output: progress('Python dependencies unchanged - skipping pip\n'),
+      skipped: true
+    };
+  }
+
+  fs.mkdirSync(wheelhouseDir, { recursive: true });
+  const pipArgs = ['--disable-pip-version-check'];
+  const installArgs = ['install', ...pipArgs, '--find-links', wheelhouseDir,
+    '-r', 'requirements.txt', '-e', '.'];
+  let output = '';
+  let result = { code: -1, output: '' };
+
+  const cached = fs.readdirSync(wheelhouseDir).some((name) => name.endsWith('.whl'));
+  if (cached) {
+    output += progress('Installing Python dependencies from the local wheel cache...\n');
+    result = await runInstallStep(pipPath, [...installArgs, '--no-index'], jiracliDir, prefix);
+    output += result.output;
+  }
+
+  if (result.code !== 0) {
+    // setuptools and wheel let the editable install build offline next time
+    output += progress('Downloading missing wheels into the local cache...\n');
+    const download = await runInstallStep(pipPath, ['wheel', ...pipArgs,
+      '--wheel-dir', wheelhouseDir, '--find-links', wheelhouseDir,
+      '-r', 'requirements.txt', 'setuptools', 'wheel'], jiracliDir, prefix);
+    output += download.output;
+    result = await runInstallStep(pipPath, installArgs, jiracliDir, prefix);
+    output += result.output;
+  }
+
+  if (result.code === 0) {
+    try {
+      fs.writeFileSync(stampFile, `${digest}\n`);
+    } catch (err) {
+      output += `[${prefix} ERROR] Could not record dependency hash: ${err.message}\n`;
+    }
+  }
+  return { code: result.code, output: output, skipped: false };
+}
+
 ipcMain.handle('install-jiracli', async (event, forceReinstall = false) => {
   const installDir = path.join(os.homedir(), '.local');
   const jiracliDir = path.join(installDir, 'jiracli');
@@ -265,29 +398,11 @@ ipcMain.handle('install-jiracli', async (event, forceReinstall = false) => {
 
         // Step 3: Install Python dependencies in virtual environment
         mainWindow.webContents.send('install-progress', { step: 'install', data: 'Installing Python dependencies in virtual environment...\n' });
-        
-        const pipPath = process.platform === 'win32' ? 
-          path.join(venvDir, 'Scripts', 'pip') : 
-          path.join(venvDir, 'bin', 'pip');
-        
-        const pythonInstall = spawn(pipPath, ['install', '-r', 'requirements.txt', '-e', '.'], {
-          cwd: jiracliDir,
-          stdio: ['pipe', 'pipe', 'pipe']
-        });
-
-      pythonInstall.stdout.on('data', (data) => {
-        const text = data.toString();
-        output += `[INSTALL] ${text}`;
-        mainWindow.webContents.send('install-progress', { step: 'install', data: text });
-      });
 
-      pythonInstall.stderr.on('data', (data) => {
-        const text = data.toString();
-        output += `[INSTALL] ${text}`;
-        mainWindow.webContents.send('install-progress', { step: 'install', data: text });
-      });
+      installDependencies(jiracliDir, venvDir, 'INSTALL').then((result) => {
+        const installCode = result.code;
+        output += result.output;
 
-      pythonInstall.on('close', (installCode) => {
         // Step 4: Create wrapper script that uses the virtual environment
         const jcliWrapperPath = path.join(binDir, 'jcli');
         const venvJcli = process.platform === 'win32' ? 
@@ -449,29 +564,11 @@ ipcMain.handle('update-jiracli', async (event, updateMethod = 'pull') => {
 
             // Step 3: Install Python dependencies in virtual environment
             mainWindow.webContents.send('install-progress', { step: 'install', data: 'Installing Python dependencies in virtual environment...\n' });
-            
-            const pipPath = process.platform === 'win32' ? 
-              path.join(venvDir, 'Scripts', 'pip') : 
-              path.join(venvDir, 'bin', 'pip');
-            
-            const pythonInstall = spawn(pipPath, ['install', '-r', 'requirements.txt', '-e', '.'], {
-              cwd: jiracliDir,
-              stdio: ['pipe', 'pipe', 'pipe']
-            });
 
-            pythonInstall.stdout.on('data', (data) => {
-              const text = data.toString();
-              output += `[PIP] ${text}`;
-              mainWindow.webContents.send('install-progress', { step: 'install', data: text });
-            });
+            installDependencies(jiracliDir, venvDir, 'PIP').then((result) => {
+              const installCode = result.code;
+              output += result.output;
 
-            pythonInstall.stderr.on('data', (data) => {
-              const text = data.toString();
-              output += `[PIP] ${text}`;
-              mainWindow.webContents.send('install-progress', { step: 'install', data: text });
-            });
-
-            pythonInstall.on('close', (installCode) => {
               // Step 4: Create wrapper script that uses the virtual environment
               const jcliWrapperPath = path.join(binDir, 'jcli');
               const venvJcli = process.platform === 'win32' ? 
@@ -595,28 +692,10 @@ exec "${venvJcli}" "$@"
           });
           
           const venvDir = path.join(jiracliDir, 'venv');
-          const pipPath = process.platform === 'win32' ? 
-            path.join(venvDir, 'Scripts', 'pip') : 
-            path.join(venvDir, 'bin', 'pip');
-          
-          const pipInstall = spawn(pipPath, ['install', '-r', 'requirements.txt', '-e', '.'], {
-            cwd: jiracliDir,
-            stdio: ['pipe', 'pipe', 'pipe']
-          });
-          
-          pipInstall.stdout.on('data', (data) => {
-            const text = data.toString();
-            output += `[PIP] ${text}`;
-            mainWindow.webContents.send('install-progress', { step: 'install', data: text });
-          });
-          
-          pipInstall.stderr.on('data', (data) => {
-            const text = data.toString();
-            output += `[PIP] ${text}`;
-            mainWindow.webContents.send('install-progress', { step: 'install', data: text });
-          });
-          
-          pipInstall.on('close', (installCode) => {
+          installDependencies(jiracliDir, venvDir, 'PIP').then((result) => {
+            const installCode = result.code;
+            output += result.output;
+
             if (installCode === 0) {
               output += '\nUpdate completed successfully!\n';
               mainWindow.webContents.send('install-progress', { 
@@ -639,58 +718,304 @@ exec "${venvJcli}" "$@"
   }
 });
 
-ipcMain.handle('run-script', async (event, scriptName, args = []) => {
-  const pythonCheck = await new Promise((resolve) => {
+// Pick python3 if available, falling back to python
+function detectPythonCommand() {
+  return new Promise((resolve) => {
     exec('python3 --version', (error) => {
       resolve(error ? 'python' : 'python3');
     });
   });
+}
+
+// Persistent helper process (create_issue_interactive.py --serve) speaking
+// line-delimited JSON-RPC, so jcli detection, auth and projects stay warm
+let helperProcess = null;
+let helperBuffer = '';
+let helperNextId = 1;
+const helperPending = new Map();
+
+// A create can take a slow jcli call plus retries; anything longer is stuck
+const HELPER_REQUEST_TIMEOUT_MS = 120000;
+
+// Answer one pending request with a JSON-RPC error
+function failHelperRequest(id, message) {
+  const pending = helperPending.get(id);
+  if (pending) {
+    helperPending.delete(id);
+    clearTimeout(pending.timer);
+    pending.resolve({ id, error: { code: -32000, message } });
+  }
+}
+
+// Fail every pending request and forget a helper that can no longer answer
+function dropHelperProcess(proc, message) {
+  for (const id of [...helperPending.keys()]) {
+    failHelperRequest(id, message);
+  }
+  helperBuffer = '';
+  if (helperProcess === proc) {
+    helperProcess = null;
+  }
+}
+
+async function getHelperProcess() {
+  if (helperProcess) {
+    return helperProcess;
+  }
+
+  const pythonCommand = await detectPythonCommand();
+  const scriptPath = getResourcePath('src/create_issue_interactive.py');
+  const proc = spawn(pythonCommand, [scriptPath, '--serve'], {
+    stdio: ['pipe', 'pipe', 'pipe']
+  });
+  helperProcess = proc;
+
+  proc.stdout.on('data', (data) => {
+    helperBuffer += data.toString();
+    let newline;
+    while ((newline = helperBuffer.indexOf('\n')) !== -1) {
+      const line = helperBuffer.slice(0, newline);
+      helperBuffer = helperBuffer.slice(newline + 1);
+      if (!line.trim()) {
+        continue;
+      }
+
+      let message;
+      try {
+        message = JSON.parse(line);
+      } catch (err) {
+        continue;
+      }
+
+      const pending = helperPending.get(message.id);
+      if (pending) {
+        helperPending.delete(message.id);
+        clearTimeout(pending.timer);
+        pending.resolve(message);
+      }
+    }
+  });
+
+  proc.stderr.on('data', (data) => {
+    if (mainWindow) {
+      mainWindow.webContents.send('helper-log', data.toString());
+    }
+  });
+
+  // Spawn failures and writes after the helper died arrive as 'error' events
+  proc.on('error', (error) => {
+    dropHelperProcess(proc, `Helper failed: ${error.message}`);
+    proc.kill();
+  });
+  proc.stdin.on('error', (error) => {
+    dropHelperProcess(proc, `Helper stopped reading requests: ${error.message}`);
+    proc.kill();
+  });
+
+  proc.on('close', (code) => {
+    dropHelperProcess(proc, `Helper exited with code ${code}`);
+  });
+
+  return proc;
+}
+
+ipcMain.handle('helper-request', async (event, method, params = {}) => {
+  const proc = await getHelperProcess();
+  const id = helperNextId++;
+
+  const message = await new Promise((resolve) => {
+    const timer = setTimeout(() => {
+      failHelperRequest(id, `Helper did not answer ${method} in time`);
+    }, HELPER_REQUEST_TIMEOUT_MS);
+    helperPending.set(id, { resolve, timer });
+    if (helperProcess !== proc) {
+      // The helper died while we were starting it
+      failHelperRequest(id, 'Helper is not running');
+      return;
+    }
+    proc.stdin.write(JSON.stringify({ jsonrpc: '2.0', id, method, params }) + '\n');
+  });
+
+  return {
+    success: !message.error,
+    result: message.result,
+    error: message.error ? message.error.message : null
+  };
+});
+
+// Running scripts by session ID. Each run-script call owns one session, so
+// input and output never cross between scripts that run at the same time.
+const scriptSessions = new Map();
+
+app.on('will-quit', () => {
+  if (helperProcess) {
+    helperProcess.kill();
+  }
+  for (const session of scriptSessions.values()) {
+    session.process.kill();
+  }
+});
+
+// One listener routes input to the session it names, however many runs happen
+ipcMain.on('script-input', (event, sessionId, input) => {
+  const session = scriptSessions.get(sessionId);
+  if (session && session.sender === event.sender) {
+    session.process.stdin.write(input + '\n');
+  }
+});
+
+ipcMain.handle('stop-script', (event, sessionId) => {
+  const session = scriptSessions.get(sessionId);
+  if (!session || session.sender !== event.sender) {
+    return false;
+  }
+  session.process.kill();
+  return true;
+});
+
+// Read the spans a script wrote with --trace, then remove the trace file
+function collectTrace(tracePath) {
+  if (!tracePath) {
+    return undefined;
+  }
+  try {
+    return fs.readFileSync(tracePath, 'utf8')
+      .split('\n')
+      .filter((line) => line.trim())
+      .map((line) => JSON.parse(line));
+  } catch (error) {
+    return [];
+  } finally {
+    fs.rmSync(tracePath, { force: true });
+  }
+}
+
+ipcMain.handle('run-script', async (event, scriptName, args = [], options = {}) => {
+  const pythonCheck = await detectPythonCommand();
 
   const scriptPath = getResourcePath(`src/${scriptName}`);
+  const sessionId = options.sessionId || crypto.randomUUID();
+  const sender = event.sender;
+
+  // The renderer picks its session ids, so reuse of a running one is refused;
+  // otherwise the two scripts would overwrite and delete each other's session.
+  // Nothing below awaits before the session is registered.
+  if (typeof sessionId !== 'string' || scriptSessions.has(sessionId)) {
+    return {
+      sessionId,
+      success: false,
+      stdout: '',
+      stderr: `Session ${sessionId} is invalid or already running\n`,
+      exitCode: null
+    };
+  }
+
+  // Scripts run with the jsonl protocol write typed events instead of text
+  const useEvents = options.protocol === 'jsonl';
+  if (useEvents) {
+    args = [...args, '--protocol', 'jsonl'];
+  }
+
+  // Optionally ask the script to record per-phase timing spans
+  let tracePath = null;
+  if (options.trace) {
+    tracePath = path.join(os.tmpdir(), `jiracli-trace-${process.pid}-${Date.now()}.jsonl`);
+    args = [...args, '--trace', tracePath];
+  }
   
   return new Promise((resolve) => {
     const pythonProcess = spawn(pythonCheck, [scriptPath, ...args], {
       stdio: ['pipe', 'pipe', 'pipe']
     });
+    scriptSessions.set(sessionId, { process: pythonProcess, sender });
 
     let stdout = '';
     let stderr = '';
 
+    // Send real-time updates to the renderer that started this session
+    const sendOutput = (type, data) => {
+      if (!sender.isDestroyed()) {
+        sender.send('script-output', { sessionId, type, data });
+      }
+    };
+
+    // Kill the script if its window goes away; the listener is removed on exit
+    const onSenderDestroyed = () => pythonProcess.kill();
+    sender.once('destroyed', onSenderDestroyed);
+
+    let finished = false;
+    const finish = (result) => {
+      if (finished) {
+        return;
+      }
+      finished = true;
+      scriptSessions.delete(sessionId);
+      if (!sender.isDestroyed()) {
+        sender.removeListener('destroyed', onSenderDestroyed);
+      }
+      resolve({ sessionId, ...result });
+    };
+
+    // Forward each complete stdout line as an event, or as text if it is not one
+    let eventBuffer = '';
+    const sendEvents = (output) => {
+      eventBuffer += output;
+      const lines = eventBuffer.split('\n');
+      eventBuffer = lines.pop();
+      for (const line of lines) {
+        if (!line.trim()) {
+          continue;
+        }
+        try {
+          const scriptEvent = JSON.parse(line);
+          if (!sender.isDestroyed()) {
+            sender.send('script-event', { sessionId, event: scriptEvent });
+          }
+        } catch (error) {
+          sendOutput('stdout', line + '\n');
+        }
+      }
+    };
+
     pythonProcess.stdout.on('data', (data) => {
       const output = data.toString();
       stdout += output;
-      // Send real-time updates to renderer
-      mainWindow.webContents.send('script-output', {
-        type: 'stdout',
-        data: output
-      });
+      if (useEvents) {
+        sendEvents(output);
+      } else {
+        sendOutput('stdout', output);
+      }
     });
 
     pythonProcess.stderr.on('data', (data) => {
       const output = data.toString();
       stderr += output;
-      mainWindow.webContents.send('script-output', {
-        type: 'stderr',
-        data: output
-      });
+      sendOutput('stderr', output);
     });
 
     pythonProcess.on('close', (code) => {
-      resolve({
+      finish({
         success: code === 0,
         stdout: stdout,
         stderr: stderr,
-        exitCode: code
+        exitCode: code,
+        trace: collectTrace(tracePath)
       });
     });
 
-    // Handle stdin for interactive scripts
-    pythonProcess.stdin.setEncoding = 'utf-8';
-    
-    // Listen for user input from renderer
-    ipcMain.on('script-input', (event, input) => {
-      pythonProcess.stdin.write(input + '\n');
+    pythonProcess.on('error', (error) => {
+      finish({
+        success: false,
+        stdout: stdout,
+        stderr: stderr + error.message,
+        exitCode: null,
+        trace: collectTrace(tracePath)
+      });
     });
+
+    // Handle stdin for interactive scripts; input racing the exit is dropped
+    pythonProcess.stdin.setDefaultEncoding('utf-8');
+    pythonProcess.stdin.on('error', () => {});
   });
 });
 
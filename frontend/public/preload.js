@@ -7,6 +7,7 @@ contextBridge.exposeInMainWorld('electronAPI', {
   checkPython: () => ipcRenderer.invoke('check-python'),
   checkGit: () => ipcRenderer.invoke('check-git'),
   checkJiracli: () => ipcRenderer.invoke('check-jiracli'),
+  checkJiraAuth: (jcliPath) => ipcRenderer.invoke('check-jira-auth', jcliPath),
   
   // jiracli installation
   installJiracli: (forceReinstall = false) => ipcRenderer.invoke('install-jiracli', forceReinstall),
@@ -15,10 +16,18 @@ contextBridge.exposeInMainWorld('electronAPI', {
   removeInstallProgressListener: (callback) => ipcRenderer.removeListener('install-progress', callback),
   
   // Script execution
-  runScript: (scriptName, args) => ipcRenderer.invoke('run-script', scriptName, args),
-  sendScriptInput: (input) => ipcRenderer.send('script-input', input),
+  runScript: (scriptName, args, options) => ipcRenderer.invoke('run-script', scriptName, args, options),
+  sendScriptInput: (sessionId, input) => ipcRenderer.send('script-input', sessionId, input),
+  stopScript: (sessionId) => ipcRenderer.invoke('stop-script', sessionId),
   onScriptOutput: (callback) => ipcRenderer.on('script-output', callback),
   removeScriptOutputListener: (callback) => ipcRenderer.removeListener('script-output', callback),
+  onScriptEvent: (callback) => ipcRenderer.on('script-event', callback),
+  removeScriptEventListener: (callback) => ipcRenderer.removeListener('script-event', callback),
+  
+  // Persistent helper (JSON-RPC over stdio)
+  helperRequest: (method, params) => ipcRenderer.invoke('helper-request', method, params),
+  onHelperLog: (callback) => ipcRenderer.on('helper-log', callback),
+  removeHelperLogListener: (callback) => ipcRenderer.removeListener('helper-log', callback),
   
   // File system
   selectDirectory: () => ipcRenderer.invoke('select-directory'),
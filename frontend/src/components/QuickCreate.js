@@ -0,0 +1,235 @@
+import React, { useState, useEffect } from 'react';
+import {
+  Box,
+  Paper,
+  Typography,
+  Grid,
+  Button,
+  TextField,
+  Alert,
+  CircularProgress,
+  Autocomplete,
+  MenuItem
+} from '@mui/material';
+import { AddTask } from '@mui/icons-material';
+
+const emptyIssue = {
+  issue_type: 'Task',
+  summary: '',
+  description: '',
+  due_date: '',
+  priority: '',
+  epic_name: ''
+};
+
+// Form-based create through the persistent helper (create_issue_interactive.py
+// --serve), so only the first issue pays for jcli detection, login and projects.
+// The issue type and priority menus come from the project's create metadata.
+function QuickCreate() {
+  const [projects, setProjects] = useState([]);
+  const [loadingProjects, setLoadingProjects] = useState(true);
+  const [project, setProject] = useState(null);
+  // Issue types and per-type priorities as the Python prompts would offer them
+  const [createMeta, setCreateMeta] = useState(null);
+  const [issue, setIssue] = useState(emptyIssue);
+  const [isCreating, setIsCreating] = useState(false);
+  const [result, setResult] = useState(null);
+
+  useEffect(() => {
+    // Starting the helper here also warms it up for the first create
+    let active = true;
+    window.electronAPI.helperRequest('list_projects').then((response) => {
+      if (!active) {
+        return;
+      }
+      if (response.success) {
+        setProjects(response.result.projects || []);
+      } else {
+        setResult({ severity: 'error', message: `Could not load projects: ${response.error}` });
+      }
+      setLoadingProjects(false);
+    });
+    return () => {
+      active = false;
+    };
+  }, []);
+
+  useEffect(() => {
+    setCreateMeta(null);
+    if (!project) {
+      return;
+    }
+    let active = true;
+    window.electronAPI.helperRequest('get_create_meta', { project }).then((response) => {
+      if (!active) {
+        return;
+      }
+      if (!response.success) {
+        setResult({ severity: 'error', message: `Could not load issue types: ${response.error}` });
+        return;
+      }
+      const { issue_types: types } = response.result;
+      const defaultType = types.includes('Task') ? 'Task' : types[0];
+      setCreateMeta(response.result);
+      setIssue(prev => ({
+        ...prev,
+        issue_type: types.includes(prev.issue_type) ? prev.issue_type : defaultType,
+        priority: ''
+      }));
+    });
+    return () => {
+      active = false;
+    };
+  }, [project]);
+
+  const issueTypes = createMeta ? createMeta.issue_types : [];
+  const priorities = createMeta ? (createMeta.priorities[issue.issue_type] || []) : [];
+
+  const setField = (name) => (event) => {
+    setIssue(prev => ({ ...prev, [name]: event.target.value }));
+  };
+
+  const setIssueType = (event) => {
+    // Priorities differ between issue types, so the choice starts over
+    setIssue(prev => ({ ...prev, issue_type: event.target.value, priority: '' }));
+  };
+
+  const handleCreate = async () => {
+    setIsCreating(true);
+    setResult(null);
+    const response = await window.electronAPI.helperRequest('create_issue', {
+      ...issue,
+      project
+    });
+    if (response.success) {
+      const { key, existing } = response.result;
+      setResult({
+        severity: 'success',
+        message: existing ? `${key} already existed` : `Created ${key}`
+      });
+      setIssue(prev => ({ ...emptyIssue, issue_type: prev.issue_type }));
+    } else {
+      setResult({ severity: 'error', message: response.error });
+    }
+    setIsCreating(false);
+  };
+
+  return (
+    <Paper elevation={1} sx={{ p: 3, mb: 4 }}>
+      <Box sx={{ display: 'flex', alignItems: 'center', mb: 2 }}>
+        <AddTask />
+        <Typography variant="h6" sx={{ ml: 1 }}>
+          Quick Create
+        </Typography>
+      </Box>
+
+      <Grid container spacing={2}>
+        <Grid item xs={12} md={8}>
+          <Autocomplete
+            size="small"
+            options={projects}
+            value={project}
+            loading={loadingProjects}
+            onChange={(event, newValue) => setProject(newValue)}
+            renderInput={(params) => <TextField {...params} label="Project" />}
+          />
+        </Grid>
+        <Grid item xs={12} md={4}>
+          <TextField
+            select
+            fullWidth
+            size="small"
+            label="Issue type"
+            value={createMeta ? issue.issue_type : ''}
+            onChange={setIssueType}
+            disabled={!createMeta}
+          >
+            {issueTypes.map((type) => (
+              <MenuItem key={type} value={type}>{type}</MenuItem>
+            ))}
+          </TextField>
+        </Grid>
+        <Grid item xs={12}>
+          <TextField
+            fullWidth
+            size="small"
+            label="Summary"
+            value={issue.summary}
+            onChange={setField('summary')}
+          />
+        </Grid>
+        {issue.issue_type === 'Epic' && (
+          <Grid item xs={12}>
+            <TextField
+              fullWidth
+              size="small"
+              label="Epic name"
+              placeholder={issue.summary}
+              value={issue.epic_name}
+              onChange={setField('epic_name')}
+            />
+          </Grid>
+        )}
+        <Grid item xs={12}>
+          <TextField
+            fullWidth
+            multiline
+            minRows={3}
+            size="small"
+            label="Description"
+            value={issue.description}
+            onChange={setField('description')}
+          />
+        </Grid>
+        <Grid item xs={12} md={6}>
+          <TextField
+            fullWidth
+            type="date"
+            size="small"
+            label="Due date"
+            InputLabelProps={{ shrink: true }}
+            value={issue.due_date}
+            onChange={setField('due_date')}
+          />
+        </Grid>
+        {priorities.length > 0 && (
+          <Grid item xs={12} md={6}>
+            <TextField
+              select
+              fullWidth
+              size="small"
+              label="Priority"
+              value={issue.priority}
+              onChange={setField('priority')}
+            >
+              {['', ...priorities].map((priority) => (
+                <MenuItem key={priority || 'default'} value={priority}>
+                  {priority || 'Project default'}
+                </MenuItem>
+              ))}
+            </TextField>
+          </Grid>
+        )}
+      </Grid>
+
+      {result && (
+        <Alert severity={result.severity} sx={{ mt: 2 }}>
+          {result.message}
+        </Alert>
+      )}
+
+      <Box sx={{ display: 'flex', justifyContent: 'flex-end', mt: 2 }}>
+        <Button
+          variant="contained"
+          onClick={handleCreate}
+          disabled={isCreating || !createMeta || !issue.summary.trim()}
+          startIcon={isCreating ? <CircularProgress size={16} /> : <AddTask />}
+        >
+          {isCreating ? 'Creating...' : 'Create Issue'}
+        </Button>
+      </Box>
+    </Paper>
+  );
+}
+
+export default QuickCreate;
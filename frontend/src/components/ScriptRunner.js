@@ -15,7 +15,9 @@ import {
   TextField,
   Alert,
   CircularProgress,
-  Chip
+  Chip,
+  Autocomplete,
+  Stack
 } from '@mui/material';
 import {
   PlayArrow,
@@ -25,6 +27,7 @@ import {
   BugReport
 } from '@mui/icons-material';
 import Convert from 'ansi-to-html';
+import QuickCreate from './QuickCreate';
 
 // Create ANSI to HTML converter with terminal-like styling
 const convert = new Convert({
@@ -58,7 +61,8 @@ const availableScripts = [
     title: 'Create JIRA Issue',
     description: 'Interactive tool for creating JIRA issues with templates and guided workflow',
     icon: <Description />,
-    category: 'Issue Management'
+    category: 'Issue Management',
+    protocol: 'jsonl'
   },
   // Future scripts can be added here
   {
@@ -71,14 +75,122 @@ const availableScripts = [
   }
 ];
 
+// Colours for progress events, matching the terminal palette
+const levelColors = {
+  header: '#f36196',
+  info: '#3B8EEA',
+  success: '#23D18B',
+  error: '#F14C4C',
+  field: '#D4D4D4',
+  answer: '#E5E510',
+  text: '#666666'
+};
+
+// Render the progress log of a script speaking the jsonl event protocol
+function EventLog({ entries }) {
+  return entries.map((entry, index) => {
+    const color = levelColors[entry.level] || levelColors.text;
+    if (entry.level === 'header') {
+      return (
+        <Typography key={index} sx={{ color, fontWeight: 'bold', fontFamily: 'monospace', mt: 2 }}>
+          {entry.message}
+        </Typography>
+      );
+    }
+    if (entry.level === 'field') {
+      return (
+        <Typography key={index} sx={{ fontFamily: 'monospace', fontSize: '14px' }}>
+          <span style={{ color: levelColors.info }}>{entry.name}:</span> {entry.value}
+        </Typography>
+      );
+    }
+    const prefix = { success: '✓ ', error: '✗ ', info: 'ℹ ', answer: '> ' }[entry.level] || '';
+    return (
+      <Typography key={index} sx={{ color, fontFamily: 'monospace', fontSize: '14px', whiteSpace: 'pre-wrap' }}>
+        {prefix}{entry.message}
+      </Typography>
+    );
+  });
+}
+
+// Native control for the prompt or options event the script is waiting on
+function PromptControl({ prompt, onAnswer }) {
+  const [value, setValue] = useState('');
+  const [choice, setChoice] = useState(
+    prompt.type === 'options' ? prompt.options[prompt.default] || null : null
+  );
+
+  if (prompt.type === 'options') {
+    const submitChoice = () => {
+      const index = prompt.options.indexOf(choice);
+      onAnswer(index >= 0 ? String(index + 1) : '', choice);
+    };
+    return (
+      <Stack direction="row" spacing={1} alignItems="center">
+        <Autocomplete
+          fullWidth
+          size="small"
+          options={prompt.options}
+          value={choice}
+          onChange={(event, newValue) => setChoice(newValue)}
+          renderInput={(params) => <TextField {...params} label={prompt.message} autoFocus />}
+        />
+        <Button variant="contained" onClick={submitChoice} disabled={!choice}>
+          Select
+        </Button>
+      </Stack>
+    );
+  }
+
+  if (prompt.kind === 'date') {
+    return (
+      <Stack direction="row" spacing={1} alignItems="center">
+        <TextField
+          type="date"
+          size="small"
+          label="Due date"
+          InputLabelProps={{ shrink: true }}
+          value={value}
+          onChange={(e) => setValue(e.target.value)}
+        />
+        <Button variant="contained" onClick={() => onAnswer(value, value)} disabled={!value}>
+          Set
+        </Button>
+        <Button onClick={() => onAnswer(prompt.today, prompt.today)}>Today</Button>
+        <Button onClick={() => onAnswer('', '(none)')}>No due date</Button>
+      </Stack>
+    );
+  }
+
+  return (
+    <TextField
+      fullWidth
+      size="small"
+      autoFocus
+      label={prompt.message}
+      placeholder={prompt.default || ''}
+      value={value}
+      onChange={(e) => setValue(e.target.value)}
+      onKeyPress={(event) => {
+        if (event.key === 'Enter') {
+          onAnswer(value, value || prompt.default);
+        }
+      }}
+    />
+  );
+}
+
 function ScriptRunner({ systemStatus }) {
   const [selectedScript, setSelectedScript] = useState(null);
   const [isRunning, setIsRunning] = useState(false);
   const [output, setOutput] = useState('');
   const [userInput, setUserInput] = useState('');
   const [showTerminal, setShowTerminal] = useState(false);
+  const [logEntries, setLogEntries] = useState([]);
+  const [pendingPrompt, setPendingPrompt] = useState(null);
+  const [authStatus, setAuthStatus] = useState(null);
   const outputRef = useRef(null);
-  const scriptProcessRef = useRef(null);
+  const sessionIdRef = useRef(null);
 
   // Convert ANSI codes to HTML
   const convertAnsiToHtml = (text) => {
@@ -90,12 +202,70 @@ function ScriptRunner({ systemStatus }) {
     if (outputRef.current) {
       outputRef.current.scrollTop = outputRef.current.scrollHeight;
     }
-  }, [output]);
+  }, [output, logEntries]);
+
+  const jcliPath = systemStatus.jiracli?.path;
+  const jiraConfigured = systemStatus.jiraConfig?.exists || false;
+
+  useEffect(() => {
+    // Quick Create starts the helper, so it is only offered once jcli is
+    // installed, configured and able to log in
+    setAuthStatus(null);
+    if (!jcliPath || !jiraConfigured) {
+      return;
+    }
+    let active = true;
+    window.electronAPI.checkJiraAuth(jcliPath).then((status) => {
+      if (active) {
+        setAuthStatus(status);
+      }
+    });
+    return () => {
+      active = false;
+    };
+  }, [jcliPath, jiraConfigured]);
+
+  useEffect(() => {
+    // Typed events from scripts run with the jsonl protocol
+    const handleScriptEvent = (event, { sessionId, event: scriptEvent }) => {
+      if (sessionId !== sessionIdRef.current) {
+        return;
+      }
+      if (scriptEvent.type === 'progress') {
+        setLogEntries(prev => [...prev, scriptEvent]);
+      } else if (scriptEvent.type === 'prompt' || scriptEvent.type === 'options') {
+        setPendingPrompt(scriptEvent);
+      } else if (scriptEvent.type === 'result') {
+        setPendingPrompt(null);
+        let message = 'Done';
+        if (!scriptEvent.success) {
+          message = `Failed: ${scriptEvent.error || 'see the log above'}`;
+        } else if (scriptEvent.key) {
+          message = `Created ${scriptEvent.key}`;
+        } else if (scriptEvent.spooled) {
+          message = 'Saved to the spool for later creation';
+        } else if (scriptEvent.cancelled) {
+          message = 'Cancelled';
+        }
+        setLogEntries(prev => [...prev, { level: scriptEvent.success ? 'success' : 'error', message }]);
+      }
+    };
+
+    window.electronAPI.onScriptEvent(handleScriptEvent);
+
+    return () => {
+      window.electronAPI.removeScriptEventListener(handleScriptEvent);
+    };
+  }, []);
 
   useEffect(() => {
     // Set up real-time output listener
     const handleScriptOutput = (event, data) => {
-      setOutput(prev => prev + data.data);
+      // Ignore output from any other script session
+      if (data.sessionId === sessionIdRef.current) {
+        setOutput(prev => prev + data.data);
+        setLogEntries(prev => [...prev, { level: 'text', message: data.data.trimEnd() }]);
+      }
     };
 
     window.electronAPI.onScriptOutput(handleScriptOutput);
@@ -113,9 +283,20 @@ function ScriptRunner({ systemStatus }) {
     setIsRunning(true);
     setShowTerminal(true);
     setOutput(`Starting ${script.title}...\n\n`);
+    setLogEntries([]);
+    setPendingPrompt(null);
+
+    const sessionId = window.crypto.randomUUID();
+    sessionIdRef.current = sessionId;
 
     try {
-      const result = await window.electronAPI.runScript(script.name);
+      const result = await window.electronAPI.runScript(script.name, [], {
+        sessionId,
+        protocol: script.protocol
+      });
+      if (sessionIdRef.current !== sessionId) {
+        return;
+      }
       
       setOutput(prev => prev + `\n\nScript completed with exit code: ${result.exitCode}\n`);
       
@@ -125,18 +306,27 @@ function ScriptRunner({ systemStatus }) {
     } catch (error) {
       setOutput(prev => prev + `\nError running script: ${error.message}\n`);
     } finally {
-      setIsRunning(false);
+      if (sessionIdRef.current === sessionId) {
+        sessionIdRef.current = null;
+        setIsRunning(false);
+      }
     }
   };
 
   const handleSendInput = () => {
     if (userInput.trim() && isRunning) {
       setOutput(prev => prev + `> ${userInput}\n`);
-      window.electronAPI.sendScriptInput(userInput);
+      window.electronAPI.sendScriptInput(sessionIdRef.current, userInput);
       setUserInput('');
     }
   };
 
+  const handleAnswer = (answer, shown) => {
+    setLogEntries(prev => [...prev, { level: 'answer', message: shown || '(default)' }]);
+    setPendingPrompt(null);
+    window.electronAPI.sendScriptInput(sessionIdRef.current, answer);
+  };
+
   const handleKeyPress = (event) => {
     if (event.key === 'Enter') {
       handleSendInput();
@@ -144,9 +334,16 @@ function ScriptRunner({ systemStatus }) {
   };
 
   const handleCloseTerminal = () => {
+    // Closing the terminal ends its script instead of leaving it waiting for input
+    if (sessionIdRef.current) {
+      window.electronAPI.stopScript(sessionIdRef.current);
+      sessionIdRef.current = null;
+    }
     setShowTerminal(false);
     setSelectedScript(null);
     setOutput('');
+    setLogEntries([]);
+    setPendingPrompt(null);
     setIsRunning(false); // Reset running state when closing terminal
   };
 
@@ -170,6 +367,13 @@ function ScriptRunner({ systemStatus }) {
 
   return (
     <Box>
+      {authStatus?.authenticated && <QuickCreate />}
+      {authStatus && !authStatus.authenticated && (
+        <Alert severity="info" sx={{ mb: 4 }}>
+          Quick Create is available once jcli can log in to JIRA: {authStatus.error}
+        </Alert>
+      )}
+
       <Typography variant="h5" gutterBottom>
         Available Scripts
       </Typography>
@@ -244,58 +448,96 @@ function ScriptRunner({ systemStatus }) {
         </DialogTitle>
         
         <DialogContent sx={{ display: 'flex', flexDirection: 'column', p: 0 }}>
-          <Box
-            ref={outputRef}
-            className="terminal-output"
-            sx={{ 
-              flexGrow: 1, 
-              margin: 2,
-              fontFamily: 'monospace',
-              fontSize: '14px',
-              lineHeight: 1.4,
-              backgroundColor: '#1E1E1E',
-              color: '#D4D4D4',
-              padding: 2,
-              borderRadius: 1,
-              overflow: 'auto',
-              whiteSpace: 'pre-wrap'
-            }}
-            dangerouslySetInnerHTML={{
-              __html: output ? convertAnsiToHtml(output) : '<span style="color: #666666;">Waiting for output...</span>'
-            }}
-          />
+          {selectedScript?.protocol === 'jsonl' ? (
+            <>
+              <Box
+                ref={outputRef}
+                sx={{
+                  flexGrow: 1,
+                  margin: 2,
+                  lineHeight: 1.4,
+                  backgroundColor: '#1E1E1E',
+                  color: '#D4D4D4',
+                  padding: 2,
+                  borderRadius: 1,
+                  overflow: 'auto'
+                }}
+              >
+                {logEntries.length ? (
+                  <EventLog entries={logEntries} />
+                ) : (
+                  <Typography sx={{ color: '#666666', fontFamily: 'monospace' }}>
+                    Waiting for output...
+                  </Typography>
+                )}
+              </Box>
+
+              {isRunning && pendingPrompt && (
+                <Box sx={{ p: 2, borderTop: 1, borderColor: 'divider' }}>
+                  <PromptControl
+                    key={logEntries.length}
+                    prompt={pendingPrompt}
+                    onAnswer={handleAnswer}
+                  />
+                </Box>
+              )}
+            </>
+          ) : (
+            <>
+            <Box
+              ref={outputRef}
+              className="terminal-output"
+              sx={{ 
+                flexGrow: 1, 
+                margin: 2,
+                fontFamily: 'monospace',
+                fontSize: '14px',
+                lineHeight: 1.4,
+                backgroundColor: '#1E1E1E',
+                color: '#D4D4D4',
+                padding: 2,
+                borderRadius: 1,
+                overflow: 'auto',
+                whiteSpace: 'pre-wrap'
+              }}
+              dangerouslySetInnerHTML={{
+                __html: output ? convertAnsiToHtml(output) : '<span style="color: #666666;">Waiting for output...</span>'
+              }}
+            />
           
-          {isRunning && (
-            <Box sx={{ p: 2, borderTop: 1, borderColor: 'divider' }}>
-              <TextField
-                fullWidth
-                size="small"
-                placeholder="Type input and press Enter..."
-                value={userInput}
-                onChange={(e) => setUserInput(e.target.value)}
-                onKeyPress={handleKeyPress}
-                InputProps={{
-                  className: 'terminal-input',
-                  sx: { 
-                    fontFamily: 'monospace',
-                    backgroundColor: '#2d2d2d',
-                    '& input': { 
-                      color: '#D4D4D4',
-                      padding: '8px 12px'
-                    },
-                    '& fieldset': {
-                      borderColor: '#555555'
-                    },
-                    '&:hover fieldset': {
-                      borderColor: '#777777'
-                    },
-                    '&.Mui-focused fieldset': {
-                      borderColor: '#f36196'
+            {isRunning && (
+              <Box sx={{ p: 2, borderTop: 1, borderColor: 'divider' }}>
+                <TextField
+                  fullWidth
+                  size="small"
+                  placeholder="Type input and press Enter..."
+                  value={userInput}
+                  onChange={(e) => setUserInput(e.target.value)}
+                  onKeyPress={handleKeyPress}
+                  InputProps={{
+                    className: 'terminal-input',
+                    sx: { 
+                      fontFamily: 'monospace',
+                      backgroundColor: '#2d2d2d',
+                      '& input': { 
+                        color: '#D4D4D4',
+                        padding: '8px 12px'
+                      },
+                      '& fieldset': {
+                        borderColor: '#555555'
+                      },
+                      '&:hover fieldset': {
+                        borderColor: '#777777'
+                      },
+                      '&.Mui-focused fieldset': {
+                        borderColor: '#f36196'
+                      }
                     }
-                  }
-                }}
-              />
-            </Box>
+                  }}
+                />
+              </Box>
+            )}
+            </>
           )}
         </DialogContent>
         
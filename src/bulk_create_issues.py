@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Bulk JIRA Issue Creation Script
+===============================
+
+Creates many JIRA issues non-interactively from a CSV or JSONL file.
+Each row carries the same fields create_issue_interactive.py prompts for,
+and is turned into the same jcli issues create command. Rows are created
+by a bounded pool of workers with a request rate limit and retries.
+"""
+
+import argparse
+import concurrent.futures
+import csv
+import json
+import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from create_issue_interactive import (
+    JCLI_GUARD,
+    build_create_command,
+    check_due_date,
+    extract_issue_key,
+    get_jcli_latency_file,
+    load_jcli_path,
+    print_error,
+    print_info,
+    print_success,
+    run_command,
+)
+
+# Row fields, in the order create_issue_interactive.py collects them
+ISSUE_FIELDS = [
+    "project",
+    "issue_type",
+    "summary",
+    "description",
+    "due_date",
+    "priority",
+    "epic_name",
+]
+
+# Alternative column names accepted in input files
+FIELD_ALIASES = {
+    "type": "issue_type",
+    "issuetype": "issue_type",
+    "due": "due_date",
+    "duedate": "due_date",
+    "epic": "epic_name",
+}
+
+DEFAULT_WORKERS = 4
+DEFAULT_RATE = 5.0
+DEFAULT_RETRIES = 3
+
+
+def normalize_field_name(name: str) -> str:
+    """Map a column name such as 'Issue Type' or 'duedate' to its row field"""
+    field = name.strip().lower().replace(" ", "_").replace("-", "_")
+    return FIELD_ALIASES.get(field.replace("_", ""), field)
+
+
+def normalize_row(raw: Dict[str, Any]) -> Dict[str, str]:
+    """Normalize column names and values of an input row"""
+    row = {}
+    for name, value in raw.items():
+        if name is None:
+            continue
+        field = normalize_field_name(name)
+        if field in ISSUE_FIELDS:
+            row[field] = "" if value is None else str(value).strip()
+    return row
+
+
+def read_rows(path: str) -> Iterator[Dict[str, str]]:
+    """Read issue rows from a CSV or JSONL file, chosen by extension"""
+    with open(path, "r", newline="") as f:
+        if path.lower().endswith((".jsonl", ".ndjson", ".json")):
+            for line in f:
+                if line.strip():
+                    yield normalize_row(json.loads(line))
+        else:
+            for raw in csv.DictReader(f):
+                yield normalize_row(raw)
+
+
+def validate_row(row: Dict[str, str]) -> Optional[str]:
+    """Fill in defaults for a row, returning an error message if it is unusable"""
+    if not row.get("project"):
+        return "project is required"
+    if not row.get("summary"):
+        return "summary is required"
+    try:
+        check_due_date(row.get("due_date", ""))
+    except ValueError as e:
+        return str(e)
+    row.setdefault("issue_type", "")
+    if not row["issue_type"]:
+        row["issue_type"] = "Task"
+    # Epics require an Epic Name, which defaults to the summary like main() does
+    if row["issue_type"] == "Epic" and not row.get("epic_name"):
+        row["epic_name"] = row["summary"]
+    return None
+
+
+def is_transient_error(error: str) -> bool:
+    """Check whether a jcli error is worth retrying: a 5xx, 429 or lost connection
+
+    Anything else, such as an unknown project or issue type (400), fails the
+    same way on every attempt.
+    """
+    return bool(re.search(
+        r"(?<![\w-])(5\d\d|429)\b|too many requests|service unavailable|bad gateway"
+        r"|connection ?(error|refused|reset|aborted)|name resolution",
+        error,
+        re.I,
+    ))
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing calls at most `rate` per second"""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_time = time.monotonic()
+
+    def wait(self) -> None:
+        """Block until the caller may issue its next request"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def create_row(
+    jcli_cmd: str,
+    row: Dict[str, str],
+    limiter: RateLimiter,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = 1.0,
+) -> Dict[str, Any]:
+    """Create one issue, retrying transient failures with exponential backoff
+
+    Only errors is_transient_error() accepts are retried. A timed-out create
+    is not: JIRA may have created the issue anyway, and another attempt
+    would create it twice.
+    """
+    cmd = build_create_command(
+        jcli_cmd,
+        row["project"],
+        row["issue_type"],
+        row["summary"],
+        row.get("description", ""),
+        row.get("due_date", ""),
+        row.get("priority", ""),
+        row.get("epic_name") or None,
+    )
+
+    error = ""
+    for attempt in range(retries + 1):
+        if attempt:
+            # Exponential backoff with jitter so workers do not retry in lockstep
+            time.sleep(backoff * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5))
+        limiter.wait()
+        try:
+            result = run_command(cmd)
+        except subprocess.TimeoutExpired as e:
+            return {
+                "error": f"{e}; not retried, check JIRA before creating it again",
+                "attempts": attempt + 1,
+            }
+        except Exception as e:
+            # jcli could not be run at all, which retrying will not change
+            return {"error": str(e), "attempts": attempt + 1}
+        if result.returncode == 0:
+            return {
+                "key": extract_issue_key(result.stdout),
+                "output": result.stdout.strip(),
+                "attempts": attempt + 1,
+            }
+        error = (result.stderr or result.stdout).strip()
+        error = error or f"exit code {result.returncode}"
+        if not is_transient_error(error):
+            return {"error": error, "attempts": attempt + 1}
+
+    return {"error": error, "attempts": retries + 1}
+
+
+def bulk_create(
+    jcli_cmd: str,
+    rows: List[Dict[str, str]],
+    workers: int = DEFAULT_WORKERS,
+    rate: float = DEFAULT_RATE,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = 1.0,
+) -> List[Dict[str, Any]]:
+    """Create all rows concurrently, returning one result per row in input order"""
+    limiter = RateLimiter(rate)
+    results: List[Dict[str, Any]] = [{} for _ in rows]
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, workers))
+    with executor:
+        futures = {}
+        for index, row in enumerate(rows):
+            error = validate_row(row)
+            if error:
+                results[index] = {
+                    "row": index + 1,
+                    "summary": row.get("summary", ""),
+                    "error": error,
+                    "attempts": 0,
+                }
+                continue
+            future = executor.submit(
+                create_row, jcli_cmd, row, limiter, retries, backoff
+            )
+            futures[future] = index
+
+        for future in concurrent.futures.as_completed(futures):
+            index = futures[future]
+            result = {"row": index + 1, "summary": rows[index]["summary"]}
+            result.update(future.result())
+            results[index] = result
+            if "error" in result:
+                print_error(f"Row {index + 1}: {result['error']}")
+            else:
+                created = result["key"] or result["output"]
+                print_success(f"Row {index + 1}: created {created}")
+
+    return results
+
+
+def write_results(path: str, results: List[Dict[str, Any]]) -> None:
+    """Write one JSON result per line, in input row order"""
+    with open(path, "w") as f:
+        for result in results:
+            f.write(json.dumps(result) + "\n")
+
+
+def resolve_jcli(jcli_path: Optional[str]) -> Optional[str]:
+    """Use the given jcli, else the saved interactive-tool path, else PATH"""
+    if jcli_path:
+        return os.path.expanduser(jcli_path)
+    return load_jcli_path() or shutil.which("jcli")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        prog="bulk_create_issues.py",
+        description="Create JIRA issues in bulk from a CSV or JSONL file",
+    )
+    parser.add_argument("input", help="CSV or JSONL file with one issue per row")
+    parser.add_argument(
+        "--output",
+        help="Results file (default: <input>.results.jsonl)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=DEFAULT_WORKERS,
+        help=f"Concurrent jcli processes (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--rate", type=float, default=DEFAULT_RATE,
+        help=f"Maximum creates per second, 0 for no limit (default: {DEFAULT_RATE})",
+    )
+    parser.add_argument(
+        "--retries", type=int, default=DEFAULT_RETRIES,
+        help=f"Retries per row after a failure (default: {DEFAULT_RETRIES})",
+    )
+    parser.add_argument("--jcli", help="Path to the jcli command")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Bulk creation entry point"""
+    args = parse_args(argv)
+
+    jcli_cmd = resolve_jcli(args.jcli)
+    if not jcli_cmd:
+        print_error("Could not find jcli; pass --jcli or run the interactive tool once")
+        return 1
+
+    try:
+        rows = list(read_rows(args.input))
+    except (OSError, ValueError, csv.Error) as e:
+        print_error(f"Failed to read {args.input}: {e}")
+        return 1
+
+    print_info(f"Creating {len(rows)} issues with {args.workers} workers")
+    started = time.monotonic()
+    # Timeouts adapt to jcli latencies seen here and by earlier runs
+    JCLI_GUARD.load(get_jcli_latency_file())
+    try:
+        results = bulk_create(jcli_cmd, rows, args.workers, args.rate, args.retries)
+    finally:
+        JCLI_GUARD.save()
+
+    output = args.output or f"{os.path.splitext(args.input)[0]}.results.jsonl"
+    write_results(output, results)
+
+    failed = sum(1 for result in results if "error" in result)
+    print_info(
+        f"Created {len(results) - failed} of {len(results)} issues "
+        f"in {time.monotonic() - started:.1f}s; results written to {output}"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
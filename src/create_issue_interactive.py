@@ -7,14 +7,103 @@ A user-friendly front-end for creating JIRA issues using jiracli.
 Guides users through the process with interactive prompts and visual aids.
 """
 
+from __future__ import annotations
+
 import sys
-import subprocess
-import calendar
-import datetime
-import json
 import os
-import shutil
-from typing import List, Optional
+import time
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, TextIO, Tuple
+)
+
+# Everything else is imported where it is used, so that cheap paths such as
+# --help and --clear-path do not pay for modules they never touch
+if TYPE_CHECKING:
+    import argparse
+    import concurrent.futures
+    import datetime
+    import subprocess
+
+# How long a cached project list is served before it is refreshed (seconds)
+PROJECT_CACHE_TTL = 24 * 60 * 60
+
+# Project discovery reads issues in pages of PROJECT_PAGE_SIZE and stops after
+# PROJECT_STALE_PAGES pages in a row turn up no new project
+PROJECT_PAGE_SIZE = 50
+PROJECT_STALE_PAGES = 3
+PROJECT_MAX_PAGES = 40
+
+# Lists longer than SELECT_SEARCH_THRESHOLD are searched instead of printed in
+# full, showing SELECT_PAGE_SIZE matches at a time
+SELECT_SEARCH_THRESHOLD = 20
+SELECT_PAGE_SIZE = 10
+
+# How long cached per-project create metadata is used before it is refetched
+CREATE_META_TTL = 24 * 60 * 60
+
+# How long a successful auth check stands in for `jcli myself`, as long as the
+# JIRA server, user and ~/.jira.yml are unchanged
+AUTH_CACHE_TTL = 60 * 60
+
+# The issue mirror is seeded with MIRROR_SEED_PAGES pages of a project's most
+# recently updated issues, then fetches only issues updated since its last
+# sync, stopping after MIRROR_SYNC_MAX_PAGES pages. Pages are counted as
+# MIRROR_PAGE_SIZE issues, however few the server returns per request.
+# ALL_PROJECTS names the sync that is not limited to one project.
+MIRROR_PAGE_SIZE = 100
+MIRROR_SEED_PAGES = 2
+MIRROR_SYNC_MAX_PAGES = 20
+ALL_PROJECTS = "*"
+
+# Duplicate detection compares against up to SUMMARY_INDEX_SIZE mirrored
+# summaries per project, syncing them in the background once the last sync
+# is older than SUMMARY_INDEX_TTL
+SUMMARY_INDEX_SIZE = 2000
+SUMMARY_INDEX_TTL = 15 * 60
+DUPLICATE_LIMIT = 3
+DUPLICATE_THRESHOLD = 0.75
+
+# Label prefix carrying the idempotency key of a created issue, and the
+# defaults for replaying spooled creations
+IDEMPOTENCY_LABEL_PREFIX = "jiracli-helpers-"
+SPOOL_WORKERS = 4
+SPOOL_RETRIES = 3
+SPOOL_BACKOFF = 1.0
+
+# An issue tree's children are created TREE_WORKERS at a time and linked to
+# their Epic through EPIC_LINK_FIELD unless the tree names another field
+TREE_WORKERS = 4
+EPIC_LINK_FIELD = "Epic Link"
+
+# Concurrent jcli probes and the overall time allowed for detection (seconds)
+JCLI_PROBE_WORKERS = 4
+JCLI_PROBE_DEADLINE = 8.0
+
+# jcli timeouts follow the p99 latency of the last JCLI_LATENCY_WINDOW calls of
+# each request shape (subcommand and page size), times JCLI_TIMEOUT_FACTOR and
+# clamped between the floor and ceiling. Until JCLI_MIN_SAMPLES calls have been
+# seen the subcommand's default applies. JCLI_FIXED_TIMEOUT_COMMANDS are not
+# idempotent and always keep their default: a create killed while JIRA is still
+# processing it may have created the issue anyway.
+JCLI_DEFAULT_TIMEOUTS = {
+    "--version": 5.0,
+    "myself": 10.0,
+    "issues list": 15.0,
+    "issues create": 60.0,
+}
+JCLI_FALLBACK_TIMEOUT = 30.0
+JCLI_LATENCY_WINDOW = 100
+JCLI_MIN_SAMPLES = 10
+JCLI_TIMEOUT_FACTOR = 3.0
+JCLI_TIMEOUT_FLOOR = 2.0
+JCLI_TIMEOUT_CEILING = 120.0
+JCLI_FIXED_TIMEOUT_COMMANDS = {"issues create"}
+
+# After JCLI_BREAKER_THRESHOLD JIRA timeouts in a row, jcli calls fail fast for
+# JCLI_BREAKER_COOLDOWN seconds. Local subcommands never trip the breaker.
+JCLI_BREAKER_THRESHOLD = 3
+JCLI_BREAKER_COOLDOWN = 30.0
+JCLI_LOCAL_COMMANDS = {"--version"}
 
 
 class Colors:
@@ -30,8 +119,46 @@ class Colors:
     UNDERLINE = "\033[4m"
 
 
+class EventStream:
+    """Typed JSON-line events written for --protocol jsonl
+
+    Each line is an object with a "type" of "progress" (header, info, error,
+    success or field messages), "prompt" (free text or a date), "options"
+    (a choice from a list) or "result" (the outcome of the run). Answers to
+    prompts and options are read from stdin as plain lines, as in text mode.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.output: Optional[TextIO] = None
+        self.result_sent = False
+
+    def enable(self, output: TextIO) -> None:
+        """Start writing events to output"""
+        self.output = output
+        self.enabled = True
+
+    def emit(self, event_type: str, **fields: Any) -> None:
+        """Write one event, if events are enabled"""
+        if not self.enabled or self.output is None:
+            return
+        import json
+
+        if event_type == "result":
+            self.result_sent = True
+        self.output.write(json.dumps({"type": event_type, **fields}) + "\n")
+        self.output.flush()
+
+
+# Interactive output is only turned into events by --protocol jsonl
+EVENTS = EventStream()
+
+
 def print_header(text: str):
     """Print a formatted header"""
+    if EVENTS.enabled:
+        EVENTS.emit("progress", level="header", message=text)
+        return
     print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}")
     print(f"{Colors.HEADER}{Colors.BOLD}{text:^60}{Colors.ENDC}")
     print(f"{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}\n")
@@ -39,23 +166,171 @@ def print_header(text: str):
 
 def print_success(text: str):
     """Print success message"""
+    if EVENTS.enabled:
+        EVENTS.emit("progress", level="success", message=text)
+        return
     print(f"{Colors.OKGREEN}✓ {text}{Colors.ENDC}")
 
 
 def print_error(text: str):
     """Print error message"""
+    if EVENTS.enabled:
+        EVENTS.emit("progress", level="error", message=text)
+        return
     print(f"{Colors.FAIL}✗ {text}{Colors.ENDC}")
 
 
 def print_info(text: str):
     """Print info message"""
+    if EVENTS.enabled:
+        EVENTS.emit("progress", level="info", message=text)
+        return
     print(f"{Colors.OKBLUE}ℹ {text}{Colors.ENDC}")
 
 
+def print_field(name: str, value: str) -> None:
+    """Print a labelled value, such as a field in the confirmation summary"""
+    if EVENTS.enabled:
+        EVENTS.emit("progress", level="field", name=name, value=value)
+        return
+    print(f"{Colors.OKBLUE}{name}:{Colors.ENDC} {value}")
+
+
+class Span:
+    """A timed operation; recorded by its Tracer when the with-block exits"""
+
+    def __init__(
+        self, tracer: "Tracer", name: str, kind: str, attributes: Dict[str, Any]
+    ):
+        self.tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.attributes = attributes
+        self.start = 0.0
+        self._started = 0.0
+
+    def set(self, **attributes: Any) -> None:
+        """Attach extra attributes to the span"""
+        self.attributes.update(attributes)
+
+    def set_result(self, result: Any) -> None:
+        """Record the exit code and output size of a finished process"""
+        self.set(
+            exit_code=result.returncode,
+            stdout_bytes=len((result.stdout or "").encode()),
+            stderr_bytes=len((result.stderr or "").encode()),
+        )
+
+    def __enter__(self) -> "Span":
+        self.start = time.time()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        duration = time.perf_counter() - self._started
+        if exc_type is not None:
+            self.attributes["error"] = f"{exc_type.__name__}: {exc}"
+        self.tracer.record({
+            "name": self.name,
+            "kind": self.kind,
+            "start": self.start,
+            "duration_ms": round(duration * 1000, 3),
+            **self.attributes,
+        })
+
+
+class Tracer:
+    """Collects spans for --trace and appends them to a JSONL file"""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.path: Optional[str] = None
+        self.spans: List[Dict[str, Any]] = []
+        self._lock: Any = None
+
+    def enable(self, path: str) -> None:
+        """Start recording spans to path"""
+        import threading
+
+        self._lock = threading.Lock()
+        self.path = path
+        self.enabled = True
+
+    def span(self, name: str, kind: str = "phase", **attributes: Any) -> Span:
+        """Create a span to use as a context manager"""
+        return Span(self, name, kind, attributes)
+
+    def command_span(self, cmd: List[str]) -> Span:
+        """Create a span for running cmd, named after the program and subcommand"""
+        name = f"{os.path.basename(cmd[0])} {jcli_subcommand(cmd)}".strip()
+        return self.span(name, kind="subprocess", cmd=cmd)
+
+    def record(self, span: Dict[str, Any]) -> None:
+        """Store a finished span and append it to the trace file"""
+        if not self.enabled:
+            return
+        import json
+        import threading
+
+        span["thread"] = threading.current_thread().name
+        with self._lock:
+            self.spans.append(span)
+            if self.path:
+                with open(self.path, "a") as f:
+                    f.write(json.dumps(span) + "\n")
+
+    def format_summary(self) -> str:
+        """Format a table of span counts and durations, slowest first"""
+        totals: Dict[str, List[float]] = {}
+        for span in self.spans:
+            totals.setdefault(span["name"], []).append(span["duration_ms"])
+
+        lines = [f"{'Span':<40} {'Count':>5} {'Total ms':>10} {'Max ms':>10}"]
+        lines.append("-" * len(lines[0]))
+        for name, durations in sorted(totals.items(), key=lambda item: -sum(item[1])):
+            lines.append(
+                f"{name[:40]:<40} {len(durations):>5} "
+                f"{sum(durations):>10.1f} {max(durations):>10.1f}"
+            )
+        return "\n".join(lines)
+
+
+# Spans are only recorded once --trace enables the tracer
+TRACER = Tracer()
+
+
+def jcli_subcommand(cmd: List[str]) -> str:
+    """Name the subcommand of a command line, e.g. 'issues create' or '--version'"""
+    words: List[str] = []
+    for arg in cmd[1:3]:
+        if arg.startswith("-") and words:
+            break
+        words.append(arg)
+    return " ".join(words)
+
+
+def jcli_request_shape(cmd: List[str]) -> str:
+    """Name a command's subcommand and page size, e.g. 'issues list --max-issues 1'
+
+    Latencies are kept per shape, so one-issue label lookups do not share
+    a p99 with 100-issue pages.
+    """
+    subcommand = jcli_subcommand(cmd)
+    if "--max-issues" in cmd[:-1]:
+        return f"{subcommand} --max-issues {cmd[cmd.index('--max-issues') + 1]}"
+    return subcommand
+
+
+_created_config_dirs: Set[str] = set()
+
+
 def get_config_dir() -> str:
     """Get the configuration directory for storing jcli path"""
     config_dir = os.path.expanduser("~/.local/share/jiracli-helpers")
-    os.makedirs(config_dir, exist_ok=True)
+    # Only touch the filesystem the first time each directory is requested
+    if config_dir not in _created_config_dirs:
+        os.makedirs(config_dir, exist_ok=True)
+        _created_config_dirs.add(config_dir)
     return config_dir
 
 
@@ -69,6 +344,8 @@ def save_jcli_path(jcli_path: str) -> None:
     try:
         with open(get_jcli_path_file(), "w") as f:
             f.write(jcli_path)
+        # Callers only save paths that just passed check_jcli_command
+        save_jcli_validation(jcli_path)
         print_success(f"Saved jcli path to {get_jcli_path_file()}")
     except Exception as e:
         print_error(f"Failed to save jcli path: {e}")
@@ -96,14 +373,392 @@ def load_jcli_path() -> Optional[str]:
 def check_jcli_command(jcli_path: str) -> bool:
     """Check if a jcli command is working"""
     try:
-        result = subprocess.run([jcli_path, "--version"], capture_output=True, text=True, timeout=5)
+        result = run_command([jcli_path, "--version"])
         return result.returncode == 0
     except:
         return False
 
 
+def resolve_jcli_candidate(location: str) -> Optional[str]:
+    """Check that a candidate is an executable file, looking up bare names on PATH"""
+    import shutil
+
+    if os.sep not in location:
+        return shutil.which(location)
+    if os.path.isfile(location) and os.access(location, os.X_OK):
+        return location
+    return None
+
+
+def probe_jcli_locations(
+    locations: List[str],
+    max_workers: int = JCLI_PROBE_WORKERS,
+    deadline: float = JCLI_PROBE_DEADLINE,
+) -> List[str]:
+    """Run check_jcli_command on all candidates concurrently, keeping their order"""
+    import threading
+
+    # Skip anything that cannot possibly run before spawning processes
+    candidates = []
+    seen = set()
+    for location in locations:
+        resolved = resolve_jcli_candidate(location)
+        if resolved is None:
+            continue
+        real_path = os.path.realpath(resolved)
+        if real_path in seen:
+            continue
+        seen.add(real_path)
+        candidates.append(location)
+
+    if not candidates:
+        return []
+
+    # Daemon threads, so probes abandoned at the deadline never hold up exit
+    lock = threading.Lock()
+    finished = threading.Condition(lock)
+    pending = list(candidates)
+    results: Dict[str, bool] = {}
+
+    def probe() -> None:
+        while True:
+            with lock:
+                if not pending:
+                    return
+                location = pending.pop(0)
+            working = check_jcli_command(location)
+            with lock:
+                results[location] = working
+                finished.notify_all()
+
+    for _ in range(min(max_workers, len(candidates))):
+        threading.Thread(target=probe, daemon=True).start()
+
+    with lock:
+        finished.wait_for(lambda: len(results) == len(candidates), timeout=deadline)
+        # Probes not started by the deadline are abandoned with the running ones
+        pending.clear()
+        return [location for location in candidates if results.get(location)]
+
+
+class OperationCancelled(Exception):
+    """Raised when work is abandoned through a CancellationToken"""
+
+
+class CancellationToken:
+    """Lets one thread kill the subprocesses another thread started with run_command"""
+
+    def __init__(self) -> None:
+        import threading
+
+        self._lock = threading.Lock()
+        self._processes: List[subprocess.Popen] = []
+        self.cancelled = False
+
+    def register(self, process: subprocess.Popen) -> None:
+        """Track a running process, killing it at once if already cancelled"""
+        with self._lock:
+            if not self.cancelled:
+                self._processes.append(process)
+                return
+        process.kill()
+
+    def unregister(self, process: subprocess.Popen) -> None:
+        """Stop tracking a finished process"""
+        with self._lock:
+            if process in self._processes:
+                self._processes.remove(process)
+
+    def cancel(self) -> None:
+        """Cancel all current and future work tied to this token"""
+        with self._lock:
+            self.cancelled = True
+            processes = list(self._processes)
+        for process in processes:
+            try:
+                process.kill()
+            except OSError:
+                pass
+
+    def check(self) -> None:
+        """Raise OperationCancelled if the token has been cancelled"""
+        if self.cancelled:
+            raise OperationCancelled("operation cancelled")
+
+
+class JiraUnavailable(RuntimeError):
+    """Raised instead of running jcli while the circuit breaker is open"""
+
+
+class JcliGuard:
+    """Adaptive timeouts and a circuit breaker shared by every jcli call
+
+    Keeps a rolling window of latencies per request shape (see
+    jcli_request_shape()) and derives each timeout from its p99. A timeout
+    counts as a sample of its full length, so a server that slows down raises
+    its own timeouts. Creates keep their default timeout. Once JIRA has timed
+    out JCLI_BREAKER_THRESHOLD times in a row, calls raise JiraUnavailable
+    until JCLI_BREAKER_COOLDOWN has passed; the next call then goes through,
+    and another timeout opens the breaker again.
+    """
+
+    def __init__(self) -> None:
+        # threading is imported lazily, but its low-level lock is always loaded
+        import _thread
+
+        self._lock = _thread.allocate_lock()
+        self.samples: Dict[str, List[float]] = {}
+        self.consecutive_timeouts = 0
+        self.open_until = 0.0
+        self.path: Optional[str] = None
+
+    def timeout_for(self, subcommand: str, shape: Optional[str] = None) -> float:
+        """Get the timeout to use for the next call of subcommand
+
+        Latencies are those recorded for shape, by default the subcommand.
+        """
+        default = JCLI_DEFAULT_TIMEOUTS.get(subcommand, JCLI_FALLBACK_TIMEOUT)
+        if subcommand in JCLI_FIXED_TIMEOUT_COMMANDS:
+            return default
+        with self._lock:
+            samples = sorted(self.samples.get(shape or subcommand, []))
+        if len(samples) < JCLI_MIN_SAMPLES:
+            return default
+        p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+        timeout = max(p99 * JCLI_TIMEOUT_FACTOR, JCLI_TIMEOUT_FLOOR)
+        return min(timeout, JCLI_TIMEOUT_CEILING)
+
+    def check(self, subcommand: str) -> None:
+        """Raise JiraUnavailable if the breaker is open for subcommand"""
+        if subcommand in JCLI_LOCAL_COMMANDS:
+            return
+        remaining = self.open_until - time.time()
+        if remaining > 0:
+            raise JiraUnavailable(
+                f"JIRA timed out {self.consecutive_timeouts} times in a row; "
+                f"not running jcli {subcommand} for another {remaining:.0f}s"
+            )
+
+    def record(
+        self,
+        subcommand: str,
+        duration: float,
+        timed_out: bool = False,
+        shape: Optional[str] = None,
+    ) -> None:
+        """Add a call's latency and update the breaker
+
+        The latency is kept under shape, by default the subcommand.
+        """
+        with self._lock:
+            window = self.samples.setdefault(shape or subcommand, [])
+            window.append(round(duration, 3))
+            del window[:-JCLI_LATENCY_WINDOW]
+            if subcommand in JCLI_LOCAL_COMMANDS:
+                return
+            if timed_out:
+                self.consecutive_timeouts += 1
+                if self.consecutive_timeouts >= JCLI_BREAKER_THRESHOLD:
+                    self.open_until = time.time() + JCLI_BREAKER_COOLDOWN
+            else:
+                self.consecutive_timeouts = 0
+                self.open_until = 0.0
+
+    def load(self, path: str) -> None:
+        """Restore latencies and breaker state saved by earlier runs"""
+        import json
+
+        self.path = path
+        try:
+            with open(path, "r") as f:
+                state = json.load(f)
+            samples = {
+                str(name): [float(sample) for sample in window]
+                for name, window in state["samples"].items()
+            }
+            consecutive_timeouts = int(state["consecutive_timeouts"])
+            open_until = float(state["open_until"])
+        except (OSError, ValueError, TypeError, AttributeError, KeyError):
+            return
+        with self._lock:
+            self.samples = samples
+            self.consecutive_timeouts = consecutive_timeouts
+            self.open_until = open_until
+
+    def save(self) -> None:
+        """Store latencies and breaker state for the next run, if loaded from a file"""
+        if not self.path:
+            return
+        with self._lock:
+            state = {
+                "samples": {
+                    name: list(window) for name, window in self.samples.items()
+                },
+                "consecutive_timeouts": self.consecutive_timeouts,
+                "open_until": self.open_until,
+            }
+        try:
+            write_json_atomic(self.path, state)
+        except OSError:
+            pass
+
+
+# Shared by all jcli calls; main() persists it between runs
+JCLI_GUARD = JcliGuard()
+
+
+def get_jcli_latency_file() -> str:
+    """Get the path to the saved jcli latencies and breaker state"""
+    return os.path.join(get_config_dir(), "jcli_latency.json")
+
+
+def run_command(
+    cmd: List[str],
+    timeout: Optional[float] = None,
+    cancel_token: Optional[CancellationToken] = None,
+) -> subprocess.CompletedProcess:
+    """Run a jcli command capturing text output, like subprocess.run, but cancellable
+
+    Without an explicit timeout, the subcommand's adaptive timeout applies.
+    Raises JiraUnavailable without running anything while JCLI_GUARD's
+    breaker is open.
+    """
+    import subprocess
+
+    if cancel_token is not None:
+        cancel_token.check()
+
+    subcommand = jcli_subcommand(cmd)
+    shape = jcli_request_shape(cmd)
+    JCLI_GUARD.check(subcommand)
+    if timeout is None:
+        timeout = JCLI_GUARD.timeout_for(subcommand, shape)
+
+    with TRACER.command_span(cmd) as span:
+        started = time.monotonic()
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
+        if cancel_token is not None:
+            cancel_token.register(process)
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            JCLI_GUARD.record(subcommand, timeout, timed_out=True, shape=shape)
+            raise
+        finally:
+            if cancel_token is not None:
+                cancel_token.unregister(process)
+
+        # Killed processes say nothing about how fast JIRA is
+        if cancel_token is None or not cancel_token.cancelled:
+            JCLI_GUARD.record(subcommand, time.monotonic() - started, shape=shape)
+        result = subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+        span.set_result(result)
+
+    # Credentials that stopped working must be checked again next time
+    if process.returncode and is_auth_error(stderr or ""):
+        forget_auth_check()
+
+    if cancel_token is not None:
+        cancel_token.check()
+    return result
+
+
+def get_jcli_validation_file() -> str:
+    """Get the path to the jcli validation record, stored next to the jcli path file"""
+    return get_jcli_path_file() + ".validated"
+
+
+def _stat_fingerprint(path: str) -> List[int]:
+    """Return the inode, mtime and size identifying a file's current contents"""
+    st = os.stat(path)
+    return [st.st_ino, st.st_mtime_ns, st.st_size]
+
+
+def get_jcli_fingerprint(jcli_path: str) -> Optional[Dict[str, Any]]:
+    """Fingerprint a jcli executable and the interpreter named in its shebang"""
+    import shutil
+
+    resolved = jcli_path if os.sep in jcli_path else shutil.which(jcli_path)
+    if not resolved:
+        return None
+
+    try:
+        fingerprint: Dict[str, Any] = {
+            "path": os.path.realpath(resolved),
+            "file": _stat_fingerprint(resolved),
+            "shebang": None,
+        }
+
+        with open(resolved, "rb") as f:
+            first_line = f.readline(256)
+        if first_line.startswith(b"#!"):
+            parts = first_line[2:].decode(errors="replace").split()
+            if parts:
+                interpreter = parts[0]
+                # "#!/usr/bin/env python3" points at whatever python3 is on PATH
+                if os.path.basename(interpreter) == "env" and len(parts) > 1:
+                    interpreter = shutil.which(parts[1]) or parts[1]
+                # A venv's python is a symlink; recreating the venv replaces the link
+                link = os.lstat(interpreter)
+                fingerprint["shebang"] = {
+                    "path": interpreter,
+                    "link": [link.st_ino, link.st_mtime_ns],
+                    "target": _stat_fingerprint(interpreter),
+                }
+        return fingerprint
+    except OSError:
+        return None
+
+
+def load_jcli_validation() -> Optional[Dict[str, Any]]:
+    """Load the fingerprint recorded when the saved jcli last passed validation"""
+    import json
+
+    try:
+        with open(get_jcli_validation_file(), "r") as f:
+            validation = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return validation if isinstance(validation, dict) else None
+
+
+def save_jcli_validation(jcli_path: str) -> None:
+    """Record the fingerprint of a jcli that just passed check_jcli_command"""
+    import json
+
+    fingerprint = get_jcli_fingerprint(jcli_path)
+    if fingerprint is None:
+        return
+    try:
+        with open(get_jcli_validation_file(), "w") as f:
+            json.dump(fingerprint, f)
+    except OSError:
+        pass
+
+
+def validate_jcli_command(jcli_path: str) -> bool:
+    """Check a jcli command, skipping the subprocess while its fingerprint matches"""
+    fingerprint = get_jcli_fingerprint(jcli_path)
+    if fingerprint is not None and fingerprint == load_jcli_validation():
+        return True
+
+    if check_jcli_command(jcli_path):
+        save_jcli_validation(jcli_path)
+        return True
+    return False
+
+
 def get_user_input(prompt: str, default: Optional[str] = None) -> str:
     """Get user input with optional default value"""
+    if EVENTS.enabled:
+        EVENTS.emit(
+            "prompt", kind="text", message=prompt.strip(), default=default or ""
+        )
+        return input().strip() or default or ""
     if default:
         user_input = input(f"{prompt} [{default}]: ").strip()
         return user_input if user_input else default
@@ -113,6 +768,11 @@ def get_user_input(prompt: str, default: Optional[str] = None) -> str:
 
 def select_from_list(items: List[str], prompt: str, default_index: int = 0) -> str:
     """Display a numbered list and let user select an item"""
+    if EVENTS.enabled:
+        return select_with_events(items, prompt, default_index)
+    if len(items) > SELECT_SEARCH_THRESHOLD:
+        return search_from_list(items, prompt, default_index)
+
     print(f"\n{Colors.OKBLUE}{prompt}{Colors.ENDC}")
     print("-" * 40)
     
@@ -135,13 +795,151 @@ def select_from_list(items: List[str], prompt: str, default_index: int = 0) -> s
             print_error("Please enter a valid number")
 
 
+def select_with_events(items: List[str], prompt: str, default_index: int = 0) -> str:
+    """Ask for a choice with an options event, accepting a number or the option"""
+    while True:
+        EVENTS.emit("options", message=prompt, options=items, default=default_index)
+        choice = input().strip()
+        if not choice:
+            return items[default_index]
+        if choice in items:
+            return choice
+        if choice.isdigit() and 1 <= int(choice) <= len(items):
+            return items[int(choice) - 1]
+        print_error(f"Please choose one of the {len(items)} options")
+
+
+class OptionIndex:
+    """Precomputed lookup tables for filtering a long list of options by text"""
+
+    def __init__(self, items: List[str]) -> None:
+        import re
+
+        self.lowered = [item.lower() for item in items]
+        # (word, item index) pairs sorted for prefix lookups with bisect
+        self.words = sorted(
+            (word, i)
+            for i, item in enumerate(self.lowered)
+            for word in re.split(r"[^a-z0-9]+", item)
+            if word
+        )
+        # Items containing each trigram, to narrow substring searches
+        self.trigrams: Dict[str, Set[int]] = {}
+        for i, item in enumerate(self.lowered):
+            for start in range(len(item) - 2):
+                self.trigrams.setdefault(item[start:start + 3], set()).add(i)
+
+    def search(self, query: str) -> List[int]:
+        """Find the indices of items matching query, best matches first
+
+        Items starting with query come first, then items with a word starting
+        with it, then items containing it anywhere, each in list order.
+        """
+        import bisect
+
+        query = query.lower().strip()
+        if not query:
+            return list(range(len(self.lowered)))
+
+        word_matches = set()
+        position = bisect.bisect_left(self.words, (query, -1))
+        while position < len(self.words):
+            word, i = self.words[position]
+            if not word.startswith(query):
+                break
+            word_matches.add(i)
+            position += 1
+
+        if len(query) >= 3:
+            candidates: Iterable[int] = sorted(set.intersection(*(
+                self.trigrams.get(query[start:start + 3], set())
+                for start in range(len(query) - 2)
+            )))
+        else:
+            candidates = range(len(self.lowered))
+        substring_matches = [i for i in candidates if query in self.lowered[i]]
+
+        prefix = [i for i in substring_matches if self.lowered[i].startswith(query)]
+        ranked = prefix + sorted(word_matches - set(prefix))
+        seen = set(ranked)
+        return ranked + [i for i in substring_matches if i not in seen]
+
+
+def search_from_list(items: List[str], prompt: str, default_index: int = 0) -> str:
+    """Let the user filter a long list by typing, showing one page of matches
+
+    Numbers pick from the current matches (the full list until a filter is
+    typed), '+' and '-' page through them and '*' clears the filter. Text
+    starting with '/' is always treated as a filter, even if it is a number.
+    """
+    index = OptionIndex(items)
+    matches = list(range(len(items)))
+    query = ""
+    start = 0
+
+    print(f"\n{Colors.OKBLUE}{prompt}{Colors.ENDC}")
+    print("-" * 40)
+    print_info(
+        f"{len(items)} options - type to filter, '+'/'-' to page, '*' to show all"
+    )
+
+    while True:
+        # Enter picks the default, or the best match once a filter is typed
+        default_position = 0 if query else default_index
+        page = matches[start:start + SELECT_PAGE_SIZE]
+        for position, item_index in enumerate(page, start):
+            is_default = position == default_position
+            marker = f"{Colors.OKGREEN}→{Colors.ENDC}" if is_default else " "
+            print(f"{marker} {position + 1}. {items[item_index]}")
+        remaining = len(matches) - start - len(page)
+        if remaining > 0:
+            print(f"  ... {remaining} more")
+
+        if not matches:
+            print_error(f"No options match '{query}'")
+            choice = input("\nEnter filter text or '*' to show all: ").strip()
+        else:
+            choice = input(
+                f"\nEnter choice or filter (1-{len(matches)}) "
+                f"[{default_position + 1}]: "
+            ).strip()
+
+        if not choice and matches:
+            return items[matches[default_position]]
+        if choice == "+":
+            if start + SELECT_PAGE_SIZE < len(matches):
+                start += SELECT_PAGE_SIZE
+            continue
+        if choice == "-":
+            start = max(0, start - SELECT_PAGE_SIZE)
+            continue
+        if choice.isdigit():
+            position = int(choice) - 1
+            if 0 <= position < len(matches):
+                return items[matches[position]]
+            print_error(f"Please enter a number between 1 and {len(matches)}")
+            continue
+
+        if choice == "*":
+            choice = ""
+        query = choice[1:] if choice.startswith("/") else choice
+        matches = index.search(query)
+        start = 0
+
+
 def display_calendar() -> str:
     """Display a calendar and let user select a date"""
+    import calendar
+    import datetime
+
     print_header("SELECT DUE DATE")
     
     today = datetime.date.today()
     current_month = today.month
     current_year = today.year
+
+    if EVENTS.enabled:
+        return select_date_with_events(today)
     
     while True:
         print(f"\n{Colors.OKBLUE}Calendar for {calendar.month_name[current_month]} {current_year}{Colors.ENDC}")
@@ -212,20 +1010,34 @@ def display_calendar() -> str:
                 print_error("Invalid date format. Try YYYY-MM-DD or just the day number")
 
 
-def find_jcli_command() -> str:
-    """Find the jcli command location with user interaction"""
-    print_header("JCLI LOCATION DETECTION")
-    
-    # First, check if we have a saved path
-    saved_path = load_jcli_path()
-    if saved_path:
-        print_info(f"Found saved jcli path: {saved_path}")
-        if check_jcli_command(saved_path):
-            print_success(f"Using saved jcli at: {saved_path}")
-            return saved_path
-        else:
-            print_error("Saved jcli path is no longer working, searching for new location...")
-    
+def select_date_with_events(today: datetime.date) -> str:
+    """Ask for a due date with a date prompt event; empty means no due date"""
+    import datetime
+
+    while True:
+        EVENTS.emit(
+            "prompt",
+            kind="date",
+            message="Enter due date (YYYY-MM-DD), 't' for today, or nothing for none",
+            default="",
+            today=today.strftime("%Y-%m-%d"),
+        )
+        user_input = input().strip().lower()
+        if not user_input:
+            return ""
+        if user_input == "t":
+            return today.strftime("%Y-%m-%d")
+        try:
+            date_obj = datetime.datetime.strptime(user_input, "%Y-%m-%d")
+            return date_obj.strftime("%Y-%m-%d")
+        except ValueError:
+            print_error("Invalid date format. Use YYYY-MM-DD")
+
+
+def get_jcli_candidate_locations() -> List[str]:
+    """List the places jcli is commonly installed, most preferred first"""
+    import shutil
+
     # Check common locations
     common_locations = [
         "jcli",  # In PATH
@@ -238,22 +1050,55 @@ def find_jcli_command() -> str:
         venv_path = os.path.join(os.environ['VIRTUAL_ENV'], 'bin', 'jcli')
         common_locations.insert(0, venv_path)
     
-    # Check if we can find jcli with 'which'
-    try:
-        result = subprocess.run(['which', 'jcli'], capture_output=True, text=True)
-        if result.returncode == 0:
-            which_path = result.stdout.strip()
-            if which_path not in common_locations:
-                common_locations.insert(0, which_path)
-    except:
-        pass
+    # Check if we can find jcli on the PATH
+    which_path = shutil.which("jcli")
+    if which_path and which_path not in common_locations:
+        common_locations.insert(0, which_path)
+
+    return common_locations
+
+
+def detect_jcli_command() -> Optional[str]:
+    """Find a working jcli without prompting, for non-interactive modes"""
+    saved_path = load_jcli_path()
+    if saved_path and validate_jcli_command(saved_path):
+        return saved_path
+
+    working_locations = probe_jcli_locations(get_jcli_candidate_locations())
+    if not working_locations:
+        return None
+
+    # Prefer the virtual environment's jcli, as find_jcli_command does
+    selected_path = working_locations[0]
+    venv_path = os.environ.get("VIRTUAL_ENV")
+    if venv_path:
+        for location in working_locations:
+            if location.startswith(venv_path):
+                selected_path = location
+                break
+
+    save_jcli_path(selected_path)
+    return selected_path
+
+
+def find_jcli_command() -> str:
+    """Find the jcli command location with user interaction"""
+    print_header("JCLI LOCATION DETECTION")
+    
+    # First, check if we have a saved path
+    saved_path = load_jcli_path()
+    if saved_path:
+        print_info(f"Found saved jcli path: {saved_path}")
+        if validate_jcli_command(saved_path):
+            print_success(f"Using saved jcli at: {saved_path}")
+            return saved_path
+        else:
+            print_error("Saved jcli path is no longer working, searching for new location...")
     
-    # Test each location
-    working_locations = []
-    for location in common_locations:
-        if check_jcli_command(location):
-            working_locations.append(location)
-            print_success(f"Found working jcli at: {location}")
+    # Test all common locations at once
+    working_locations = probe_jcli_locations(get_jcli_candidate_locations())
+    for location in working_locations:
+        print_success(f"Found working jcli at: {location}")
     
     if working_locations:
         selected_path = None
@@ -320,8 +1165,24 @@ def extract_project_key(project_display: str) -> str:
     return project_display
 
 
-def get_priority_options(project: str) -> List[str]:
-    """Get available priority options"""
+def get_priority_options(
+    project: str,
+    meta: Optional[Dict[str, Any]] = None,
+    issue_type: Optional[str] = None,
+) -> List[str]:
+    """Get available priority options
+
+    With create metadata for the project, these are the priorities JIRA
+    allows for issue_type, and empty if it cannot set a priority at all.
+    """
+    issue_types = (meta or {}).get("issue_types", {})
+    if issue_type in issue_types:
+        priorities = issue_types[issue_type]["priorities"]
+        if priorities is None:
+            return []
+        if priorities:
+            return list(priorities)
+
     # Return standard JIRA priority options
     return ["Blocker", "Critical", "Major", "Normal", "Minor"]
 
@@ -374,93 +1235,1906 @@ def get_description_for_issue_type(issue_type: str, summary: str) -> str:
         return get_user_input("Enter issue description (optional)", "")
 
 
-def get_available_projects(jcli_cmd: str) -> List[str]:
-    """Get list of available projects - fallback to common defaults if jcli unavailable"""
-    try:
-        # Try to get projects by running a simple jcli command and parsing output
-        # Since there's no direct "list projects" command, we'll try to get projects
-        # from a sample issue listing
-        result = subprocess.run(
-            [jcli_cmd, "issues", "list", "--max-issues", "10", "--output", "json"], 
-            capture_output=True, 
-            text=True, 
-            timeout=15
-        )
-        
-        if result.returncode == 0 and result.stdout.strip():
-            try:
-                data = json.loads(result.stdout)
-                projects = set()
-                
-                # Extract project names from issues
-                if 'issues' in data and data['issues']:
-                    for issue in data['issues']:
-                        if 'fields' in issue and 'project' in issue['fields']:
-                            project = issue['fields']['project']
-                            if 'key' in project and 'name' in project:
-                                projects.add(f"{project['key']} - {project['name']}")
-                            elif 'key' in project:
-                                projects.add(project['key'])
-                
-                if projects:
-                    return sorted(list(projects))
-                    
-            except json.JSONDecodeError:
-                pass
-        
-        # If that didn't work, try to use a import-based approach as fallback
-        try:
-            # Try to locate and import jcli module relative to the jcli command
-            jcli_dir = os.path.dirname(os.path.abspath(jcli_cmd))
-            parent_dir = os.path.dirname(jcli_dir)
-            
-            # Add potential module paths to sys.path temporarily
-            potential_paths = [
-                parent_dir,  # For venv installations
-                os.path.join(parent_dir, 'lib', 'python*', 'site-packages'),  # venv site-packages
-                '/usr/local/lib/python*/site-packages',  # system install
-                os.path.expanduser('~/.local/lib/python*/site-packages'),  # user install
-            ]
-            
-            original_path = sys.path.copy()
-            
-            for path in potential_paths:
-                if os.path.exists(path):
-                    sys.path.insert(0, path)
-            
-            from jcli.connector import JiraConnector
-            
-            jobj = JiraConnector()
-            jobj.login()
-            
-            if jobj.jira is not None:
-                projects = jobj.jira.projects()
-                project_list = []
-                for project in projects:
-                    project_list.append(f"{project.key} - {project.name}")
-                
-                if project_list:
-                    return project_list
-        except Exception as e:
-            print_info(f"Import fallback failed: {e}")
-            pass
-        finally:
-            # Restore original sys.path
-            sys.path = original_path
-        
-        # Final fallback to hardcoded common projects
-        print_info("Using default project list (could not fetch from jcli)")
-        return ["NSTL", "OTHER"]
-        
-    except Exception as e:
-        print_error(f"Could not fetch projects: {e}")
-        print_info("Using default project list")
-        return ["NSTL"]
+def parse_issue_projects(output: str) -> Tuple[int, Set[str]]:
+    """Parse a page of `jcli issues list` JSON into (issue count, projects)"""
+    import json
+
+    data = json.loads(output)
+    issues = data.get('issues') or [] if isinstance(data, dict) else []
+    projects = set()
+
+    # Extract project names from issues
+    for issue in issues:
+        if 'fields' in issue and 'project' in issue['fields']:
+            project = issue['fields']['project']
+            if 'key' in project and 'name' in project:
+                projects.add(f"{project['key']} - {project['name']}")
+            elif 'key' in project:
+                projects.add(project['key'])
+    return len(issues), projects
+
+
+def iter_project_pages(
+    jcli_cmd: str,
+    page_size: int = PROJECT_PAGE_SIZE,
+    stale_pages: int = PROJECT_STALE_PAGES,
+    max_pages: int = PROJECT_MAX_PAGES,
+    cancel_token: Optional[CancellationToken] = None,
+) -> Iterable[List[str]]:
+    """Page through issues and yield the projects each page adds
+
+    Only one page of output is held at a time. Paging stops at a short page,
+    after stale_pages pages in a row without a new project, or when a page
+    fails; a jcli without --start-at support still yields the first page.
+    """
+    seen: Set[str] = set()
+    stale = 0
+    for page in range(max_pages):
+        cmd = [jcli_cmd, "issues", "list", "--max-issues", str(page_size)]
+        if page:
+            cmd += ["--start-at", str(page * page_size)]
+        result = run_command(cmd + ["--output", "json"], cancel_token=cancel_token)
+        if result.returncode != 0 or not result.stdout.strip():
+            return
+        try:
+            count, projects = parse_issue_projects(result.stdout)
+        except ValueError:
+            return
+
+        new_projects = projects - seen
+        if new_projects:
+            seen |= new_projects
+            stale = 0
+            yield sorted(new_projects)
+        else:
+            stale += 1
+
+        if count < page_size or stale >= stale_pages:
+            return
+
+
+def fetch_projects(
+    jcli_cmd: str,
+    verbose: bool = True,
+    cancel_token: Optional[CancellationToken] = None,
+    on_page: Optional[Callable[[List[str]], None]] = None,
+) -> Optional[List[str]]:
+    """Fetch the project list from JIRA, returning None if no method worked
+
+    on_page is called with the sorted projects found so far each time a page
+    of issues adds new ones.
+    """
+    # Try to get projects by running a simple jcli command and parsing output
+    # Since there's no direct "list projects" command, we'll try to get projects
+    # from the projects of the issues we can list
+    projects: Set[str] = set()
+    for new_projects in iter_project_pages(jcli_cmd, cancel_token=cancel_token):
+        projects.update(new_projects)
+        if on_page is not None:
+            on_page(sorted(projects))
+
+    if projects:
+        return sorted(projects)
+
+    if cancel_token is not None:
+        cancel_token.check()
+
+    # If that didn't work, try to use a import-based approach as fallback
+    try:
+        jobj = load_jira_connector(jcli_cmd)
+        project_list = format_projects(jobj.jira.projects())
+        if project_list:
+            return project_list
+    except Exception as e:
+        if verbose:
+            print_info(f"Import fallback failed: {e}")
+
+    return None
+
+
+def format_projects(projects: Any) -> List[str]:
+    """Format JIRA project resources as 'KEY - Name' entries"""
+    return [f"{project.key} - {project.name}" for project in projects]
+
+
+def get_jcli_site_packages(jcli_cmd: str) -> Optional[str]:
+    """Find the site-packages of the venv jcli_cmd lives in, for this Python version"""
+    import shutil
+
+    resolved = jcli_cmd if os.sep in jcli_cmd else shutil.which(jcli_cmd)
+    if not resolved:
+        return None
+    venv_dir = os.path.dirname(os.path.dirname(os.path.abspath(resolved)))
+    # Packages built for another Python version must never be imported
+    version = f"python{sys.version_info.major}.{sys.version_info.minor}"
+    site_packages = os.path.join(venv_dir, "lib", version, "site-packages")
+    return site_packages if os.path.isdir(site_packages) else None
+
+
+def _allocate_lock() -> Any:
+    """Create a lock without importing threading on cheap paths"""
+    import _thread
+
+    return _thread.allocate_lock()
+
+
+def start_daemon_task(
+    fn: Callable[..., Any], *args: Any
+) -> concurrent.futures.Future:
+    """Run fn(*args) on a daemon thread, returning a Future for its result
+
+    Unlike an executor's workers, the thread does not hold up interpreter
+    exit: background work nobody waited for is abandoned.
+    """
+    import concurrent.futures
+    import threading
+
+    future: concurrent.futures.Future = concurrent.futures.Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+# load_jira_connector runs on prefetch threads too, so its temporary sys.path
+# change is made by one thread at a time
+JCLI_IMPORT_LOCK = _allocate_lock()
+
+
+def load_jira_connector(jcli_cmd: str) -> Any:
+    """Import jcli's JiraConnector from the installation behind jcli_cmd and log in"""
+    with JCLI_IMPORT_LOCK:
+        # Appended, so jcli's venv never shadows the standard library or our
+        # own packages
+        site_packages = get_jcli_site_packages(jcli_cmd)
+        added: Optional[str] = None
+        if site_packages is not None and site_packages not in sys.path:
+            added = site_packages
+            sys.path.append(added)
+        try:
+            from jcli.connector import JiraConnector
+
+            jobj = JiraConnector()
+            jobj.login()
+        finally:
+            if added is not None and added in sys.path:
+                sys.path.remove(added)
+
+    if jobj.jira is None:
+        raise RuntimeError("jcli connector did not log in")
+    return jobj
+
+
+def get_available_projects(
+    backend: "JiraBackend",
+    cancel_token: Optional[CancellationToken] = None,
+    on_page: Optional[Callable[[List[str]], None]] = None,
+    use_mirror: bool = True,
+) -> List[str]:
+    """Get list of available projects - fallback to common defaults if jcli unavailable
+
+    Once a full discovery has seeded the issue mirror, later calls only fetch
+    the issues updated since its last sync and answer from the mirror.
+    """
+    started = time.time()
+    if use_mirror:
+        projects = get_mirrored_projects(backend, cancel_token)
+        if projects:
+            save_project_cache(projects)
+            return projects
+
+    def save_page(projects: List[str]) -> None:
+        save_partial_projects(projects)
+        if on_page is not None:
+            on_page(projects)
+
+    try:
+        projects = backend.list_projects(cancel_token=cancel_token, on_page=save_page)
+    except OperationCancelled:
+        raise
+    except Exception as e:
+        print_error(f"Could not fetch projects: {e}")
+        print_info("Using default project list")
+        return ["NSTL"]
+
+    if projects:
+        save_discovered_projects(projects, started)
+        return projects
+
+    # Final fallback to hardcoded common projects
+    print_info("Using default project list (could not fetch from jcli)")
+    return ["NSTL", "OTHER"]
+
+
+def get_mirrored_projects(
+    backend: "JiraBackend", cancel_token: Optional[CancellationToken] = None
+) -> Optional[List[str]]:
+    """Sync the issue mirror and list its projects
+
+    Returns None when no full discovery has seeded the mirror yet, or when
+    the mirror or the sync fails.
+    """
+    try:
+        mirror = IssueMirror()
+        if mirror.get_watermark(ALL_PROJECTS) is None:
+            return None
+        sync_issue_mirror(backend, mirror, cancel_token=cancel_token)
+        return mirror.projects() or None
+    except OperationCancelled:
+        raise
+    except Exception:
+        return None
+
+
+def load_jira_identity() -> Tuple[str, str]:
+    """Read the JIRA server and user from ~/.jira.yml (empty strings if unknown)"""
+    identity = {"server": "", "username": ""}
+    try:
+        with open(os.path.expanduser("~/.jira.yml"), "r") as f:
+            for line in f:
+                if ":" not in line or line.startswith((" ", "\t", "#")):
+                    continue
+                key, value = line.split(":", 1)
+                key = key.strip()
+                if key in ("user", "email"):
+                    key = "username"
+                if key in identity and not identity[key]:
+                    identity[key] = value.strip().strip("'\"")
+    except OSError:
+        pass
+    return identity["server"], identity["username"]
+
+
+def get_project_cache_file() -> str:
+    """Get the path to the project list cache file"""
+    return os.path.join(get_config_dir(), "projects_cache.json")
+
+
+def get_project_cache_key() -> str:
+    """Get the cache key for the configured JIRA server and user"""
+    server, username = load_jira_identity()
+    return f"{server}|{username}"
+
+
+def load_project_cache() -> Optional[Tuple[List[str], float]]:
+    """Load cached projects and their fetch time for the current JIRA identity
+
+    A list saved by a discovery that never finished reports a fetch time of
+    0, so it is served but always refreshed.
+    """
+    import json
+
+    try:
+        with open(get_project_cache_file(), "r") as f:
+            entry = json.load(f).get(get_project_cache_key())
+        if entry and entry.get("projects"):
+            fetched_at = float(entry["fetched_at"])
+            if not entry.get("complete", True):
+                fetched_at = 0.0
+            return list(entry["projects"]), fetched_at
+    except (OSError, ValueError, TypeError, AttributeError, KeyError):
+        pass
+    return None
+
+
+# Background threads save to the caches too; each read-modify-write of a
+# cache file holds this lock so that no thread's update is lost
+CACHE_UPDATE_LOCK = _allocate_lock()
+
+
+def save_project_cache(projects: List[str], complete: bool = True) -> None:
+    """Store the project list for the current JIRA identity
+
+    An incomplete list, from a discovery still paging, is added to the
+    projects already cached rather than replacing them.
+    """
+    import json
+
+    cache_file = get_project_cache_file()
+    try:
+        with CACHE_UPDATE_LOCK:
+            try:
+                with open(cache_file, "r") as f:
+                    cache = json.load(f)
+                if not isinstance(cache, dict):
+                    cache = {}
+            except (OSError, ValueError):
+                cache = {}
+
+            key = get_project_cache_key()
+            if not complete:
+                entry = cache.get(key)
+                if isinstance(entry, dict) and isinstance(entry.get("projects"), list):
+                    projects = sorted(set(projects) | set(entry["projects"]))
+            cache[key] = {
+                "projects": projects,
+                "fetched_at": time.time(),
+                "complete": complete,
+            }
+            write_json_atomic(cache_file, cache)
+    except Exception as e:
+        print_error(f"Failed to save project cache: {e}")
+
+
+def write_json_atomic(path: str, data: Any, indent: Optional[int] = None) -> None:
+    """Write JSON via a temporary file so readers never see a partial file"""
+    import json
+    import tempfile
+
+    # A unique temporary file per write, so concurrent writers never share one
+    fd, tmp_file = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".",
+        prefix=f".{os.path.basename(path)}.",
+        suffix=".tmp",
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=indent)
+        os.replace(tmp_file, path)
+    except BaseException:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        raise
+
+
+def save_partial_projects(projects: List[str]) -> None:
+    """Cache the projects a discovery has found so far
+
+    Discovery runs on a daemon thread that is abandoned at exit, so each
+    page is kept for the next run, which serves it and discovers again.
+    """
+    save_project_cache(projects, complete=False)
+
+
+def save_discovered_projects(projects: List[str], started: float) -> None:
+    """Cache the result of a full discovery and seed the issue mirror with it"""
+    save_project_cache(projects)
+    try:
+        # Later discoveries only need the issues updated from here on
+        mirror = IssueMirror()
+        mirror.add_projects(projects)
+        mirror.set_watermark(ALL_PROJECTS, started)
+    except Exception:
+        pass
+
+
+def refresh_project_cache(backend: "JiraBackend") -> None:
+    """Quietly fetch projects from JIRA and update the cache on success"""
+    started = time.time()
+    projects = get_mirrored_projects(backend)
+    if projects:
+        save_project_cache(projects)
+        return
+
+    try:
+        projects = backend.list_projects(verbose=False, on_page=save_partial_projects)
+    except Exception:
+        return
+    if projects:
+        save_discovered_projects(projects, started)
+
+
+def get_cached_projects(
+    backend: "JiraBackend",
+    ttl: float = PROJECT_CACHE_TTL,
+    force_refresh: bool = False,
+    cancel_token: Optional[CancellationToken] = None,
+    on_page: Optional[Callable[[List[str]], None]] = None,
+) -> List[str]:
+    """Get projects from the cache, revalidating stale entries in the background
+
+    When the cache cannot be used, on_page receives partial results while
+    projects are discovered.
+    """
+    import threading
+
+    cached = None if force_refresh else load_project_cache()
+
+    if cached:
+        projects, fetched_at = cached
+        age = time.time() - fetched_at
+        if age > ttl:
+            # Serve the stale list right away and refresh it for the next run
+            print_info("Using cached project list (refreshing in background)")
+            threading.Thread(
+                target=refresh_project_cache, args=(backend,), daemon=True
+            ).start()
+        return projects
+
+    return get_available_projects(
+        backend, cancel_token, on_page, use_mirror=not force_refresh
+    )
+
+
+def parse_create_meta(
+    data: Dict[str, Any], project_key: str
+) -> Optional[Dict[str, Any]]:
+    """Reduce a JIRA createmeta response to what the prompts and validation need
+
+    Returns {"issue_types": {name: {"required_fields": [{"id", "name"}],
+    "priorities": [names] or None, "labels": bool}}}, where priorities is
+    None when the issue type cannot set a priority and labels tells whether
+    it can carry the idempotency label.
+    """
+    for project in data.get("projects", []):
+        if project.get("key") != project_key:
+            continue
+
+        issue_types: Dict[str, Any] = {}
+        for issue_type in project.get("issuetypes", []):
+            if issue_type.get("subtask"):
+                continue
+            fields = issue_type.get("fields", {})
+            priority = fields.get("priority")
+            issue_types[issue_type["name"]] = {
+                "required_fields": [
+                    {"id": field_id, "name": field.get("name", field_id)}
+                    for field_id, field in fields.items()
+                    if field.get("required") and not field.get("hasDefaultValue")
+                ],
+                "priorities": None if priority is None else [
+                    value["name"]
+                    for value in priority.get("allowedValues", [])
+                    if value.get("name")
+                ],
+                "labels": "labels" in fields,
+            }
+        return {"issue_types": issue_types} if issue_types else None
+    return None
+
+
+def get_create_meta_cache_file() -> str:
+    """Get the path to the per-project create metadata cache file"""
+    return os.path.join(get_config_dir(), "create_meta_cache.json")
+
+
+def load_create_meta_cache(project_key: str, ttl: float) -> Optional[Dict[str, Any]]:
+    """Load cached create metadata for a project if it is younger than ttl"""
+    import json
+
+    try:
+        with open(get_create_meta_cache_file(), "r") as f:
+            entry = json.load(f).get(f"{get_project_cache_key()}|{project_key}")
+        if entry and time.time() - float(entry["fetched_at"]) <= ttl:
+            return dict(entry["meta"])
+    except (OSError, ValueError, TypeError, AttributeError, KeyError):
+        pass
+    return None
+
+
+def save_create_meta_cache(project_key: str, meta: Dict[str, Any]) -> None:
+    """Store create metadata for a project and the current JIRA identity"""
+    import json
+
+    cache_file = get_create_meta_cache_file()
+    try:
+        with CACHE_UPDATE_LOCK:
+            try:
+                with open(cache_file, "r") as f:
+                    cache = json.load(f)
+                if not isinstance(cache, dict):
+                    cache = {}
+            except (OSError, ValueError):
+                cache = {}
+
+            cache[f"{get_project_cache_key()}|{project_key}"] = {
+                "meta": meta,
+                "fetched_at": time.time(),
+            }
+            write_json_atomic(cache_file, cache)
+    except Exception as e:
+        print_error(f"Failed to save create metadata cache: {e}")
+
+
+def get_create_meta(
+    backend: "JiraBackend",
+    project_key: str,
+    ttl: float = CREATE_META_TTL,
+    force_refresh: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """Get create metadata for a project, or None if JIRA could not provide it"""
+    if not force_refresh:
+        cached = load_create_meta_cache(project_key, ttl)
+        if cached:
+            return cached
+
+    try:
+        meta = backend.get_create_meta(project_key)
+    except Exception:
+        return None
+    if not isinstance(meta, dict):
+        return None
+
+    save_create_meta_cache(project_key, meta)
+    return meta
+
+
+def get_issue_type_options(meta: Optional[Dict[str, Any]] = None) -> List[str]:
+    """Get the issue types to offer, from create metadata when available"""
+    if meta and meta.get("issue_types"):
+        return list(meta["issue_types"])
+    return ["Task", "Epic"]
+
+
+def can_label_issue(meta: Optional[Dict[str, Any]], issue_type: str) -> bool:
+    """Check that metadata shows issue_type can carry the idempotency label
+
+    Without metadata, or with metadata cached before labels were recorded,
+    nothing is known, and the label is left out rather than risk JIRA
+    rejecting the issue over it.
+    """
+    issue_type_meta = (meta or {}).get("issue_types", {}).get(issue_type)
+    return bool(issue_type_meta and issue_type_meta.get("labels"))
+
+
+def get_missing_required_fields(
+    meta: Optional[Dict[str, Any]],
+    issue_type: str,
+    fields: Dict[str, Any],
+    extra_fields: Optional[Dict[str, str]] = None,
+) -> List[str]:
+    """Name the fields JIRA requires for issue_type that would not be sent"""
+    if not meta or issue_type not in meta.get("issue_types", {}):
+        return []
+
+    # Every creation path sends these, and labels when they can carry the
+    # idempotency key
+    sent = {"project", "issuetype", "summary"}
+    if can_label_issue(meta, issue_type):
+        sent.add("labels")
+    for field_id, key in (
+        ("description", "description"),
+        ("duedate", "due_date"),
+        ("priority", "priority"),
+    ):
+        if fields.get(key):
+            sent.add(field_id)
+    named = set(extra_fields or {})
+    if fields.get("epic_name"):
+        named.add("Epic Name")
+
+    return [
+        field["name"]
+        for field in meta["issue_types"][issue_type]["required_fields"]
+        if field["id"] not in sent
+        and field["id"] not in named
+        and field["name"] not in named
+    ]
+
+
+def check_create_meta(meta: Optional[Dict[str, Any]], fields: Dict[str, Any]) -> None:
+    """Raise ValueError if JIRA would reject fields for the project in meta"""
+    if not meta:
+        return
+    issue_type = fields["issue_type"]
+    if issue_type not in meta["issue_types"]:
+        allowed = ", ".join(meta["issue_types"])
+        raise ValueError(f"issue type {issue_type!r} is not one of: {allowed}")
+    missing = get_missing_required_fields(
+        meta, issue_type, fields, fields.get("extra_fields")
+    )
+    if missing:
+        raise ValueError(f"missing required fields: {', '.join(missing)}")
+
+
+def summary_trigrams(text: str) -> Set[str]:
+    """Split text into the letter trigrams of its words, ignoring case and order"""
+    import re
+
+    trigrams: Set[str] = set()
+    for word in re.findall(r"[a-z0-9]+", text.lower()):
+        padded = f" {word} "
+        trigrams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+class SummaryIndex:
+    """Inverted trigram index over issue summaries for finding likely duplicates"""
+
+    def __init__(self, issues: Dict[str, str]) -> None:
+        self.keys = list(issues)
+        self.summaries = [issues[key] for key in self.keys]
+        self.sizes: List[int] = []
+        # Issues containing each trigram
+        self.postings: Dict[str, List[int]] = {}
+        for i, summary in enumerate(self.summaries):
+            trigrams = summary_trigrams(summary)
+            self.sizes.append(len(trigrams))
+            for trigram in trigrams:
+                self.postings.setdefault(trigram, []).append(i)
+
+    def similar(
+        self,
+        summary: str,
+        limit: int = DUPLICATE_LIMIT,
+        threshold: float = DUPLICATE_THRESHOLD,
+    ) -> List[Tuple[str, str, float]]:
+        """Find (key, summary, score) of the issues most similar to summary
+
+        The score is the Dice coefficient of the two trigram sets, from 0 for
+        nothing in common to 1 for the same words in any order.
+        """
+        import heapq
+
+        trigrams = summary_trigrams(summary)
+        if not trigrams:
+            return []
+
+        shared: Dict[int, int] = {}
+        for trigram in trigrams:
+            for i in self.postings.get(trigram, ()):
+                shared[i] = shared.get(i, 0) + 1
+
+        scored = []
+        for i, count in shared.items():
+            score = 2 * count / (len(trigrams) + self.sizes[i])
+            if score >= threshold:
+                scored.append((score, i))
+        # Ties go to the more recently updated issue, which comes first
+        best = heapq.nlargest(limit, scored, key=lambda item: (item[0], -item[1]))
+        return [(self.keys[i], self.summaries[i], score) for score, i in best]
+
+
+def get_mirror_file() -> str:
+    """Get the path to the SQLite issue mirror"""
+    return os.path.join(get_config_dir(), "issue_mirror.sqlite3")
+
+
+MIRROR_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    account TEXT NOT NULL,
+    key TEXT NOT NULL,
+    project TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    updated TEXT NOT NULL,
+    PRIMARY KEY (account, key)
+);
+CREATE INDEX IF NOT EXISTS issues_by_project ON issues (account, project, updated);
+CREATE TABLE IF NOT EXISTS projects (
+    account TEXT NOT NULL,
+    key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (account, key)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    account TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (account, scope)
+);
+"""
+
+
+class IssueMirror:
+    """Local SQLite copy of recently updated issues and the projects seen
+
+    Rows belong to the configured JIRA server and user. Each sync scope (a
+    project key, or ALL_PROJECTS) records when it last synced, so the next
+    sync only asks JIRA for what changed since. Every call opens its own
+    connection, so one mirror can be shared by background threads.
+    """
+
+    def __init__(self, path: Optional[str] = None, account: Optional[str] = None):
+        self.path = path or get_mirror_file()
+        self.account = get_project_cache_key() if account is None else account
+        self._schema_ready = False
+
+    def _transaction(self) -> Any:
+        """Open a connection that commits on success and is always closed"""
+        import contextlib
+        import sqlite3
+
+        @contextlib.contextmanager
+        def transaction() -> Any:
+            connection = sqlite3.connect(self.path, timeout=10)
+            try:
+                if not self._schema_ready:
+                    connection.executescript(MIRROR_SCHEMA)
+                    self._schema_ready = True
+                with connection:
+                    yield connection
+            finally:
+                connection.close()
+
+        return transaction()
+
+    def get_watermark(self, scope: str) -> Optional[float]:
+        """When scope last finished syncing, or None if it never has"""
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT synced_at FROM sync_state WHERE account = ? AND scope = ?",
+                (self.account, scope),
+            ).fetchone()
+        return None if row is None else float(row[0])
+
+    def set_watermark(self, scope: str, synced_at: float) -> None:
+        """Record that scope is synced up to synced_at"""
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)",
+                (self.account, scope, synced_at),
+            )
+
+    def upsert(self, issues: List[Dict[str, str]]) -> None:
+        """Insert or update issues and the projects they belong to
+
+        Each issue has key, summary, project, project_name and updated, as
+        returned by JiraBackend.search_issues().
+        """
+        with self._transaction() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        self.account, issue["key"], issue["project"],
+                        issue["summary"], issue["updated"],
+                    )
+                    for issue in issues
+                ],
+            )
+            self._add_projects(
+                connection,
+                {issue["project"]: issue["project_name"] for issue in issues},
+            )
+
+    def add_projects(self, entries: List[str]) -> None:
+        """Remember projects given as 'KEY - Name' (or bare 'KEY') entries"""
+        projects = {}
+        for entry in entries:
+            key, _, name = entry.partition(" - ")
+            projects[key] = name
+        with self._transaction() as connection:
+            self._add_projects(connection, projects)
+
+    def _add_projects(self, connection: Any, projects: Dict[str, str]) -> None:
+        """Upsert project names by key, keeping a known name over an empty one
+
+        Written as an insert and an update because ON CONFLICT upserts need
+        SQLite 3.24, newer than some supported Pythons ship with.
+        """
+        connection.executemany(
+            "INSERT OR IGNORE INTO projects VALUES (?, ?, ?)",
+            [(self.account, key, name) for key, name in projects.items() if key],
+        )
+        connection.executemany(
+            "UPDATE projects SET name = ? WHERE account = ? AND key = ?",
+            [
+                (name, self.account, key)
+                for key, name in projects.items()
+                if key and name
+            ],
+        )
+
+    def projects(self) -> List[str]:
+        """Known projects as sorted 'KEY - Name' entries"""
+        with self._transaction() as connection:
+            rows = connection.execute(
+                "SELECT key, name FROM projects WHERE account = ?", (self.account,)
+            ).fetchall()
+        return sorted(f"{key} - {name}" if name else key for key, name in rows)
+
+    def recent_summaries(self, project_key: str, limit: int) -> Dict[str, str]:
+        """Summaries by key of a project's most recently updated issues, newest first"""
+        with self._transaction() as connection:
+            rows = connection.execute(
+                "SELECT key, summary FROM issues WHERE account = ? AND project = ? "
+                "ORDER BY updated DESC, rowid DESC LIMIT ?",
+                (self.account, project_key, limit),
+            ).fetchall()
+        return dict(rows)
+
+
+def sync_issue_mirror(
+    backend: "JiraBackend",
+    mirror: IssueMirror,
+    project_key: Optional[str] = None,
+    cancel_token: Optional[CancellationToken] = None,
+) -> int:
+    """Fetch issues updated since the last sync of a project (or all of them)
+
+    A scope that never synced is seeded with its most recently updated
+    issues. Later syncs ask for `updated >= "-Nm"`, covering the minutes
+    since the last sync plus one, so the cursor does not depend on the time
+    zone of the JIRA user; issues seen twice are simply upserted again.
+    They fetch the oldest changes first, so one cut short by its page limit
+    moves the watermark only up to the newest change it fetched, and the
+    next sync carries on from there. Returns the number of issues fetched.
+    """
+    scope = project_key or ALL_PROJECTS
+    started = time.time()
+    last_sync = mirror.get_watermark(scope)
+
+    clauses = [f'project = "{project_key}"'] if project_key else []
+    if last_sync is None:
+        limit = MIRROR_SEED_PAGES * MIRROR_PAGE_SIZE
+        order = "DESC"
+    else:
+        minutes = int(max(0.0, started - last_sync) // 60) + 2
+        clauses.append(f'updated >= "-{minutes}m"')
+        limit = MIRROR_SYNC_MAX_PAGES * MIRROR_PAGE_SIZE
+        order = "ASC"
+    jql = f"{' AND '.join(clauses)} ORDER BY updated {order}".lstrip()
+
+    # JIRA caps maxResults (often at 50), so a short page is not the last one:
+    # page on from where it ended until a page is empty or the total is reached
+    fetched = 0
+    complete = False
+    last_updated = ""
+    while fetched < limit:
+        if cancel_token is not None:
+            cancel_token.check()
+        issues = backend.search_issues(jql, MIRROR_PAGE_SIZE, fetched)
+        mirror.upsert(issues)
+        fetched += len(issues)
+        if not issues or (issues.total is not None and fetched >= issues.total):
+            complete = True
+            break
+        last_updated = issues[-1]["updated"]
+
+    watermark = started
+    if last_sync is not None and not complete:
+        # Changes after the newest one fetched are still to come
+        resume_at = parse_jira_timestamp(last_updated)
+        watermark = last_sync if resume_at is None else max(last_sync, resume_at)
+    mirror.set_watermark(scope, watermark)
+    return fetched
+
+
+def parse_jira_timestamp(value: str) -> Optional[float]:
+    """Convert a JIRA timestamp, e.g. 2024-01-31T09:30:00.000+0000, to epoch seconds"""
+    import datetime
+
+    try:
+        parsed = datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+    except ValueError:
+        return None
+    return parsed.timestamp()
+
+
+def get_mirrored_summaries(project_key: str) -> Dict[str, str]:
+    """Get a project's mirrored summaries, or none if the mirror cannot be read"""
+    try:
+        return IssueMirror().recent_summaries(project_key, SUMMARY_INDEX_SIZE)
+    except Exception:
+        return {}
+
+
+def sync_summary_index(
+    backend: "JiraBackend",
+    project_key: str,
+    ttl: float = SUMMARY_INDEX_TTL,
+) -> Dict[str, str]:
+    """Get a project's mirrored summaries, syncing the mirror first if stale
+
+    Returns the mirrored summaries unchanged when JIRA cannot be reached.
+    """
+    try:
+        mirror = IssueMirror()
+        synced_at = mirror.get_watermark(project_key)
+        if synced_at is None or time.time() - synced_at > ttl:
+            sync_issue_mirror(backend, mirror, project_key)
+    except Exception:
+        pass
+    return get_mirrored_summaries(project_key)
+
+
+def mirror_created_issue(key: str, project_key: str, summary: str) -> None:
+    """Add an issue created by this tool to the mirror ahead of the next sync"""
+    updated = time.strftime("%Y-%m-%dT%H:%M:%S.000+0000", time.gmtime())
+    try:
+        IssueMirror().upsert([{
+            "key": key,
+            "summary": summary,
+            "project": project_key,
+            "project_name": "",
+            "updated": updated,
+        }])
+    except Exception as e:
+        print_error(f"Failed to update the issue mirror: {e}")
+
+
+def check_jcli_auth(jcli_cmd: str) -> bool:
+    """Check that jcli can authenticate against JIRA, printing the outcome"""
+    import subprocess
+
+    try:
+        # Test if jcli command is available and working
+        result = run_command([jcli_cmd, "myself"])
+        
+        if result.returncode == 0:
+            print_success("jcli is connected and ready!")
+            return True
+
+        print_error("jcli failed to authenticate")
+        print_info("Please check your JIRA configuration in ~/.jira.yml")
+        if result.stderr:
+            print_error(f"Error: {result.stderr.strip()}")
+        return False
+        
+    except subprocess.TimeoutExpired:
+        print_error("jcli command timed out")
+        print_info("Please check your JIRA configuration and network connection")
+        return False
+    except Exception as e:
+        print_error(f"Failed to test jcli: {e}")
+        print_info("Please check your JIRA configuration and network connection")
+        return False
+
+
+def get_auth_cache_file() -> str:
+    """Get the path to the record of the last successful auth check"""
+    return os.path.join(get_config_dir(), "auth_check.json")
+
+
+def get_auth_cache_key() -> str:
+    """Hash the JIRA server, user and ~/.jira.yml mtime a check vouches for"""
+    import hashlib
+
+    server, username = load_jira_identity()
+    try:
+        mtime = os.stat(os.path.expanduser("~/.jira.yml")).st_mtime_ns
+    except OSError:
+        mtime = 0
+    return hashlib.sha256(f"{server}|{username}|{mtime}".encode()).hexdigest()
+
+
+def load_auth_check(ttl: float = AUTH_CACHE_TTL) -> bool:
+    """Check for a successful auth check of the current configuration within ttl"""
+    import json
+
+    if ttl <= 0:
+        return False
+    try:
+        with open(get_auth_cache_file(), "r") as f:
+            check = json.load(f)
+        return bool(
+            check["key"] == get_auth_cache_key()
+            and 0 <= time.time() - check["checked_at"] < ttl
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+
+def save_auth_check() -> None:
+    """Record that the current configuration just authenticated"""
+    try:
+        write_json_atomic(
+            get_auth_cache_file(),
+            {"key": get_auth_cache_key(), "checked_at": time.time()},
+        )
+    except OSError:
+        pass
+
+
+def forget_auth_check() -> None:
+    """Drop the recorded auth check so the next run checks again"""
+    try:
+        os.remove(get_auth_cache_file())
+    except OSError:
+        pass
+
+
+def is_auth_error(error: str) -> bool:
+    """Check whether a JIRA error says the credentials were refused"""
+    import re
+
+    return bool(re.search(r"\b401\b|unauthori[sz]ed|not authenticated", error, re.I))
+
+
+def check_auth_cached(backend: "JiraBackend", ttl: float = AUTH_CACHE_TTL) -> bool:
+    """Check credentials unless the same configuration passed within ttl
+
+    A failed JIRA call that reports an auth error drops the record, so
+    broken credentials are caught by the next check.
+    """
+    if load_auth_check(ttl):
+        print_success("jcli is connected and ready! (checked recently)")
+        return True
+    if not backend.check_auth():
+        return False
+    save_auth_check()
+    return True
+
+
+def build_create_command(
+    jcli_cmd: str,
+    project_key: str,
+    issue_type: str,
+    summary: str,
+    description: str = "",
+    due_date: str = "",
+    priority: str = "",
+    epic_name: Optional[str] = None,
+    idempotency_key: Optional[str] = None,
+    extra_fields: Optional[Dict[str, str]] = None,
+) -> List[str]:
+    """Build the jcli issues create command for the given fields"""
+    cmd = [
+        jcli_cmd, "issues", "create",
+        "--project", project_key,
+        "--issue-type", issue_type,
+        "--summary", summary,
+    ]
+    
+    if description:
+        cmd.extend(["--description", description])
+    
+    if due_date:
+        cmd.extend(["--set-field", "duedate", due_date])
+    
+    if priority:
+        cmd.extend(["--set-field", "priority", priority])
+    
+    # Add Epic Name field if it's an Epic issue
+    if epic_name:
+        cmd.extend(["--set-field", "Epic Name", epic_name])
+
+    # Other fields the project requires, by name
+    for name, value in (extra_fields or {}).items():
+        cmd.extend(["--set-field", name, value])
+
+    # Tag the issue so a replayed creation can tell that it already exists
+    if idempotency_key:
+        cmd.extend(["--set-field", "labels", get_idempotency_label(idempotency_key)])
+
+    return cmd
+
+
+def new_idempotency_key() -> str:
+    """Generate a client-side key identifying one requested issue creation"""
+    import uuid
+
+    return uuid.uuid4().hex
+
+
+def get_idempotency_label(idempotency_key: str) -> str:
+    """Get the JIRA label that carries an idempotency key"""
+    return f"{IDEMPOTENCY_LABEL_PREFIX}{idempotency_key}"
+
+
+def extract_issue_key(output: str) -> Optional[str]:
+    """Find the first issue key (e.g. PROJ-123) in jcli output"""
+    import re
+
+    match = re.search(r"\b[A-Z][A-Z0-9_]+-\d+\b", output)
+    return match.group(0) if match else None
+
+
+class IssuePage(List[Dict[str, str]]):
+    """One page of search results, with the number of matches JIRA reported
+
+    total is None when the search did not report one.
+    """
+
+    def __init__(
+        self, issues: Iterable[Dict[str, str]] = (), total: Optional[int] = None
+    ) -> None:
+        super().__init__(issues)
+        self.total = total
+
+
+class JiraBackend:
+    """Interface for talking to JIRA, independent of how jcli is invoked"""
+
+    def check_auth(self) -> bool:
+        """Check that the configured credentials work, printing the outcome"""
+        raise NotImplementedError
+
+    def warm_up(self) -> None:
+        """Fetch ahead of time anything create_issue() would otherwise fetch first"""
+
+    def list_projects(
+        self,
+        verbose: bool = True,
+        cancel_token: Optional[CancellationToken] = None,
+        on_page: Optional[Callable[[List[str]], None]] = None,
+    ) -> Optional[List[str]]:
+        """Fetch 'KEY - Name' project entries, or None if they could not be fetched
+
+        Backends that discover projects incrementally pass the entries found
+        so far to on_page as they arrive.
+        """
+        raise NotImplementedError
+
+    def create_issue(
+        self,
+        project_key: str,
+        issue_type: str,
+        summary: str,
+        description: str = "",
+        due_date: str = "",
+        priority: str = "",
+        epic_name: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        extra_fields: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """Create an issue and return the output describing it"""
+        raise NotImplementedError
+
+    def find_issue(self, idempotency_key: str) -> Optional[str]:
+        """Return the key of an issue created with idempotency_key, if any"""
+        raise NotImplementedError
+
+    def get_create_meta(self, project_key: str) -> Optional[Dict[str, Any]]:
+        """Fetch issue types, priorities and required fields for a project
+
+        Returns the parse_create_meta() form, or None if unavailable.
+        """
+        raise NotImplementedError
+
+    def search_issues(
+        self, jql: str, max_issues: int, start_at: int = 0
+    ) -> IssuePage:
+        """Fetch one page of issues matching jql
+
+        Each issue is a dict of key, summary, project, project_name and
+        updated (JIRA's timestamp string). JIRA may return fewer than
+        max_issues even when more match, so only an empty page or the
+        page's total marks the end of the results.
+        """
+        raise NotImplementedError
+
+
+class SubprocessBackend(JiraBackend):
+    """Run a separate jcli process for every operation"""
+
+    def __init__(self, jcli_cmd: str) -> None:
+        self.jcli_cmd = jcli_cmd
+        # jcli's connector, or why it could not be loaded, kept for the run
+        self._connector_lock = _allocate_lock()
+        self._connector_backend: Optional[ConnectorBackend] = None
+        self._connector_error: Optional[Exception] = None
+
+    def check_auth(self) -> bool:
+        return check_jcli_auth(self.jcli_cmd)
+
+    def list_projects(
+        self,
+        verbose: bool = True,
+        cancel_token: Optional[CancellationToken] = None,
+        on_page: Optional[Callable[[List[str]], None]] = None,
+    ) -> Optional[List[str]]:
+        return fetch_projects(
+            self.jcli_cmd, verbose=verbose, cancel_token=cancel_token, on_page=on_page
+        )
+
+    def create_issue(
+        self,
+        project_key: str,
+        issue_type: str,
+        summary: str,
+        description: str = "",
+        due_date: str = "",
+        priority: str = "",
+        epic_name: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        extra_fields: Optional[Dict[str, str]] = None,
+    ) -> str:
+        cmd = build_create_command(
+            self.jcli_cmd, project_key, issue_type, summary,
+            description, due_date, priority, epic_name, idempotency_key, extra_fields,
+        )
+        print_info(f"Running: {' '.join(cmd)}")
+        result = run_command(cmd)
+        result.check_returncode()
+        return str(result.stdout)
+
+    def find_issue(self, idempotency_key: str) -> Optional[str]:
+        import json
+
+        jql = f'labels = "{get_idempotency_label(idempotency_key)}"'
+        result = run_command(
+            [
+                self.jcli_cmd, "issues", "list", "--jql", jql,
+                "--max-issues", "1", "--output", "json",
+            ]
+        )
+        if result.returncode != 0:
+            raise RuntimeError((result.stderr or "issue lookup failed").strip())
+        issues = json.loads(result.stdout or "{}").get("issues") or []
+        return str(issues[0]["key"]) if issues else None
+
+    def get_create_meta(self, project_key: str) -> Optional[Dict[str, Any]]:
+        # jcli has no command for create metadata, so ask its connector directly
+        return self.get_connector_backend().get_create_meta(project_key)
+
+    def get_connector_backend(self) -> ConnectorBackend:
+        """Import jcli's connector and log in once, remembering a failure for the run"""
+        with self._connector_lock:
+            if self._connector_error is not None:
+                raise self._connector_error
+            backend = self._connector_backend
+            if backend is None:
+                try:
+                    backend = ConnectorBackend(load_jira_connector(self.jcli_cmd))
+                except Exception as e:
+                    self._connector_error = e
+                    raise
+                self._connector_backend = backend
+        return backend
+
+    def search_issues(
+        self, jql: str, max_issues: int, start_at: int = 0
+    ) -> IssuePage:
+        import json
+
+        cmd = [self.jcli_cmd, "issues", "list", "--jql", jql]
+        cmd += ["--max-issues", str(max_issues)]
+        if start_at:
+            cmd += ["--start-at", str(start_at)]
+        result = run_command(cmd + ["--output", "json"])
+        if result.returncode != 0:
+            raise RuntimeError((result.stderr or "issue search failed").strip())
+
+        data = json.loads(result.stdout or "{}")
+        total = data.get("total")
+        issues = IssuePage(total=total if isinstance(total, int) else None)
+        for issue in data.get("issues") or []:
+            fields = issue.get("fields") or {}
+            project = fields.get("project") or {}
+            key = str(issue["key"])
+            issues.append({
+                "key": key,
+                "summary": str(fields.get("summary") or ""),
+                "project": str(project.get("key") or key.rsplit("-", 1)[0]),
+                "project_name": str(project.get("name") or ""),
+                "updated": str(fields.get("updated") or ""),
+            })
+        return issues
+
+
+class ConnectorBackend(JiraBackend):
+    """Reuse one logged-in jcli JiraConnector and its HTTP session for the whole run"""
+
+    def __init__(self, connector: Any) -> None:
+        import threading
+
+        self.connector = connector
+        self.jira = connector.jira
+        # The JIRA client is shared with background threads; keep calls serialized
+        self._lock = threading.Lock()
+        self._field_ids: Optional[Dict[str, str]] = None
+        self._per_project_meta: Optional[bool] = None
+
+    def check_auth(self) -> bool:
+        try:
+            with self._lock:
+                self.jira.myself()
+        except Exception as e:
+            print_error("jcli failed to authenticate")
+            print_info("Please check your JIRA configuration in ~/.jira.yml")
+            print_error(f"Error: {e}")
+            return False
+        print_success("jcli is connected and ready!")
+        return True
+
+    def list_projects(
+        self,
+        verbose: bool = True,
+        cancel_token: Optional[CancellationToken] = None,
+        on_page: Optional[Callable[[List[str]], None]] = None,
+    ) -> Optional[List[str]]:
+        # JIRA returns every visible project in one response, so on_page is unused
+        if cancel_token is not None:
+            cancel_token.check()
+        with self._lock:
+            projects = format_projects(self.jira.projects())
+        return sorted(projects) or None
+
+    def warm_up(self) -> None:
+        try:
+            self.get_field_id("Epic Name")
+        except Exception:
+            pass
+
+    def get_field_id(self, name: str) -> str:
+        """Map a field display name such as 'Epic Name' to its JIRA field id"""
+        with self._lock:
+            if self._field_ids is None:
+                self._field_ids = {
+                    field["name"]: field["id"] for field in self.jira.fields()
+                }
+        return self._field_ids.get(name, name)
+
+    def create_issue(
+        self,
+        project_key: str,
+        issue_type: str,
+        summary: str,
+        description: str = "",
+        due_date: str = "",
+        priority: str = "",
+        epic_name: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        extra_fields: Optional[Dict[str, str]] = None,
+    ) -> str:
+        fields: Dict[str, Any] = {
+            "project": {"key": project_key},
+            "issuetype": {"name": issue_type},
+            "summary": summary,
+        }
+        if description:
+            fields["description"] = description
+        if due_date:
+            fields["duedate"] = due_date
+        if priority:
+            fields["priority"] = {"name": priority}
+        if epic_name:
+            fields[self.get_field_id("Epic Name")] = epic_name
+        if idempotency_key:
+            fields["labels"] = [get_idempotency_label(idempotency_key)]
+        for name, value in (extra_fields or {}).items():
+            fields[self.get_field_id(name)] = value
+
+        print_info(f"Creating {issue_type} in {project_key} through the jcli connector")
+        with self._lock:
+            issue = self.jira.create_issue(fields=fields)
+        return str(issue.key)
+
+    def find_issue(self, idempotency_key: str) -> Optional[str]:
+        jql = f'labels = "{get_idempotency_label(idempotency_key)}"'
+        with self._lock:
+            issues = self.jira.search_issues(jql, maxResults=1)
+        return str(issues[0].key) if issues else None
+
+    def uses_per_project_meta(self) -> bool:
+        """Check for the createmeta/{project}/issuetypes endpoints
+
+        JIRA Server and Data Center added them in 8.4 and dropped the single
+        createmeta call in 9.0; Cloud only has the single call.
+        """
+        with self._lock:
+            if self._per_project_meta is None:
+                info = self.jira.server_info()
+                version = tuple(info.get("versionNumbers") or ())
+                self._per_project_meta = (
+                    info.get("deploymentType") != "Cloud" and version >= (8, 4)
+                )
+        return self._per_project_meta
+
+    def get_create_meta(self, project_key: str) -> Optional[Dict[str, Any]]:
+        if not self.uses_per_project_meta():
+            with self._lock:
+                data = self.jira.createmeta(
+                    projectKeys=project_key, expand="projects.issuetypes.fields"
+                )
+            return parse_create_meta(data, project_key)
+
+        # Rebuild the single call's response from one request per issue type
+        issue_types = []
+        with self._lock:
+            for issue_type in self.jira.project_issue_types(project_key, maxResults=0):
+                fields = self.jira.project_issue_fields(
+                    project_key, issue_type.id, maxResults=0
+                )
+                issue_types.append(dict(
+                    issue_type.raw,
+                    fields={field.raw["fieldId"]: field.raw for field in fields},
+                ))
+        data = {"projects": [{"key": project_key, "issuetypes": issue_types}]}
+        return parse_create_meta(data, project_key)
+
+    def search_issues(
+        self, jql: str, max_issues: int, start_at: int = 0
+    ) -> IssuePage:
+        with self._lock:
+            issues = self.jira.search_issues(
+                jql,
+                startAt=start_at,
+                maxResults=max_issues,
+                fields="summary,project,updated",
+            )
+        return IssuePage(
+            (
+                {
+                    "key": str(issue.key),
+                    "summary": str(issue.fields.summary or ""),
+                    "project": str(issue.fields.project.key),
+                    "project_name": str(issue.fields.project.name or ""),
+                    "updated": str(issue.fields.updated or ""),
+                }
+                for issue in issues
+            ),
+            total=getattr(issues, "total", None),
+        )
+
+
+def get_backend(jcli_cmd: str, in_process: bool = False) -> JiraBackend:
+    """Get the backend for jcli_cmd, preferring an in-process connector if requested"""
+    if in_process:
+        try:
+            return ConnectorBackend(load_jira_connector(jcli_cmd))
+        except Exception as e:
+            print_info(f"In-process jcli unavailable ({e}), using jcli commands")
+    return SubprocessBackend(jcli_cmd)
+
+
+def get_spool_dir() -> str:
+    """Get the directory holding issue creations waiting to be replayed"""
+    spool_dir = os.path.join(get_config_dir(), "spool")
+    os.makedirs(spool_dir, exist_ok=True)
+    return spool_dir
+
+
+def spool_issue(
+    fields: Dict[str, Any],
+    idempotency_key: str,
+    error: str = "",
+    labelled: bool = True,
+) -> str:
+    """Save an issue creation to the spool, returning the spool file path
+
+    labelled tells whether the creation carries its idempotency label, and so
+    whether a replay can look up an issue an earlier attempt created.
+    """
+    entry = {
+        "idempotency_key": idempotency_key,
+        "labelled": labelled,
+        "fields": fields,
+        "spooled_at": time.time(),
+        "attempts": 0,
+        "last_error": error,
+    }
+    return write_spool_entry(entry)
+
+
+def spool_failed_creation(
+    backend: JiraBackend, fields: Dict[str, Any], idempotency_key: str, error: str
+) -> bool:
+    """Spool a creation JIRA failed, returning whether it was saved
+
+    Whether the creation carried its idempotency label is read from the
+    project's create metadata, as create_issue() decided it.
+    """
+    meta = get_create_meta(backend, fields["project"])
+    labelled = can_label_issue(meta, fields["issue_type"])
+    try:
+        spool_issue(fields, idempotency_key, error, labelled)
+    except OSError as e:
+        print_error(f"Failed to save issue to the spool: {e}")
+        return False
+    return True
+
+
+def write_spool_entry(entry: Dict[str, Any]) -> str:
+    """Atomically write a spool entry named after its idempotency key"""
+    path = os.path.join(get_spool_dir(), f"{entry['idempotency_key']}.json")
+    write_json_atomic(path, entry, indent=2)
+    return path
+
+
+def load_spool() -> List[Dict[str, Any]]:
+    """Load spooled issue creations, oldest first"""
+    import glob
+    import json
+
+    entries = []
+    for path in glob.glob(os.path.join(get_spool_dir(), "*.json")):
+        try:
+            with open(path, "r") as f:
+                entries.append(json.load(f))
+        except (OSError, ValueError) as e:
+            print_error(f"Skipping unreadable spool entry {path}: {e}")
+    return sorted(entries, key=lambda entry: entry.get("spooled_at", 0))
+
+
+def remove_spool_entry(idempotency_key: str) -> None:
+    """Remove a replayed entry from the spool"""
+    try:
+        os.remove(os.path.join(get_spool_dir(), f"{idempotency_key}.json"))
+    except FileNotFoundError:
+        pass
+
+
+def replay_spool_entry(
+    backend: JiraBackend,
+    entry: Dict[str, Any],
+    retries: int = SPOOL_RETRIES,
+    backoff: float = SPOOL_BACKOFF,
+) -> Dict[str, Any]:
+    """Create one spooled issue unless it already exists, retrying with backoff"""
+    import random
+
+    key = entry["idempotency_key"]
+    fields = entry["fields"]
+    # Entries spooled before the label became optional always carried it
+    labelled = entry.get("labelled", True)
+    if not labelled:
+        # A failed attempt may still have created an issue that nothing can
+        # find, so only one attempt is made per drain
+        retries = 0
+    error = ""
+    for attempt in range(retries + 1):
+        if attempt:
+            time.sleep(backoff * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+        entry["attempts"] = entry.get("attempts", 0) + 1
+        try:
+            # A previous attempt may have created the issue before failing
+            existing = backend.find_issue(key) if labelled else None
+            if existing:
+                remove_spool_entry(key)
+                return {"idempotency_key": key, "key": existing, "existing": True}
+
+            output = backend.create_issue(
+                fields["project"],
+                fields["issue_type"],
+                fields["summary"],
+                fields.get("description", ""),
+                fields.get("due_date", ""),
+                fields.get("priority", ""),
+                fields.get("epic_name"),
+                idempotency_key=key if labelled else None,
+                extra_fields=fields.get("extra_fields"),
+            )
+            remove_spool_entry(key)
+            return {"idempotency_key": key, "key": extract_issue_key(output) or output}
+        except Exception as e:
+            error = (getattr(e, "stderr", None) or str(e)).strip()
+
+    entry["last_error"] = error
+    write_spool_entry(entry)
+    return {"idempotency_key": key, "error": error}
+
+
+def drain_spool(
+    backend: JiraBackend,
+    workers: int = SPOOL_WORKERS,
+    retries: int = SPOOL_RETRIES,
+    backoff: float = SPOOL_BACKOFF,
+) -> List[Dict[str, Any]]:
+    """Replay every spooled issue creation concurrently, returning the outcomes"""
+    import concurrent.futures
+
+    entries = load_spool()
+    if not entries:
+        print_info("No spooled issues to create")
+        return []
+
+    print_info(f"Replaying {len(entries)} spooled issue(s)")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(
+            lambda entry: replay_spool_entry(backend, entry, retries, backoff),
+            entries,
+        ))
+
+    for entry, result in zip(entries, results):
+        summary = entry["fields"]["summary"]
+        if "error" in result:
+            print_error(f"{summary}: {result['error']} (kept in spool)")
+        elif result.get("existing"):
+            print_success(f"{summary}: already created as {result['key']}")
+        else:
+            print_success(f"{summary}: created {result['key']}")
+    return results
+
+
+def check_due_date(due_date: str) -> None:
+    """Raise ValueError unless due_date is empty or a YYYY-MM-DD date"""
+    import datetime
+
+    if due_date:
+        try:
+            datetime.datetime.strptime(due_date, "%Y-%m-%d")
+        except ValueError:
+            raise ValueError(f"'due_date' must be YYYY-MM-DD, got {due_date!r}")
+
+
+def normalize_issue_spec(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate an issue spec and fill in the defaults the prompts would use
+
+    Raises ValueError if a required field is missing or malformed.
+    """
+    for field in ("project", "summary"):
+        if not spec.get(field):
+            raise ValueError(f"'{field}' is required")
+
+    issue_type = spec.get("issue_type") or "Task"
+    epic_name = spec.get("epic_name") or None
+    if issue_type == "Epic" and not epic_name:
+        epic_name = spec["summary"]
+
+    due_date = spec.get("due_date") or ""
+    check_due_date(due_date)
+
+    return {
+        "project": extract_project_key(spec["project"]),
+        "issue_type": issue_type,
+        "summary": spec["summary"],
+        "description": spec.get("description") or "",
+        "due_date": due_date,
+        "priority": spec.get("priority") or "",
+        "epic_name": epic_name,
+        "extra_fields": dict(spec.get("extra_fields") or {}),
+    }
+
+
+def create_issue(
+    spec: Dict[str, Any],
+    backend: Optional[JiraBackend] = None,
+    in_process: bool = False,
+    check_existing: bool = True,
+) -> Dict[str, Any]:
+    """Create an issue from a spec without prompting
+
+    spec holds project and summary, and optionally issue_type, description,
+    due_date (YYYY-MM-DD), priority, epic_name, extra_fields (other fields
+    by name), idempotency_key and refresh_metadata. The fields are checked
+    against the project's cached create metadata before anything is sent.
+    The idempotency key is sent as a label only when the metadata shows the
+    issue type has a labels field. When the caller supplies a key that was
+    sent that way, an issue already created with it is returned instead of
+    creating another, unless check_existing is false because the key has
+    never been sent to JIRA. Without a backend, jcli is detected
+    and in_process selects the backend as --in-process does. Returns the
+    created key, the jcli output, whether the key was sent (idempotent) and
+    per-step timings in milliseconds.
+
+    Raises ValueError for an invalid spec, one missing fields the project
+    requires, or a key to check that the issue cannot carry as a label,
+    RuntimeError if jcli cannot be found, and the backend's error if
+    creation fails.
+    """
+    started = time.perf_counter()
+    fields = normalize_issue_spec(spec)
+    timings: Dict[str, float] = {}
+
+    def elapsed_ms(since: float) -> float:
+        return round((time.perf_counter() - since) * 1000, 3)
+
+    if backend is None:
+        step = time.perf_counter()
+        jcli_cmd = detect_jcli_command()
+        if not jcli_cmd:
+            raise RuntimeError("Could not find a working jcli installation")
+        backend = get_backend(jcli_cmd, in_process=in_process)
+        timings["detect_ms"] = elapsed_ms(step)
+
+    step = time.perf_counter()
+    meta = get_create_meta(
+        backend, fields["project"], force_refresh=bool(spec.get("refresh_metadata"))
+    )
+    check_create_meta(meta, fields)
+    timings["metadata_ms"] = elapsed_ms(step)
+
+    # Without the label, an earlier creation cannot be found, so a repeat
+    # would create a duplicate
+    labelled = can_label_issue(meta, fields["issue_type"])
+    idempotency_key = spec.get("idempotency_key")
+    if idempotency_key and check_existing and not labelled:
+        raise ValueError(
+            f"'idempotency_key' cannot be honoured: {fields['issue_type']} issues "
+            f"in {fields['project']} have no known labels field to carry it; "
+            "leave it out to create the issue without one"
+        )
+    if idempotency_key and check_existing:
+        step = time.perf_counter()
+        existing = backend.find_issue(idempotency_key)
+        timings["lookup_ms"] = elapsed_ms(step)
+        if existing:
+            timings["total_ms"] = elapsed_ms(started)
+            return {
+                "key": existing,
+                "output": "",
+                "existing": True,
+                "idempotent": True,
+                "idempotency_key": idempotency_key,
+                "timings": timings,
+            }
+    if not idempotency_key:
+        idempotency_key = new_idempotency_key()
+
+    step = time.perf_counter()
+    with TRACER.span("create_issue"):
+        output = backend.create_issue(
+            fields["project"],
+            fields["issue_type"],
+            fields["summary"],
+            fields["description"],
+            fields["due_date"],
+            fields["priority"],
+            fields["epic_name"],
+            idempotency_key=idempotency_key if labelled else None,
+            extra_fields=fields["extra_fields"],
+        )
+    timings["create_ms"] = elapsed_ms(step)
+    timings["total_ms"] = elapsed_ms(started)
+    return {
+        "key": extract_issue_key(output),
+        "output": output,
+        "existing": False,
+        "idempotent": labelled,
+        "idempotency_key": idempotency_key,
+        "timings": timings,
+    }
+
+
+def load_issue_tree(path: str) -> Dict[str, Any]:
+    """Read a JSON tree spec: an Epic and the child issues to create under it
+
+    Raises ValueError if the file is not a valid tree.
+    """
+    import json
+
+    with open(path, "r") as f:
+        tree = json.load(f)
+    if not isinstance(tree, dict) or not isinstance(tree.get("epic"), dict):
+        raise ValueError("a tree needs an 'epic' object")
+    children = tree.get("children") or []
+    if not isinstance(children, list) or not all(
+        isinstance(child, dict) for child in children
+    ):
+        raise ValueError("'children' must be a list of objects")
+    get_tree_specs(tree)
+    return tree
+
+
+def get_tree_specs(tree: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Expand a tree into issue specs for its Epic and for each child
+
+    The tree's project applies to every node that does not name its own, the
+    Epic gets the Epic description template unless it has a description, and
+    children default to Tasks. The children's Epic link is added at creation.
+
+    Raises ValueError naming the first invalid node.
+    """
+    project = tree.get("project") or ""
+    epic = dict(tree["epic"], issue_type="Epic")
+    epic["project"] = epic.get("project") or project
+    epic["description"] = epic.get("description") or get_epic_description_template()
+    children = [
+        dict(child, project=child.get("project") or epic["project"])
+        for child in tree.get("children") or []
+    ]
+
+    for name, spec in [("epic", epic)] + [
+        (f"child {i}", child) for i, child in enumerate(children, 1)
+    ]:
+        try:
+            normalize_issue_spec(spec)
+        except ValueError as e:
+            raise ValueError(f"{name}: {e}")
+    return epic, children
+
+
+def get_tree_state_file(tree_file: str) -> str:
+    """Get the file recording which nodes of the tree in tree_file exist"""
+    return f"{os.path.splitext(tree_file)[0]}.state.json"
+
+
+def load_tree_state(path: str, tree: Dict[str, Any]) -> Dict[str, Any]:
+    """Load what an earlier run created of this tree, or start afresh
+
+    The state holds an entry for the Epic and for each child with its summary
+    and idempotency key, whether creation was attempted, and the created key
+    or the last error. Entries whose summary no longer matches the tree start
+    afresh, as do all children when the Epic does.
+    """
+    import json
+
+    try:
+        with open(path, "r") as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        saved = {}
+
+    def entry(saved_entry: Any, spec: Dict[str, Any]) -> Dict[str, Any]:
+        if isinstance(saved_entry, dict):
+            if saved_entry.get("summary") == spec["summary"]:
+                return saved_entry
+        return {"summary": spec["summary"], "idempotency_key": new_idempotency_key()}
+
+    epic_spec, child_specs = get_tree_specs(tree)
+    epic = entry(saved.get("epic"), epic_spec)
+    saved_children = (saved.get("children") or []) if epic is saved.get("epic") else []
+    return {
+        "epic": epic,
+        "children": [
+            entry(saved_children[i] if i < len(saved_children) else None, spec)
+            for i, spec in enumerate(child_specs)
+        ],
+    }
+
+
+def create_issue_tree(
+    tree: Dict[str, Any],
+    backend: JiraBackend,
+    state: Optional[Dict[str, Any]] = None,
+    save_state: Optional[Callable[[Dict[str, Any]], None]] = None,
+    workers: int = TREE_WORKERS,
+) -> Dict[str, Any]:
+    """Create a tree's Epic, then all its children concurrently under the Epic
+
+    Nodes that state records as created are skipped, and nodes an earlier run
+    attempted are looked up by idempotency key before being created again, so
+    rerunning after a partial failure only creates what is missing.
+    save_state is called with the state before and after each step. Returns
+    the state, in which every attempted node has its key or its error; the
+    children are not attempted when the Epic cannot be created.
+
+    Raises ValueError for an invalid tree, before anything is created.
+    """
+    import concurrent.futures
+    import threading
+
+    epic_spec, child_specs = get_tree_specs(tree)
+    if state is None:
+        state = {
+            "epic": {"summary": epic_spec["summary"]},
+            "children": [{"summary": spec["summary"]} for spec in child_specs],
+        }
+    for entry in [state["epic"]] + state["children"]:
+        entry.setdefault("idempotency_key", new_idempotency_key())
+    # Guards the state while children finish concurrently
+    lock = threading.Lock()
+
+    def update(entry: Dict[str, Any], **changes: Any) -> None:
+        with lock:
+            entry.update(changes)
+            if save_state:
+                save_state(state)
+
+    def start(entries: List[Dict[str, Any]]) -> List[bool]:
+        # Record the attempt before JIRA can see the key, so that a run that
+        # dies mid-creation looks the issue up next time
+        attempted = [bool(entry.get("attempted")) for entry in entries]
+        with lock:
+            for entry in entries:
+                entry["attempted"] = True
+                entry.pop("error", None)
+            if save_state:
+                save_state(state)
+        return attempted
+
+    def create_node(spec: Dict[str, Any], entry: Dict[str, Any], lookup: bool) -> None:
+        spec = dict(spec, idempotency_key=entry["idempotency_key"])
+        try:
+            result = create_issue(spec, backend, check_existing=lookup)
+        except Exception as e:
+            update(entry, error=(getattr(e, "stderr", None) or str(e)).strip())
+        else:
+            update(entry, key=result["key"] or result["output"].strip())
+
+    epic = state["epic"]
+    if not epic.get("key"):
+        with TRACER.span("create_epic"):
+            create_node(epic_spec, epic, start([epic])[0])
+        if not epic.get("key"):
+            return state
+
+    link_field = tree.get("link_field") or EPIC_LINK_FIELD
+    pending = [
+        (spec, entry)
+        for spec, entry in zip(child_specs, state["children"])
+        if not entry.get("key")
+    ]
+    if pending:
+        lookups = start([entry for _, entry in pending])
+        jobs = []
+        for (spec, entry), lookup in zip(pending, lookups):
+            extra_fields = dict(spec.get("extra_fields") or {})
+            extra_fields[link_field] = epic["key"]
+            jobs.append((dict(spec, extra_fields=extra_fields), entry, lookup))
+        with TRACER.span("create_children", count=len(jobs)):
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda job: create_node(*job), jobs))
+    return state
 
 
 def clear_saved_path():
     """Clear saved jcli path"""
     path_file = get_jcli_path_file()
+    validation_file = get_jcli_validation_file()
+    if os.path.exists(validation_file):
+        os.remove(validation_file)
     if os.path.exists(path_file):
         os.remove(path_file)
         print_success("Cleared saved jcli path")
@@ -468,81 +3142,635 @@ def clear_saved_path():
         print_info("No saved jcli path found")
 
 
-def main():
-    """Main interactive function"""
+class RpcError(Exception):
+    """Error returned to a JSON-RPC client with a specific error code"""
+
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+# JSON-RPC 2.0 error codes; -32000 and below are reserved for the server
+RPC_PARSE_ERROR = -32700
+RPC_INVALID_REQUEST = -32600
+RPC_METHOD_NOT_FOUND = -32601
+RPC_INVALID_PARAMS = -32602
+RPC_SERVER_ERROR = -32000
+RPC_JCLI_NOT_FOUND = -32001
+RPC_AUTH_FAILED = -32002
+
+
+class HelperServer:
+    """Line-delimited JSON-RPC server that keeps jcli state warm between requests"""
+
+    def __init__(
+        self,
+        in_process: bool = False,
+        project_cache_ttl: float = PROJECT_CACHE_TTL,
+        output: Optional[TextIO] = None,
+    ) -> None:
+        import threading
+
+        self.in_process = in_process
+        self.project_cache_ttl = project_cache_ttl
+        # Responses go to the real stdout even while prints are redirected
+        self.output = output or sys.stdout
+        self.jcli_cmd: Optional[str] = None
+        self.backend: Optional[JiraBackend] = None
+        self.authenticated = False
+        self.projects: Optional[List[str]] = None
+        self.running = True
+        self._lock = threading.Lock()
+        self.methods: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "status": self.status,
+            "list_projects": self.list_projects,
+            "get_create_meta": self.get_create_meta,
+            "create_issue": self.create_issue,
+            "shutdown": self.shutdown,
+        }
+
+    def get_backend(self) -> JiraBackend:
+        """Detect jcli and set up the backend on first use"""
+        if self.backend is None:
+            jcli_cmd = detect_jcli_command()
+            if not jcli_cmd:
+                raise RpcError(
+                    RPC_JCLI_NOT_FOUND, "Could not find a working jcli installation"
+                )
+            self.jcli_cmd = jcli_cmd
+            self.backend = get_backend(jcli_cmd, in_process=self.in_process)
+        return self.backend
+
+    def get_authenticated_backend(self) -> JiraBackend:
+        """Get the backend, checking authentication once per server lifetime"""
+        backend = self.get_backend()
+        if not self.authenticated:
+            if not backend.check_auth():
+                raise RpcError(RPC_AUTH_FAILED, "jcli failed to authenticate")
+            self.authenticated = True
+        return backend
+
+    def status(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Report what the server has warmed up so far"""
+        return {
+            "jcli_path": self.jcli_cmd,
+            "backend": type(self.backend).__name__ if self.backend else None,
+            "authenticated": self.authenticated,
+            "projects_loaded": self.projects is not None,
+        }
+
+    def list_projects(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Return available projects, from memory after the first call"""
+        refresh = bool(params.get("refresh"))
+        backend = self.get_authenticated_backend()
+        if refresh or self.projects is None:
+            self.projects = get_cached_projects(
+                backend, ttl=self.project_cache_ttl, force_refresh=refresh
+            )
+        return {"projects": self.projects}
+
+    def get_create_meta(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the issue types and priorities the prompts would offer
+
+        priorities maps each issue type to its options; an empty list means
+        the issue type cannot set a priority.
+        """
+        if not params.get("project"):
+            raise RpcError(RPC_INVALID_PARAMS, "'project' is required")
+        project_key = extract_project_key(params["project"])
+        meta = get_create_meta(
+            self.get_authenticated_backend(),
+            project_key,
+            force_refresh=bool(params.get("refresh")),
+        )
+        issue_types = get_issue_type_options(meta)
+        return {
+            "issue_types": issue_types,
+            "priorities": {
+                issue_type: get_priority_options(project_key, meta, issue_type)
+                for issue_type in issue_types
+            },
+        }
+
+    def create_issue(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Create an issue from a spec through create_issue(spec)
+
+        The spec is checked against the project's create metadata, and one
+        with an idempotency_key returns the issue already created with it.
+        A creation JIRA fails is spooled for --drain-spool, as in the
+        interactive flow.
+        """
+        try:
+            fields = normalize_issue_spec(params)
+        except ValueError as e:
+            raise RpcError(RPC_INVALID_PARAMS, str(e))
+
+        backend = self.get_authenticated_backend()
+        # A key the caller did not supply has never been sent, so needs no lookup
+        spec = dict(params)
+        check_existing = bool(spec.get("idempotency_key"))
+        spec["idempotency_key"] = spec.get("idempotency_key") or new_idempotency_key()
+        try:
+            return create_issue(spec, backend, check_existing=check_existing)
+        except ValueError as e:
+            raise RpcError(RPC_INVALID_PARAMS, str(e))
+        except Exception as e:
+            error = (getattr(e, "stderr", None) or str(e)).strip()
+
+        if is_auth_error(error):
+            self.authenticated = False
+        if not spool_failed_creation(backend, fields, spec["idempotency_key"], error):
+            raise RpcError(RPC_SERVER_ERROR, error)
+        raise RpcError(RPC_SERVER_ERROR, f"{error} (saved to the spool)")
+
+    def shutdown(self, params: Dict[str, Any]) -> None:
+        """Stop serving after this request"""
+        self.running = False
+
+    def warm_up(self) -> None:
+        """Detect jcli, authenticate and load projects ahead of the first request"""
+        with self._lock:
+            try:
+                self.list_projects({})
+            except Exception as e:
+                print_info(f"Warm-up incomplete: {e}")
+
+    def handle_line(self, line: str) -> Optional[Dict[str, Any]]:
+        """Handle one request line, returning None for notifications"""
+        import json
+
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return self.error_response(None, RPC_PARSE_ERROR, f"Parse error: {e}")
+
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return self.error_response(None, RPC_INVALID_REQUEST, "Invalid request")
+
+        request_id = request.get("id")
+        params = request.get("params", {})
+        method = self.methods.get(request["method"])
+        try:
+            if method is None:
+                raise RpcError(
+                    RPC_METHOD_NOT_FOUND, f"Unknown method: {request['method']}"
+                )
+            if not isinstance(params, dict):
+                raise RpcError(RPC_INVALID_PARAMS, "params must be an object")
+            with self._lock, TRACER.span(f"rpc {request['method']}"):
+                result = method(params)
+        except RpcError as e:
+            response = self.error_response(request_id, e.code, str(e))
+        except Exception as e:
+            response = self.error_response(request_id, RPC_SERVER_ERROR, str(e))
+        else:
+            response = {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+        return response if "id" in request else None
+
+    @staticmethod
+    def error_response(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+        """Build a JSON-RPC error response"""
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {"code": code, "message": message},
+        }
+
+    def serve(self, requests: Iterable[str]) -> None:
+        """Answer requests until the input closes or shutdown is called"""
+        import contextlib
+        import json
+        import threading
+
+        # Human-readable progress goes to stderr so stdout only carries responses
+        with contextlib.redirect_stdout(sys.stderr):
+            threading.Thread(target=self.warm_up, daemon=True).start()
+            for line in requests:
+                if not line.strip():
+                    continue
+                response = self.handle_line(line)
+                if response is not None:
+                    self.output.write(json.dumps(response) + "\n")
+                    self.output.flush()
+                if not self.running:
+                    break
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="create_issue_interactive.py",
+        description="JIRA Issue Creation Tool",
+    )
+    parser.add_argument(
+        "--clear-path", action="store_true", help="Clear saved jcli path"
+    )
+    parser.add_argument(
+        "--refresh-projects",
+        action="store_true",
+        help="Ignore the cached project list and fetch it from JIRA",
+    )
+    parser.add_argument(
+        "--project-cache-ttl",
+        type=float,
+        default=PROJECT_CACHE_TTL,
+        metavar="SECONDS",
+        help=f"Refresh cached projects older than this (default: {PROJECT_CACHE_TTL})",
+    )
+    parser.add_argument(
+        "--auth-cache-ttl",
+        type=float,
+        default=AUTH_CACHE_TTL,
+        metavar="SECONDS",
+        help="Skip the JIRA auth check if it passed this recently with the same "
+        f"configuration, 0 to always check (default: {AUTH_CACHE_TTL})",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Reuse one in-process jcli session instead of running jcli commands",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Serve line-delimited JSON-RPC requests on stdin/stdout",
+    )
+    fields = parser.add_argument_group(
+        "non-interactive creation",
+        "Giving --project and --summary creates the issue without prompting",
+    )
+    fields.add_argument("--project", help="Project key, e.g. PROJ")
+    fields.add_argument(
+        "--type", dest="issue_type", default="Task", help="Issue type (default: Task)"
+    )
+    fields.add_argument("--summary", help="Issue summary")
+    fields.add_argument("--description", default="", help="Issue description")
+    fields.add_argument("--due", metavar="YYYY-MM-DD", default="", help="Due date")
+    fields.add_argument("--priority", default="", help="Priority, e.g. Major")
+    fields.add_argument(
+        "--epic-name", help="Epic Name for Epic issues (default: the summary)"
+    )
+    fields.add_argument(
+        "--field",
+        dest="extra_fields",
+        metavar="NAME=VALUE",
+        action="append",
+        default=[],
+        help="Set another field the project requires; may be repeated",
+    )
+    fields.add_argument(
+        "--json", action="store_true", help="Print the result as JSON on stdout"
+    )
+    parser.add_argument(
+        "--refresh-metadata",
+        action="store_true",
+        help="Ignore cached issue types, priorities and required fields",
+    )
+    parser.add_argument(
+        "--tree",
+        metavar="FILE",
+        help="Create the Epic and child issues described in a JSON tree spec, "
+        "resuming an earlier run of the same file",
+    )
+    parser.add_argument(
+        "--drain-spool",
+        action="store_true",
+        help="Create the issues saved to the spool by failed or deferred runs",
+    )
+    parser.add_argument(
+        "--protocol",
+        choices=["text", "jsonl"],
+        default="text",
+        help="Write typed JSON-line events on stdout instead of coloured text",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Append timed spans for each phase and jcli call to FILE as JSON lines",
+    )
+    parser.add_argument(
+        "--trace-summary",
+        action="store_true",
+        help="Print a table of traced spans to stderr on exit",
+    )
+    args = parser.parse_args(argv)
+    if (args.project or args.summary or args.json) and not (
+        args.project and args.summary
+    ):
+        parser.error("--project and --summary are required to create without prompts")
+    for field in args.extra_fields:
+        if "=" not in field:
+            parser.error(f"--field expects NAME=VALUE, got {field!r}")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point"""
     # Check for command line arguments
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "--clear-path":
-            clear_saved_path()
-            return 0
-        elif sys.argv[1] in ["--help", "-h"]:
-            print("JIRA Issue Creation Tool")
-            print("Usage: create_issue_interactive.py [--clear-path] [--help]")
-            print("")
-            print("Options:")
-            print("  --clear-path  Clear saved jcli path")
-            print("  --help        Show this help message")
+    args = parse_args(argv)
+    if args.clear_path:
+        clear_saved_path()
+        return 0
+
+    if args.trace:
+        TRACER.enable(args.trace)
+    JCLI_GUARD.load(get_jcli_latency_file())
+    try:
+        if args.serve:
+            HelperServer(args.in_process, args.project_cache_ttl).serve(sys.stdin)
             return 0
+        with TRACER.span("total"):
+            if args.protocol == "jsonl":
+                return run_with_events(args)
+            return dispatch(args)
+    finally:
+        JCLI_GUARD.save()
+        if args.trace_summary:
+            print(TRACER.format_summary(), file=sys.stderr)
+
+
+def dispatch(args: argparse.Namespace) -> int:
+    """Run the mode selected on the command line"""
+    if args.drain_spool:
+        return run_drain_spool(args)
+    if args.tree:
+        return run_tree(args)
+    if args.project:
+        return run_non_interactive(args)
+    return run_interactive(args)
+
+
+def run_with_events(args: argparse.Namespace) -> int:
+    """Run with stdout reserved for --protocol jsonl events
+
+    Anything printed other than through the event helpers goes to stderr,
+    and a result event is always the last event written.
+    """
+    import contextlib
+
+    EVENTS.enable(sys.stdout)
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            code = dispatch(args)
+        except (EOFError, KeyboardInterrupt):
+            EVENTS.emit("result", success=False, error="Input closed")
+            return 1
+    if not EVENTS.result_sent:
+        EVENTS.emit("result", success=code == 0, exit_code=code)
+    return code
+
+
+def run_non_interactive(args: argparse.Namespace) -> int:
+    """Create the issue described by the command line flags without prompting"""
+    import contextlib
+    import json
+
+    spec = {
+        "project": args.project,
+        "issue_type": args.issue_type,
+        "summary": args.summary,
+        "description": args.description,
+        "due_date": args.due,
+        "priority": args.priority,
+        "epic_name": args.epic_name,
+        "extra_fields": dict(field.split("=", 1) for field in args.extra_fields),
+        "refresh_metadata": args.refresh_metadata,
+        # Generated here so a failed creation is spooled under the key it sent
+        "idempotency_key": new_idempotency_key(),
+    }
+    # With --json, progress goes to stderr so stdout only carries the result
+    output = sys.stdout
+    redirect = contextlib.redirect_stdout(sys.stderr) if args.json else None
+    result: Optional[Dict[str, Any]] = None
+    spooled = False
+    with redirect or contextlib.nullcontext():
+        step = time.perf_counter()
+        jcli_cmd = detect_jcli_command()
+        backend = None
+        if jcli_cmd:
+            backend = get_backend(jcli_cmd, in_process=args.in_process)
+        detect_ms = round((time.perf_counter() - step) * 1000, 3)
+        if backend is None:
+            error = "Could not find a working jcli installation"
+        else:
+            try:
+                result = create_issue(spec, backend, check_existing=False)
+            except ValueError as e:
+                error = str(e)
+            except Exception as e:
+                error = (getattr(e, "stderr", None) or str(e)).strip()
+                spooled = spool_failed_creation(
+                    backend, normalize_issue_spec(spec), spec["idempotency_key"], error
+                )
+
+    if result is None:
+        if args.json:
+            output.write(json.dumps({"error": error, "spooled": spooled}) + "\n")
+        else:
+            print_error(f"Failed to create issue: {error}")
+            if spooled:
+                print_info(
+                    "Issue saved to the spool; run with --drain-spool to retry it"
+                )
+        return 1
+
+    result["timings"] = {"detect_ms": detect_ms, **result["timings"]}
+    result["timings"]["total_ms"] = round(result["timings"]["total_ms"] + detect_ms, 3)
+    if args.json:
+        output.write(json.dumps(result) + "\n")
+    else:
+        print_success(f"Issue created successfully! {result['key'] or ''}".rstrip())
+        print(result["output"])
+    return 0
+
+
+def run_drain_spool(args: argparse.Namespace) -> int:
+    """Replay spooled issue creations, returning 1 if any are left"""
+    jcli_cmd = find_jcli_command()
+    if not jcli_cmd:
+        print_error("Could not find a working jcli installation")
+        return 1
+
+    backend = get_backend(jcli_cmd, in_process=args.in_process)
+    if not check_auth_cached(backend, args.auth_cache_ttl):
+        return 1
+
+    results = drain_spool(backend)
+    return 1 if any("error" in result for result in results) else 0
+
+
+def run_tree(args: argparse.Namespace) -> int:
+    """Create the issue tree in --tree, returning 1 if any node is missing"""
+    try:
+        tree = load_issue_tree(args.tree)
+    except (OSError, ValueError) as e:
+        print_error(f"Cannot read issue tree {args.tree}: {e}")
+        return 1
+
+    jcli_cmd = detect_jcli_command()
+    if not jcli_cmd:
+        print_error("Could not find a working jcli installation")
+        return 1
+    backend = get_backend(jcli_cmd, in_process=args.in_process)
+
+    state_file = get_tree_state_file(args.tree)
+    state = load_tree_state(state_file, tree)
+    print_header("ISSUE TREE")
+    print_info(f"Creating an Epic with {len(state['children'])} child issue(s)")
+    state = create_issue_tree(
+        tree, backend, state, save_state=lambda s: write_json_atomic(state_file, s)
+    )
+
+    epic = state["epic"]
+    if not epic.get("key"):
+        print_error(f"Failed to create Epic '{epic['summary']}': {epic['error']}")
+        print_info(f"Run again with --tree {args.tree} to retry")
+        return 1
+    print_field("Epic", f"{epic['key']} {epic['summary']}")
+    failed = [entry for entry in state["children"] if not entry.get("key")]
+    for entry in state["children"]:
+        if entry.get("key"):
+            print_success(f"{entry['key']}: {entry['summary']}")
+        else:
+            print_error(f"{entry['summary']}: {entry.get('error', 'not created')}")
+
+    if failed:
+        print_error(
+            f"{len(failed)} of {len(state['children'])} child issue(s) were not "
+            f"created; run again with --tree {args.tree} to retry them"
+        )
+        return 1
+    print_success(
+        f"Created {epic['key']} with {len(state['children'])} child issue(s)"
+    )
+    return 0
+
+
+def run_interactive(args: argparse.Namespace) -> int:
+    """Main interactive function"""
+    import concurrent.futures
+    import subprocess
+    import threading
     
     print_header("JIRA Issue Creation Tool")
     print_info("This tool will guide you through creating a new JIRA issue.")
     print_info("Tip: Use --clear-path to reset saved jcli location")
     
     # Find jcli command location
-    jcli_cmd = find_jcli_command()
+    with TRACER.span("find_jcli_command"):
+        jcli_cmd = find_jcli_command()
     if not jcli_cmd:
         print_error("Could not find a working jcli installation")
         return 1
     
+    with TRACER.span("get_backend"):
+        backend = get_backend(jcli_cmd, in_process=args.in_process)
+    
+    # Start project discovery while the connection is being tested
+    cancel_token = CancellationToken()
+    partial_projects: List[List[str]] = []
+    projects_available = threading.Event()
+
+    def on_page(projects: List[str]) -> None:
+        partial_projects[:] = [projects]
+        projects_available.set()
+
+    def discover_projects() -> List[str]:
+        with TRACER.span("get_available_projects"):
+            return get_cached_projects(
+                backend,
+                args.project_cache_ttl,
+                args.refresh_projects,
+                cancel_token,
+                on_page=on_page,
+            )
+
+    # Discovery may still be paging when the user picks from a partial list;
+    # it must not keep the process alive after the issue is created
+    projects_future = start_daemon_task(discover_projects)
+    projects_future.add_done_callback(lambda future: projects_available.set())
+    
     # Test jcli availability
     print_info("Testing jcli connection...")
-    try:
-        # Test if jcli command is available and working
-        result = subprocess.run(
-            [jcli_cmd, "myself"], 
-            capture_output=True, 
-            text=True, 
-            timeout=10
-        )
-        
-        if result.returncode == 0:
-            print_success("jcli is connected and ready!")
-        else:
-            print_error("jcli failed to authenticate")
-            print_info("Please check your JIRA configuration in ~/.jira.yml")
-            if result.stderr:
-                print_error(f"Error: {result.stderr.strip()}")
-            return 1
-        
-    except subprocess.TimeoutExpired:
-        print_error("jcli command timed out")
-        print_info("Please check your JIRA configuration and network connection")
-        return 1
-    except Exception as e:
-        print_error(f"Failed to test jcli: {e}")
-        print_info("Please check your JIRA configuration and network connection")
+    with TRACER.span("check_auth"):
+        authenticated = check_auth_cached(backend, args.auth_cache_ttl)
+    if not authenticated:
+        # No point finishing discovery for a session that cannot log in
+        cancel_token.cancel()
         return 1
     
+    # Fetch per-project data in the background from the moment a project is
+    # known, so that the prompts after project selection find it ready. The
+    # fetches run on daemon threads, so exiting never waits for them.
+    meta_futures: Dict[str, concurrent.futures.Future] = {}
+
+    def fetch_create_meta(project_key: str) -> Optional[Dict[str, Any]]:
+        with TRACER.span("get_create_meta", project=project_key):
+            return get_create_meta(
+                backend, project_key, force_refresh=args.refresh_metadata
+            )
+
+    def prefetch_create_meta(project_key: str) -> concurrent.futures.Future:
+        if project_key not in meta_futures:
+            meta_futures[project_key] = start_daemon_task(
+                fetch_create_meta, project_key
+            )
+        return meta_futures[project_key]
+
     # Get project selection
     print_header("PROJECT SELECTION")
-    available_projects = get_available_projects(jcli_cmd)
-    
-    # Find default project (prefer NSTL if available)
-    default_index = 0
-    for i, proj in enumerate(available_projects):
-        if proj.startswith("NSTL") or proj == "NSTL":
-            default_index = i
-            break
-    
-    selected_project = select_from_list(available_projects, "Select project:", default_index)
+    with TRACER.span("wait_for_projects"):
+        projects_available.wait()
+    more_projects = "More projects... (wait for discovery to finish)"
+    selected_project = more_projects
+    while selected_project == more_projects:
+        if projects_future.done() or not partial_projects:
+            available_projects = projects_future.result()
+        else:
+            # Offer what the first pages found while discovery carries on
+            available_projects = partial_projects[0] + [more_projects]
+            print_info(f"Showing {len(partial_projects[0])} projects found so far")
+
+        # Find default project (prefer NSTL if available)
+        default_index = 0
+        for i, proj in enumerate(available_projects):
+            if proj.startswith("NSTL") or proj == "NSTL":
+                default_index = i
+                break
+
+        # Most runs keep the default project, so start on it while the user reads
+        prefetch_create_meta(extract_project_key(available_projects[default_index]))
+
+        selected_project = select_from_list(
+            available_projects, "Select project:", default_index
+        )
+        if selected_project == more_projects:
+            print_info("Waiting for project discovery to finish...")
+            projects_future.result()
     
     # Extract project key from "KEY - Name" format, or use as-is if it's just the key
     project_key = extract_project_key(selected_project)
-    
-    # Get issue type
+
+    # Sync recent issue summaries for duplicate detection while the user types
+    def sync_summaries() -> Dict[str, str]:
+        with TRACER.span("sync_summary_index", project=project_key):
+            return sync_summary_index(backend, project_key)
+
+    meta_future = prefetch_create_meta(project_key)
+    summaries_future = start_daemon_task(sync_summaries)
+    start_daemon_task(backend.warm_up)
+
+    # Get issue type, from the project's metadata only if it has arrived: the
+    # default types are better than keeping the user waiting for the first prompt
     print_header("ISSUE TYPE")
-    issue_types = ["Task", "Epic"]
-    issue_type = select_from_list(issue_types, "Select issue type:", 0)
+    issue_types = get_issue_type_options(
+        meta_future.result() if meta_future.done() else None
+    )
+    default_type = issue_types.index("Task") if "Task" in issue_types else 0
+    issue_type = select_from_list(issue_types, "Select issue type:", default_type)
     
     # Get summary
     print_header("ISSUE SUMMARY")
@@ -563,66 +3791,139 @@ def main():
     
     # Get due date
     due_date = display_calendar()
+
+    # Priorities and required fields for this project, fetched while the user
+    # typed
+    with TRACER.span("wait_for_create_meta"):
+        create_meta = meta_future.result()
     
-    # Get priority
-    print_header("PRIORITY SELECTION")
-    priority_options = get_priority_options(project_key)
-    priority = select_from_list(priority_options, "Select priority:", 3)  # Default to Normal
+    # Get priority, unless the project does not let this issue type set one
+    priority = ""
+    priority_options = get_priority_options(project_key, create_meta, issue_type)
+    if priority_options:
+        print_header("PRIORITY SELECTION")
+        # Default to Normal
+        default_priority = (
+            priority_options.index("Normal") if "Normal" in priority_options else 0
+        )
+        priority = select_from_list(
+            priority_options, "Select priority:", default_priority
+        )
+
+    fields: Dict[str, Any] = {
+        "project": project_key,
+        "issue_type": issue_type,
+        "summary": summary,
+        "description": description,
+        "due_date": due_date,
+        "priority": priority,
+        "epic_name": epic_name,
+    }
+
+    # Ask for anything else the project requires, so JIRA does not reject it
+    extra_fields: Dict[str, str] = {}
+    missing_fields = get_missing_required_fields(create_meta, issue_type, fields)
+    if missing_fields:
+        print_header("REQUIRED FIELDS")
+        print_info(f"{project_key} requires these fields for a {issue_type}.")
+        for name in missing_fields:
+            value = get_user_input(f"Enter {name}")
+            while not value:
+                print_error(f"{name} is required!")
+                value = get_user_input(f"Enter {name}")
+            extra_fields[name] = value
+    fields["extra_fields"] = extra_fields
     
     # Confirm details
     print_header("CONFIRMATION")
-    print(f"{Colors.OKBLUE}Project:{Colors.ENDC} {selected_project}")
-    print(f"{Colors.OKBLUE}Issue Type:{Colors.ENDC} {issue_type}")
-    print(f"{Colors.OKBLUE}Summary:{Colors.ENDC} {summary}")
-    print(f"{Colors.OKBLUE}Description:{Colors.ENDC} {description or '(none)'}")
+    print_field("Project", selected_project)
+    print_field("Issue Type", issue_type)
+    print_field("Summary", summary)
+    print_field("Description", description or '(none)')
     if epic_name:
-        print(f"{Colors.OKBLUE}Epic Name:{Colors.ENDC} {epic_name}")
-    print(f"{Colors.OKBLUE}Due Date:{Colors.ENDC} {due_date or '(none)'}")
-    print(f"{Colors.OKBLUE}Priority:{Colors.ENDC} {priority}")
+        print_field("Epic Name", epic_name)
+    print_field("Due Date", due_date or '(none)')
+    print_field("Priority", priority or '(none)')
+    for name, value in extra_fields.items():
+        print_field(name, value)
+
+    # Warn about likely duplicates from the local index, without asking JIRA
+    with TRACER.span("find_duplicates"):
+        if summaries_future.done():
+            summaries = summaries_future.result()
+        else:
+            summaries = get_mirrored_summaries(project_key)
+        similar = SummaryIndex(summaries).similar(summary)
+    if similar:
+        print_header("POSSIBLE DUPLICATES")
+        for key, other_summary, score in similar:
+            print_field(key, f"{other_summary} ({score:.0%} similar)")
     
-    confirm = get_user_input("\nCreate this issue? (y/n)", "y").lower()
+    idempotency_key = new_idempotency_key()
+    labelled = can_label_issue(create_meta, issue_type)
+
+    confirm = get_user_input(
+        "\nCreate this issue? (y/n, s to save it for later)", "y"
+    ).lower()
+    if confirm in ['s', 'save']:
+        spool_issue(fields, idempotency_key, labelled=labelled)
+        print_success("Issue saved to the spool")
+        print_info("Run with --drain-spool to create it")
+        EVENTS.emit("result", success=True, spooled=True)
+        return 0
     if confirm not in ['y', 'yes']:
         print_info("Issue creation cancelled.")
+        EVENTS.emit("result", success=True, cancelled=True)
         return 0
     
-    # Build the command
-    cmd = [
-        jcli_cmd, "issues", "create",
-        "--project", project_key,
-        "--issue-type", issue_type,
-        "--summary", summary,
-    ]
-    
-    if description:
-        cmd.extend(["--description", description])
-    
-    if due_date:
-        cmd.extend(["--set-field", "duedate", due_date])
-    
-    if priority:
-        cmd.extend(["--set-field", "priority", priority])
-    
-    # Add Epic Name field if it's an Epic issue
-    if epic_name:
-        cmd.extend(["--set-field", "Epic Name", epic_name])
-    
-    # Execute the command
+    # Create the issue
     print_header("CREATING ISSUE")
-    print_info(f"Running: {' '.join(cmd)}")
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        with TRACER.span("create_issue"):
+            output = backend.create_issue(
+                project_key,
+                issue_type,
+                summary,
+                description,
+                due_date,
+                priority,
+                epic_name,
+                idempotency_key=idempotency_key if labelled else None,
+                extra_fields=extra_fields,
+            )
         print_success("Issue created successfully!")
-        print(result.stdout)
+        print(output)
+        created_key = extract_issue_key(output)
+        if created_key:
+            # Let later runs flag this issue before the next sync picks it up
+            mirror_created_issue(created_key, project_key, summary)
+        EVENTS.emit("result", success=True, key=created_key, output=output)
         return 0
     except subprocess.CalledProcessError as e:
         print_error(f"Failed to create issue: {e}")
         if e.stderr:
             print(f"Error output: {e.stderr}")
-        return 1
+        error = (e.stderr or str(e)).strip()
     except Exception as e:
         print_error(f"Unexpected error: {e}")
-        return 1
+        error = str(e)
+
+    # The auth check may have been skipped; now find out if credentials are to blame
+    if is_auth_error(error):
+        forget_auth_check()
+        backend.check_auth()
+
+    # Keep what the user typed so the creation can be replayed later
+    spooled = False
+    try:
+        spool_issue(fields, idempotency_key, error, labelled)
+        spooled = True
+        print_info("Issue saved to the spool; run with --drain-spool to retry it")
+    except OSError as e:
+        print_error(f"Failed to save issue to the spool: {e}")
+    EVENTS.emit("result", success=False, error=error, spooled=spooled)
+    return 1
 
 
 if __name__ == "__main__":
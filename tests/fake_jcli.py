@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Fake jcli executable for benchmarks and end-to-end tests.
+
+Behaviour is read from the JSON file named by FAKE_JCLI_CONFIG:
+
+    {
+        "commands": {
+            "--version": {"latency": 0.05},
+            "myself": {"latency": 0.2, "fail_rate": 0.0},
+            "issues list": {"latency": 0.3},
+            "issues create": {"latency": 0.2, "exit_code": 1, "stderr": "boom"}
+        },
+        "projects": [["PROJ", "Project"]],
+        "issue_count": 20
+    }
+
+Each command sleeps for its latency, then fails with `exit_code`/`stderr`
+when `exit_code` is set or a random draw falls under `fail_rate`.
+`issues list` pages through `issue_count` issues (honouring --max-issues and
+--start-at, and reporting the total that matched) whose projects cycle
+through `projects`. Given
+`--jql 'labels = "X"'` it returns the created issues labelled X, and given
+`--jql 'project = "X" ORDER BY updated DESC'` the issues of project X, newest
+first. Queries with an `updated >=` clause only match created issues, which
+are newer than all the others. Created issues are recorded in the JSONL file named by
+FAKE_JCLI_ISSUES. Every invocation is appended to the JSONL file named by
+FAKE_JCLI_LOG with its command, start/end wall-clock times and exit code.
+"""
+import json
+import os
+import random
+import sys
+import time
+
+DEFAULT_PROJECTS = [["PROJ", "Project"], ["NSTL", "Nested Tasks"]]
+DEFAULT_ISSUE_COUNT = 20
+
+
+def load_config():
+    """Load the fake's configuration, or an empty one"""
+    path = os.environ.get("FAKE_JCLI_CONFIG")
+    if not path:
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def command_name(argv):
+    """Name the invoked command, e.g. 'issues create' or '--version'"""
+    if argv[:1] == ["issues"] and len(argv) > 1:
+        return f"issues {argv[1]}"
+    return argv[0] if argv else ""
+
+
+def next_issue_number(config):
+    """Allocate a sequential issue number shared by all fake invocations"""
+    counter = os.environ.get("FAKE_JCLI_COUNTER")
+    if not counter:
+        return random.randint(1, 9999)
+    try:
+        with open(counter, "r") as f:
+            number = int(f.read() or 0) + 1
+    except OSError:
+        number = 1
+    with open(counter, "w") as f:
+        f.write(str(number))
+    return number
+
+
+def load_created_issues():
+    """Read the issues created so far from FAKE_JCLI_ISSUES"""
+    path = os.environ.get("FAKE_JCLI_ISSUES")
+    if not path or not os.path.exists(path):
+        return []
+    with open(path, "r") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def record_created_issue(key, summary, labels):
+    """Remember a created issue so --jql lookups can find it"""
+    path = os.environ.get("FAKE_JCLI_ISSUES")
+    if path:
+        with open(path, "a") as f:
+            issue = {"key": key, "summary": summary, "labels": labels}
+            f.write(json.dumps(issue) + "\n")
+
+
+def generated_issue(i, projects):
+    """The i-th (0-based) pre-existing issue"""
+    key, project_name = projects[i % len(projects)]
+    return {
+        "key": f"{key}-{i + 1}",
+        "fields": {
+            "summary": f"Issue {i + 1}",
+            "project": {"key": key, "name": project_name},
+            "updated": "2024-01-01T00:00:00.000+0000",
+        },
+    }
+
+
+def matches_jql(jql, key, labels):
+    """Check an issue against the label and project queries the fake supports"""
+    project = key.rsplit("-", 1)[0]
+    if jql.startswith((f'project = "{project}"', "updated >=")):
+        return True
+    return any(jql == f'labels = "{label}"' for label in labels)
+
+
+def run(argv, config):
+    """Produce (exit code, stdout, stderr) for a command"""
+    name = command_name(argv)
+    if name == "--version":
+        return 0, "jcli 0.0.0-fake\n", ""
+    if name == "myself":
+        return 0, json.dumps({"name": "fake", "displayName": "Fake User"}) + "\n", ""
+    max_issues = 10
+    if "--max-issues" in argv:
+        max_issues = int(argv[argv.index("--max-issues") + 1])
+    start_at = 0
+    if "--start-at" in argv:
+        start_at = int(argv[argv.index("--start-at") + 1])
+    issue_count = config.get("issue_count", DEFAULT_ISSUE_COUNT)
+    projects = config.get("projects", DEFAULT_PROJECTS)
+    if name == "issues list" and "--jql" in argv:
+        jql = argv[argv.index("--jql") + 1]
+        issues = [
+            {
+                "key": issue["key"],
+                "fields": {"summary": issue["summary"], "labels": issue["labels"]},
+            }
+            for issue in reversed(load_created_issues())
+            if matches_jql(jql, issue["key"], issue["labels"])
+        ]
+        for i in reversed(range(issue_count)):
+            issue = generated_issue(i, projects)
+            if "updated >=" not in jql and matches_jql(jql, issue["key"], []):
+                issues.append(issue)
+        page = issues[start_at:start_at + max_issues]
+        return 0, json.dumps({"total": len(issues), "issues": page}) + "\n", ""
+    if name == "issues list":
+        end = min(start_at + max_issues, issue_count)
+        issues = [generated_issue(i, projects) for i in range(start_at, end)]
+        return 0, json.dumps({"total": issue_count, "issues": issues}) + "\n", ""
+    if name == "issues create":
+        project = argv[argv.index("--project") + 1] if "--project" in argv else "PROJ"
+        key = f"{project}-{next_issue_number(config)}"
+        labels = [
+            argv[i + 2]
+            for i, arg in enumerate(argv[:-2])
+            if arg == "--set-field" and argv[i + 1] == "labels"
+        ]
+        summary = argv[argv.index("--summary") + 1] if "--summary" in argv else ""
+        record_created_issue(key, summary, labels)
+        return 0, f"Created issue {key}\n", ""
+    return 2, "", f"fake jcli: unknown command {' '.join(argv)}\n"
+
+
+def main(argv):
+    """Entry point"""
+    started = time.time()
+    config = load_config()
+    name = command_name(argv)
+    behaviour = config.get("commands", {}).get(name, {})
+
+    time.sleep(behaviour.get("latency", 0))
+
+    if behaviour.get("exit_code") or random.random() < behaviour.get("fail_rate", 0):
+        code, stdout, stderr = (
+            behaviour.get("exit_code") or 1,
+            "",
+            behaviour.get("stderr", "fake failure\n"),
+        )
+    else:
+        code, stdout, stderr = run(argv, config)
+
+    sys.stdout.write(stdout)
+    sys.stderr.write(stderr)
+
+    log = os.environ.get("FAKE_JCLI_LOG")
+    if log:
+        with open(log, "a") as f:
+            f.write(json.dumps({
+                "command": name,
+                "argv": argv,
+                "start": started,
+                "end": time.time(),
+                "exit_code": code,
+            }) + "\n")
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,360 @@
+"""
+Local stand-in for the JIRA REST API, for tests and benchmarks of the
+in-process connector path.
+
+FakeJiraServer serves the endpoints jcli's connector uses, on 127.0.0.1 in a
+background thread:
+
+    GET  /rest/api/2/serverInfo          "serverInfo" (no login needed)
+    GET  /rest/api/2/myself              "myself"
+    GET  /rest/api/2/project             "project"
+    GET  /rest/api/2/field               "field"
+    GET  /rest/api/2/issue/createmeta    "createmeta"
+    GET  /rest/api/2/issue/createmeta/P/issuetypes       "issuetypes"
+    GET  /rest/api/2/issue/createmeta/P/issuetypes/ID    "issuetype fields"
+    GET  /rest/api/2/search              "search"
+    POST /rest/api/2/issue               "create issue"
+    GET  /rest/api/2/issue/KEY           "issue"
+
+Behaviour is set per endpoint name:
+
+    FakeJiraServer(endpoints={
+        "search": {"latency": 0.2},
+        "create issue": {"latency": 0.3, "error_rate": 0.1},
+        "myself": {"status": 401},
+    })
+
+Each request sleeps for its endpoint's latency, then fails with `status`
+when it is set or a random draw falls under `error_rate` (503 by default).
+Requests need HTTP basic auth matching `users`. Searches return at most
+`max_results` issues per page whatever maxResults asks for, as JIRA does,
+and understand `project = "X"`, `labels = "X"` and `updated >=` (which only
+matches created issues, newer than the `issue_count` generated ones).
+`version` is the JIRA version serverInfo reports; from 9.0 the single
+createmeta call is gone, as python-jira expects, and only the per-project
+issuetypes endpoints answer. Every
+request is recorded in `requests` with its endpoint, start/end times and
+status, and `peak_concurrency` is the most requests ever served at once.
+"""
+import base64
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_PROJECTS = [["PROJ", "Project"], ["NSTL", "Nested Tasks"]]
+DEFAULT_ISSUE_COUNT = 20
+DEFAULT_MAX_RESULTS = 50
+DEFAULT_USERS = {"fake": "secret"}
+DEFAULT_VERSION = (8, 20, 0)
+EPIC_NAME_FIELD = "customfield_10011"
+ISSUE_TYPE_IDS = {"Task": "10001", "Epic": "10000"}
+
+API = "/rest/api/2/"
+
+
+class FakeJiraServer:
+    """A JIRA REST stand-in listening on a free local port"""
+
+    def __init__(
+        self,
+        endpoints=None,
+        projects=None,
+        issue_count=DEFAULT_ISSUE_COUNT,
+        max_results=DEFAULT_MAX_RESULTS,
+        users=None,
+        version=DEFAULT_VERSION,
+    ):
+        self.endpoints = endpoints or {}
+        self.projects = projects or DEFAULT_PROJECTS
+        self.issue_count = issue_count
+        self.max_results = max_results
+        self.users = DEFAULT_USERS if users is None else users
+        self.version = tuple(version)
+        self.created = []
+        self.requests = []
+        self.peak_concurrency = 0
+        self._active = 0
+        self._lock = threading.Lock()
+        self._httpd = None
+
+    @property
+    def url(self):
+        """Base URL to give a JIRA client"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Start serving in a daemon thread"""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.handle(self, "GET")
+
+            def do_POST(self):
+                server.handle(self, "POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        """Stop serving"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def endpoint(self, method, path):
+        """Name the endpoint for a request path, e.g. 'search' or 'create issue'"""
+        name = path[len(API):] if path.startswith(API) else ""
+        if method == "POST":
+            return "create issue" if name == "issue" else f"POST {name}"
+        if name.startswith("issue/createmeta/"):
+            parts = name.split("/")
+            return "issuetypes" if len(parts) == 4 else "issuetype fields"
+        if name.startswith("issue/") and name != "issue/createmeta":
+            return "issue"
+        return name.replace("issue/", "")
+
+    def authorized(self, header):
+        """Check an Authorization header against the configured users"""
+        if not header or not header.startswith("Basic "):
+            return False
+        user, _, password = base64.b64decode(header[6:]).decode().partition(":")
+        return self.users.get(user) == password
+
+    def handle(self, request, method):
+        """Serve one request, recording its timing and status"""
+        url = urlparse(request.path)
+        name = self.endpoint(method, url.path)
+        behaviour = self.endpoints.get(name, {})
+        started = time.time()
+        with self._lock:
+            self._active += 1
+            self.peak_concurrency = max(self.peak_concurrency, self._active)
+        try:
+            time.sleep(behaviour.get("latency", 0))
+            length = int(request.headers.get("Content-Length") or 0)
+            body = json.loads(request.rfile.read(length) or "{}") if length else {}
+            params = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+            if name != "serverInfo" and not self.authorized(
+                request.headers.get("Authorization")
+            ):
+                status, data = 401, {"errorMessages": ["Unauthorized"]}
+            elif behaviour.get("status"):
+                status, data = behaviour["status"], {"errorMessages": ["Fake error"]}
+            elif random.random() < behaviour.get("error_rate", 0):
+                status, data = 503, {"errorMessages": ["Service Unavailable"]}
+            else:
+                status, data = self.respond(name, url.path, params, body)
+        finally:
+            with self._lock:
+                self._active -= 1
+
+        payload = json.dumps(data).encode()
+        request.send_response(status)
+        request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(payload)))
+        request.end_headers()
+        request.wfile.write(payload)
+        with self._lock:
+            self.requests.append({
+                "endpoint": name,
+                "params": params,
+                "start": started,
+                "end": time.time(),
+                "status": status,
+            })
+
+    def respond(self, name, path, params, body):
+        """Produce (status, JSON body) for a successful request"""
+        if name == "serverInfo":
+            return 200, {
+                "baseUrl": self.url,
+                "version": ".".join(map(str, self.version)),
+                "versionNumbers": list(self.version),
+                "deploymentType": "Server",
+            }
+        if name == "myself":
+            return 200, {"name": "fake", "displayName": "Fake User"}
+        if name == "project":
+            return 200, [
+                {"id": str(i), "key": key, "name": project_name}
+                for i, (key, project_name) in enumerate(self.projects, 10000)
+            ]
+        if name == "field":
+            return 200, [
+                {"id": "summary", "name": "Summary", "custom": False},
+                {"id": EPIC_NAME_FIELD, "name": "Epic Name", "custom": True},
+                {"id": "customfield_10014", "name": "Epic Link", "custom": True},
+            ]
+        if name == "createmeta":
+            if self.version >= (9, 0, 0):
+                return 404, {"errorMessages": ["createmeta was removed in 9.0"]}
+            return 200, self.create_meta(params.get("projectKeys", ""))
+        if name in ("issuetypes", "issuetype fields"):
+            return self.project_meta(path.split("/")[6:])
+        if name == "search":
+            return 200, self.search(params)
+        if name == "create issue":
+            return self.create(body.get("fields") or {})
+        if name == "issue":
+            return self.issue_by_key(path.rsplit("/", 1)[1])
+        return 404, {"errorMessages": [f"No fake for {name}"]}
+
+    def generated_issue(self, i):
+        """The i-th (0-based) pre-existing issue"""
+        key, project_name = self.projects[i % len(self.projects)]
+        return {
+            "id": str(20000 + i),
+            "key": f"{key}-{i + 1}",
+            "fields": {
+                "summary": f"Issue {i + 1}",
+                "project": {"key": key, "name": project_name},
+                "labels": [],
+                "updated": "2024-01-01T00:00:00.000+0000",
+            },
+        }
+
+    def matches(self, jql, issue, created):
+        """Check an issue against the queries the fake understands"""
+        fields = issue["fields"]
+        if jql.startswith("updated >="):
+            return created
+        match = re.match(r'project\s*=\s*"?([A-Z0-9_]+)"?', jql)
+        if match:
+            return fields["project"]["key"] == match.group(1)
+        match = re.match(r'labels\s*=\s*"?([^"\s]+)"?', jql)
+        if match:
+            return match.group(1) in fields["labels"]
+        return not jql.strip() or jql.strip().upper().startswith("ORDER BY")
+
+    def search(self, params):
+        """One page of the issues matching jql, newest first"""
+        jql = params.get("jql", "")
+        with self._lock:
+            created = list(reversed(self.created))
+        issues = [issue for issue in created if self.matches(jql, issue, True)]
+        issues += [
+            issue
+            for issue in map(self.generated_issue, reversed(range(self.issue_count)))
+            if self.matches(jql, issue, False)
+        ]
+        start_at = int(params.get("startAt", 0))
+        max_results = min(int(params.get("maxResults", 50)), self.max_results)
+        return {
+            "startAt": start_at,
+            "maxResults": max_results,
+            "total": len(issues),
+            "issues": issues[start_at:start_at + max_results],
+        }
+
+    def issue_type_fields(self, issue_type):
+        """The create screen of a Task or an Epic, by field id"""
+        fields = {
+            "summary": {"name": "Summary", "required": True},
+            "priority": {
+                "name": "Priority",
+                "required": False,
+                "allowedValues": [{"name": "Major"}, {"name": "Minor"}],
+            },
+            "labels": {"name": "Labels", "required": False},
+        }
+        if issue_type == "Epic":
+            fields[EPIC_NAME_FIELD] = {"name": "Epic Name", "required": True}
+        return fields
+
+    def issue_types(self):
+        """The issue types every project offers"""
+        return [
+            {"id": type_id, "name": name, "subtask": False}
+            for name, type_id in ISSUE_TYPE_IDS.items()
+        ]
+
+    def create_meta(self, project_keys):
+        """createmeta for the requested projects: Tasks and Epics"""
+        return {
+            "projects": [
+                {
+                    "key": key,
+                    "name": project_name,
+                    "issuetypes": [
+                        dict(type_, fields=self.issue_type_fields(type_["name"]))
+                        for type_ in self.issue_types()
+                    ],
+                }
+                for key, project_name in self.projects
+                if key in project_keys.split(",")
+            ]
+        }
+
+    def project_meta(self, parts):
+        """A project's issue types, or one type's fields, as a single page"""
+        if parts[0] not in dict(self.projects):
+            return 404, {"errorMessages": [f"No project {parts[0]}"]}
+        if len(parts) == 2:
+            values = self.issue_types()
+        else:
+            names = {type_id: name for name, type_id in ISSUE_TYPE_IDS.items()}
+            if parts[2] not in names:
+                return 404, {"errorMessages": [f"No issue type {parts[2]}"]}
+            values = [
+                dict(field, fieldId=field_id)
+                for field_id, field in self.issue_type_fields(names[parts[2]]).items()
+            ]
+        return 200, {
+            "startAt": 0,
+            "maxResults": len(values),
+            "total": len(values),
+            "isLast": True,
+            "values": values,
+        }
+
+    def create(self, fields):
+        """Record a new issue, returning (status, body) like JIRA's create"""
+        project_key = (fields.get("project") or {}).get("key")
+        names = dict(self.projects)
+        if project_key not in names or not fields.get("summary"):
+            return 400, {"errors": {"project": "project and summary are required"}}
+        with self._lock:
+            number = self.issue_count + len(self.created) + 1
+            issue = {
+                "id": str(30000 + number),
+                "key": f"{project_key}-{number}",
+                "fields": dict(
+                    fields,
+                    project={"key": project_key, "name": names[project_key]},
+                    labels=fields.get("labels") or [],
+                    updated=time.strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
+                ),
+            }
+            self.created.append(issue)
+        return 201, {
+            "id": issue["id"],
+            "key": issue["key"],
+            "self": f"{self.url}{API}issue/{issue['id']}",
+        }
+
+    def issue_by_key(self, key):
+        """Return (status, body) for a created or generated issue"""
+        with self._lock:
+            issues = list(self.created)
+        issues += [self.generated_issue(i) for i in range(self.issue_count)]
+        for issue in issues:
+            if key in (issue["key"], issue["id"]):
+                return 200, issue
+        return 404, {"errorMessages": ["Issue Does Not Exist"]}
@@ -0,0 +1,558 @@
+"""
+End-to-end latency benchmarks for create_issue_interactive.py
+
+These tests run the real script against tests/fake_jcli.py with fixed
+latencies, feed it scripted answers on stdin and time each phase. By
+default only machine-independent properties are checked, such as which jcli
+calls run and a warm start beating a cold one. Absolute timings are compared
+against tests/benchmark_baseline.json, so that startup and creation
+regressions fail, only when asked for:
+
+    BENCHMARK_TIMINGS=1 pytest tests/test_benchmark.py
+
+Refresh the baseline after an intentional change with:
+
+    UPDATE_BENCHMARK_BASELINE=1 pytest tests/test_benchmark.py
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPT = os.path.join(os.path.dirname(TESTS_DIR), "src", "create_issue_interactive.py")
+FAKE_JCLI = os.path.join(TESTS_DIR, "fake_jcli.py")
+BASELINE_FILE = os.path.join(TESTS_DIR, "benchmark_baseline.json")
+
+# Simulated JIRA latency per jcli command (seconds)
+LATENCIES = {
+    "--version": 0.05,
+    "myself": 0.3,
+    "issues list": 0.3,
+    "issues create": 0.2,
+}
+
+# Accept answers for every prompt, giving a Task in the default project
+SCRIPTED_ANSWERS = [
+    "",  # project
+    "",  # issue type
+    "Benchmark issue",  # summary
+    "",  # description
+    "",  # due date
+    "",  # priority
+    "y",  # confirm
+]
+
+# A phase regresses when it exceeds baseline * TOLERANCE + SLACK seconds
+TOLERANCE = 1.5
+SLACK = 0.15
+
+# Wall-clock limits depend on the machine, so shared CI runners skip them
+CHECK_TIMINGS = bool(os.environ.get("BENCHMARK_TIMINGS"))
+timing = pytest.mark.skipif(
+    not CHECK_TIMINGS, reason="set BENCHMARK_TIMINGS=1 to check wall-clock timings"
+)
+
+
+class FakeJcliEnvironment:
+    """An isolated HOME with a saved fake jcli and its configuration"""
+
+    def __init__(self, root, commands=None):
+        self.home = root / "home"
+        self.config_dir = self.home / ".local" / "share" / "jiracli-helpers"
+        self.config_dir.mkdir(parents=True)
+        self.log = root / "jcli.log"
+        self.config = root / "fake_jcli.json"
+        self.config.write_text(json.dumps({"commands": commands or {}}))
+
+        # Wrap the fake in an executable so it runs like an installed jcli
+        self.jcli = root / "bin" / "jcli"
+        self.jcli.parent.mkdir()
+        with open(FAKE_JCLI, "r") as f:
+            self.jcli.write_text(f"#!{sys.executable}\n{f.read()}")
+        self.jcli.chmod(0o755)
+        (self.config_dir / "jcli_path").write_text(str(self.jcli))
+
+    def env(self):
+        """Environment for the script and the fake jcli it spawns"""
+        env = dict(os.environ)
+        env.pop("VIRTUAL_ENV", None)
+        env.update({
+            "HOME": str(self.home),
+            "PYTHONUNBUFFERED": "1",
+            "FAKE_JCLI_CONFIG": str(self.config),
+            "FAKE_JCLI_LOG": str(self.log),
+            "FAKE_JCLI_COUNTER": str(self.log) + ".counter",
+            "FAKE_JCLI_ISSUES": str(self.log) + ".issues",
+        })
+        return env
+
+    def cache_create_meta(self, project, issue_types=("Task", "Epic")):
+        """Seed the create metadata cache, which the fake jcli cannot provide"""
+        meta = {
+            "issue_types": {
+                name: {"required_fields": [], "priorities": None, "labels": True}
+                for name in issue_types
+            }
+        }
+        # Without ~/.jira.yml the JIRA server and user are both unknown
+        cache = {f"||{project}": {"meta": meta, "fetched_at": time.time()}}
+        (self.config_dir / "create_meta_cache.json").write_text(json.dumps(cache))
+
+    def calls(self):
+        """Read and clear the fake jcli invocation log"""
+        if not self.log.exists():
+            return []
+        calls = [json.loads(line) for line in self.log.read_text().splitlines()]
+        self.log.unlink()
+        return calls
+
+    def run(self, answers=SCRIPTED_ANSWERS, args=()):
+        """Run the script once with scripted answers and time its phases"""
+        started_wall = time.time()
+        started = time.monotonic()
+        process = subprocess.Popen(
+            [sys.executable, SCRIPT, *args],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            env=self.env(),
+        )
+        process.stdin.write("\n".join(answers) + "\n")
+        process.stdin.close()
+
+        first_prompt = None
+        output = []
+        for line in process.stdout:
+            output.append(line)
+            if first_prompt is None and "Select project:" in line:
+                first_prompt = time.monotonic() - started
+        returncode = process.wait(timeout=60)
+        total = time.monotonic() - started
+
+        calls = self.calls()
+        phases = {"time_to_first_prompt": first_prompt, "total": total}
+        for call in calls:
+            phases[call["command"]] = call["end"] - call["start"]
+            call["offset"] = call["start"] - started_wall
+
+        return {
+            "returncode": returncode,
+            "output": "".join(output),
+            "phases": phases,
+            "calls": calls,
+        }
+
+
+def load_baseline():
+    """Load the stored phase timings"""
+    with open(BASELINE_FILE, "r") as f:
+        return json.load(f)
+
+
+def check_against_baseline(scenario, phases):
+    """Fail if any baseline phase regressed, or record it when updating"""
+    baseline = load_baseline()
+    if os.environ.get("UPDATE_BENCHMARK_BASELINE"):
+        baseline[scenario] = {
+            name: round(phases[name], 3) for name in ("time_to_first_prompt", "total")
+        }
+        with open(BASELINE_FILE, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        return
+    if not CHECK_TIMINGS:
+        return
+
+    regressions = []
+    for name, expected in baseline[scenario].items():
+        limit = expected * TOLERANCE + SLACK
+        if phases[name] is None or phases[name] > limit:
+            regressions.append(f"{name}: {phases[name]} > {limit:.3f}s")
+    assert not regressions, f"{scenario} regressed: " + ", ".join(regressions)
+
+
+@pytest.fixture
+def fake_env(tmp_path):
+    """A fake jcli environment with the benchmark latencies"""
+    commands = {name: {"latency": latency} for name, latency in LATENCIES.items()}
+    return FakeJcliEnvironment(tmp_path, commands)
+
+
+def test_cold_start_benchmark(fake_env):
+    """Time a first run with empty caches"""
+    result = fake_env.run()
+
+    assert result["returncode"] == 0, result["output"]
+    assert "Issue created successfully!" in result["output"]
+    # The summary index sync for duplicate detection runs in the background
+    # and is abandoned if the issue is created first, so only the rest is fixed
+    commands = [
+        call["command"] for call in result["calls"] if "--jql" not in call["argv"]
+    ]
+    assert sorted(commands) == ["--version", "issues create", "issues list", "myself"]
+    check_against_baseline("cold", result["phases"])
+
+
+def test_warm_start_benchmark(fake_env):
+    """Time a second run, where jcli validation, auth and projects are cached"""
+    cold = fake_env.run()
+    result = fake_env.run()
+
+    assert result["returncode"] == 0, result["output"]
+    commands = [call["command"] for call in result["calls"]]
+    assert commands == ["issues create"]
+    # The cold run waited LATENCIES["myself"] for auth before its first prompt
+    cold_prompt = cold["phases"]["time_to_first_prompt"]
+    assert result["phases"]["time_to_first_prompt"] < cold_prompt
+    check_against_baseline("warm", result["phases"])
+
+
+def test_auth_and_project_discovery_overlap(fake_env):
+    """Test that jcli myself and issues list run at the same time"""
+    result = fake_env.run()
+    calls = {
+        call["command"]: call for call in result["calls"] if "--jql" not in call["argv"]
+    }
+    myself, projects = calls["myself"], calls["issues list"]
+    assert myself["start"] < projects["end"] and projects["start"] < myself["end"]
+
+
+def test_trace_records_phases_and_commands(fake_env, tmp_path):
+    """Test that --trace writes a span per phase and per jcli call"""
+    trace_file = tmp_path / "trace.jsonl"
+    result = fake_env.run(args=["--trace", str(trace_file), "--trace-summary"])
+
+    assert result["returncode"] == 0, result["output"]
+    spans = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    names = {span["name"] for span in spans}
+    assert {
+        "find_jcli_command",
+        "check_auth",
+        "get_available_projects",
+        "create_issue",
+        "total",
+        "jcli myself",
+        "jcli issues list",
+        "jcli issues create",
+    } <= names
+    create = next(span for span in spans if span["name"] == "jcli issues create")
+    assert create["kind"] == "subprocess"
+    assert create["exit_code"] == 0
+    assert create["duration_ms"] >= LATENCIES["issues create"] * 1000
+    assert "Total ms" in result["output"]
+
+
+def test_project_data_prefetched_in_background(tmp_path):
+    """Test that per-project fetches start off the main thread, before prompts"""
+    # A slow create gives the background fetches time to finish before exit
+    fake_env = FakeJcliEnvironment(tmp_path, {"issues create": {"latency": 1.0}})
+    trace_file = tmp_path / "trace.jsonl"
+    # Pick PROJ rather than the default NSTL
+    result = fake_env.run(
+        answers=["2"] + SCRIPTED_ANSWERS[1:], args=["--trace", str(trace_file)]
+    )
+
+    assert result["returncode"] == 0, result["output"]
+    spans = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    metas = [span for span in spans if span["name"] == "get_create_meta"]
+    # The default project is fetched speculatively while the menu is shown
+    assert [span["project"] for span in sorted(metas, key=lambda s: s["start"])] == [
+        "NSTL", "PROJ"
+    ]
+    sync = next(span for span in spans if span["name"] == "sync_summary_index")
+    assert sync["project"] == "PROJ"
+    assert all(span["thread"] != "MainThread" for span in metas + [sync])
+    assert "Created issue PROJ-" in result["output"]
+
+
+@timing
+def test_discovery_pages_past_first_issues(tmp_path):
+    """Test that projects beyond the first page of issues are offered"""
+    # The first page arrives before auth finishes, the rest only after it
+    fake_env = FakeJcliEnvironment(
+        tmp_path, {"myself": {"latency": 0.3}, "issues list": {"latency": 0.2}}
+    )
+    config = json.loads(fake_env.config.read_text())
+    config["projects"] = [[f"P{i:03d}", f"Project {i}"] for i in range(120)]
+    config["issue_count"] = 1000
+    fake_env.config.write_text(json.dumps(config))
+
+    # Pick "More projects..." from the partial list, then the last project
+    result = fake_env.run(answers=["51", "120"] + SCRIPTED_ANSWERS[1:])
+
+    assert result["returncode"] == 0, result["output"]
+    assert "Showing 50 projects found so far" in result["output"]
+    assert "Created issue P119-" in result["output"]
+    pages = [
+        call
+        for call in result["calls"]
+        if call["command"] == "issues list" and "--jql" not in call["argv"]
+    ]
+    # Three pages find all 120 projects, then three more find nothing new
+    assert len(pages) == 6
+
+
+def test_abandoned_discovery_cached_for_next_run(tmp_path):
+    """Test that a run exiting mid-discovery still leaves the next one a cache"""
+    fake_env = FakeJcliEnvironment(
+        tmp_path, {"myself": {"latency": 0.3}, "issues list": {"latency": 0.2}}
+    )
+    config = json.loads(fake_env.config.read_text())
+    config["projects"] = [[f"P{i:03d}", f"Project {i}"] for i in range(120)]
+    config["issue_count"] = 1000
+    fake_env.config.write_text(json.dumps(config))
+
+    # Pick from the first page's projects and exit while discovery pages on
+    first = fake_env.run(answers=["1"] + SCRIPTED_ANSWERS[1:])
+    assert first["returncode"] == 0, first["output"]
+    assert (fake_env.config_dir / "projects_cache.json").exists()
+
+    # The next run answers from the cache instead of waiting for discovery
+    result = fake_env.run(answers=["1"] + SCRIPTED_ANSWERS[1:])
+    assert result["returncode"] == 0, result["output"]
+    assert "found so far" not in result["output"]
+
+
+def test_duplicate_warning_from_local_index(fake_env):
+    """Test that a repeated summary is flagged without searching JIRA"""
+    first = fake_env.run()
+    assert "POSSIBLE DUPLICATES" not in first["output"]
+
+    result = fake_env.run()
+    assert result["returncode"] == 0, result["output"]
+    assert "POSSIBLE DUPLICATES" in result["output"]
+    assert "NSTL-1:\x1b[0m Benchmark issue (100% similar)" in result["output"]
+    # The index synced by the first run is fresh, so nothing is searched
+    assert not [call for call in result["calls"] if "--jql" in call["argv"]]
+
+
+def test_project_discovery_from_mirror(fake_env):
+    """Test that a repeat discovery fetches only changed issues"""
+    fake_env.run()
+    (fake_env.config_dir / "projects_cache.json").unlink()
+
+    result = fake_env.run()
+
+    assert result["returncode"] == 0, result["output"]
+    assert "NSTL - Nested Tasks" in result["output"]
+    searches = [
+        call["argv"] for call in result["calls"] if call["command"] == "issues list"
+    ]
+    assert len(searches) == 1
+    assert searches[0][searches[0].index("--jql") + 1].startswith('updated >= "-')
+
+
+def test_non_interactive_json(fake_env):
+    """Test creating an issue from flags without any prompt"""
+    result = fake_env.run(
+        answers=[], args=["--project", "PROJ", "--summary", "Scripted", "--json"]
+    )
+
+    assert result["returncode"] == 0, result["output"]
+    created = json.loads(result["output"].splitlines()[-1])
+    assert created["key"] == "PROJ-1"
+    assert created["timings"]["create_ms"] >= LATENCIES["issues create"] * 1000
+    commands = [call["command"] for call in result["calls"]]
+    assert commands == ["--version", "issues create"]
+
+
+def test_jsonl_protocol_events(fake_env):
+    """Test that --protocol jsonl writes only typed events on stdout"""
+    process = subprocess.run(
+        [sys.executable, SCRIPT, "--protocol", "jsonl"],
+        input="\n".join(SCRIPTED_ANSWERS) + "\n",
+        capture_output=True,
+        text=True,
+        env=fake_env.env(),
+        timeout=60,
+    )
+
+    assert process.returncode == 0, process.stderr
+    events = [json.loads(line) for line in process.stdout.splitlines()]
+    types = {event["type"] for event in events}
+    assert types == {"progress", "prompt", "options", "result"}
+    assert "\033[" not in process.stdout
+
+    options = [event for event in events if event["type"] == "options"]
+    assert options[0]["message"] == "Select project:"
+    assert "NSTL - Nested Tasks" in options[0]["options"]
+    prompts = [event for event in events if event["type"] == "prompt"]
+    assert [prompt["kind"] for prompt in prompts] == ["text", "text", "date", "text"]
+    assert events[-1] == {
+        "type": "result",
+        "success": True,
+        "key": "NSTL-1",
+        "output": "Created issue NSTL-1\n",
+    }
+
+
+def test_issue_tree_created_in_one_run(tmp_path):
+    """Test that an Epic's children are created concurrently after the Epic"""
+    fake_env = FakeJcliEnvironment(tmp_path, {"issues create": {"latency": 0.3}})
+    tree_file = tmp_path / "checkout.json"
+    tree_file.write_text(json.dumps({
+        "project": "PROJ",
+        "epic": {"summary": "Checkout"},
+        "children": [{"summary": f"Step {i}"} for i in range(1, 9)],
+    }))
+
+    result = fake_env.run(answers=[], args=["--tree", str(tree_file)])
+
+    assert result["returncode"] == 0, result["output"]
+    assert "Created PROJ-1 with 8 child issue(s)" in result["output"]
+    creates = [call for call in result["calls"] if call["command"] == "issues create"]
+    epic, children = creates[0], creates[1:]
+    assert epic["argv"][epic["argv"].index("--issue-type") + 1] == "Epic"
+    assert all(
+        call["argv"][call["argv"].index("Epic Link") + 1] == "PROJ-1"
+        and call["start"] >= epic["end"]
+        for call in children
+    )
+    # Children run several at a time: others start before the first one ends
+    first = min(children, key=lambda call: call["end"])
+    assert sum(call["start"] < first["end"] for call in children) > 1
+
+    # Rerunning the finished tree creates nothing more
+    result = fake_env.run(answers=[], args=["--tree", str(tree_file)])
+    assert result["returncode"] == 0, result["output"]
+    assert result["calls"] == []
+
+
+def test_issue_tree_resumed_after_failure(tmp_path):
+    """Test that a failed tree is finished by running it again"""
+    fake_env = FakeJcliEnvironment(
+        tmp_path, {"issues create": {"exit_code": 1, "stderr": "502 Bad Gateway\n"}}
+    )
+    tree_file = tmp_path / "checkout.json"
+    tree_file.write_text(json.dumps({
+        "project": "PROJ",
+        "epic": {"summary": "Checkout"},
+        "children": [{"summary": "Cart"}, {"summary": "Payment"}],
+    }))
+    # The idempotency label is only sent where metadata shows a labels field
+    fake_env.cache_create_meta("PROJ")
+
+    result = fake_env.run(answers=[], args=["--tree", str(tree_file)])
+    assert result["returncode"] == 1
+    assert "Failed to create Epic 'Checkout': 502 Bad Gateway" in result["output"]
+
+    fake_env.config.write_text(json.dumps({"commands": {}}))
+    result = fake_env.run(answers=[], args=["--tree", str(tree_file)])
+    assert result["returncode"] == 0, result["output"]
+    commands = [call["command"] for call in result["calls"]]
+    # The Epic is looked up in case the failed run created it after all
+    assert commands == ["issues list"] + ["issues create"] * 3
+    state = json.loads((tmp_path / "checkout.state.json").read_text())
+    assert sorted(entry["key"] for entry in state["children"]) == ["PROJ-2", "PROJ-3"]
+
+
+def test_auth_failure_stops_before_prompts(tmp_path):
+    """Test that an injected auth failure exits without prompting"""
+    fake_env = FakeJcliEnvironment(
+        tmp_path, {"myself": {"exit_code": 1, "stderr": "401 Unauthorized\n"}}
+    )
+    result = fake_env.run()
+
+    assert result["returncode"] == 1
+    assert "401 Unauthorized" in result["output"]
+    assert result["phases"]["time_to_first_prompt"] is None
+
+
+def test_create_failure_reported(tmp_path):
+    """Test that an injected create failure is reported"""
+    fake_env = FakeJcliEnvironment(
+        tmp_path, {"issues create": {"exit_code": 1, "stderr": "500 Server Error\n"}}
+    )
+    result = fake_env.run()
+
+    assert result["returncode"] == 1
+    assert "500 Server Error" in result["output"]
+
+
+def write_jcli_latency(fake_env, samples=None, open_until=0.0):
+    """Seed the latencies and breaker state earlier runs would have saved"""
+    state = {
+        "samples": samples or {},
+        "consecutive_timeouts": 3 if open_until else 0,
+        "open_until": open_until,
+    }
+    (fake_env.config_dir / "jcli_latency.json").write_text(json.dumps(state))
+
+
+def test_slow_create_not_cut_short(tmp_path):
+    """Test that issues create keeps its default timeout whatever earlier runs saw"""
+    fake_env = FakeJcliEnvironment(tmp_path, {"issues create": {"latency": 2.5}})
+    # Creates used to take 0.1s, which would put a learned timeout at its 2s floor
+    write_jcli_latency(fake_env, {"issues create": [0.1] * 20})
+
+    result = fake_env.run()
+
+    assert result["returncode"] == 0
+    assert "timed out" not in result["output"]
+    assert not list((fake_env.config_dir / "spool").glob("*.json"))
+
+
+def test_auth_rechecked_after_auth_error(fake_env):
+    """Test that a cached auth check is dropped when JIRA refuses a call"""
+    fake_env.run()
+    assert (fake_env.config_dir / "auth_check.json").exists()
+
+    refused = {"exit_code": 1, "stderr": "401 Unauthorized\n"}
+    fake_env.config.write_text(
+        json.dumps({"commands": {"issues create": refused, "myself": refused}})
+    )
+    result = fake_env.run()
+
+    assert result["returncode"] == 1
+    assert "Please check your JIRA configuration" in result["output"]
+    commands = [
+        call["command"]
+        for call in result["calls"]
+        if call["command"] in ("myself", "issues create")
+    ]
+    # The recorded check stood in for myself until the creation was refused
+    assert commands == ["issues create", "myself"]
+    assert not (fake_env.config_dir / "auth_check.json").exists()
+
+
+def test_open_breaker_fails_fast(fake_env):
+    """Test that JIRA is not called while the circuit breaker is open"""
+    write_jcli_latency(fake_env, open_until=time.time() + 60)
+
+    result = fake_env.run()
+
+    assert result["returncode"] == 1
+    assert "JIRA timed out 3 times in a row" in result["output"]
+    commands = [call["command"] for call in result["calls"]]
+    assert "myself" not in commands
+
+
+def test_failed_create_spooled_and_drained(tmp_path):
+    """Test that a failed creation is spooled and replayed exactly once"""
+    fake_env = FakeJcliEnvironment(
+        tmp_path, {"issues create": {"exit_code": 1, "stderr": "502 Bad Gateway\n"}}
+    )
+    result = fake_env.run()
+    assert result["returncode"] == 1
+    spooled = list((fake_env.config_dir / "spool").glob("*.json"))
+    assert len(spooled) == 1
+    assert json.loads(spooled[0].read_text())["last_error"] == "502 Bad Gateway"
+
+    fake_env.config.write_text(json.dumps({"commands": {}}))
+    result = fake_env.run(answers=[], args=["--drain-spool"])
+    assert result["returncode"] == 0, result["output"]
+    assert "Benchmark issue: created NSTL-1" in result["output"]
+    assert not list((fake_env.config_dir / "spool").glob("*.json"))
+
+    # Draining again finds nothing left to create
+    result = fake_env.run(answers=[], args=["--drain-spool"])
+    assert "No spooled issues to create" in result["output"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
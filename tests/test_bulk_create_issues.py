@@ -0,0 +1,235 @@
+"""
+Tests for bulk_create_issues.py
+
+These tests run bulk creation against mocked jcli commands, without
+requiring actual jcli installation or JIRA connectivity.
+"""
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+)
+from bulk_create_issues import (
+    RateLimiter,
+    bulk_create,
+    create_row,
+    is_transient_error,
+    main,
+    normalize_field_name,
+    read_rows,
+    validate_row,
+)
+
+
+def completed(cmd, returncode=0, stdout="", stderr=""):
+    """Build a CompletedProcess like run_command returns"""
+    return subprocess.CompletedProcess(cmd, returncode, stdout, stderr)
+
+
+@pytest.fixture(autouse=True)
+def quiet():
+    """Silence progress output"""
+    with patch("bulk_create_issues.print_success"), patch(
+        "bulk_create_issues.print_error"
+    ), patch("bulk_create_issues.print_info"):
+        yield
+
+
+class TestReadRows:
+    """Test reading CSV and JSONL input"""
+
+    def test_normalize_field_name(self):
+        """Test column name normalization and aliases"""
+        assert normalize_field_name("Issue Type") == "issue_type"
+        assert normalize_field_name("duedate") == "due_date"
+        assert normalize_field_name("Epic Name") == "epic_name"
+        assert normalize_field_name("type") == "issue_type"
+
+    def test_read_csv(self, tmp_path):
+        """Test reading rows from a CSV file"""
+        path = tmp_path / "issues.csv"
+        path.write_text(
+            "Project,Issue Type,Summary,Due Date,Unknown\n"
+            "PROJ,Task,First,2024-01-31,x\n"
+        )
+        rows = list(read_rows(str(path)))
+        assert rows == [
+            {
+                "project": "PROJ",
+                "issue_type": "Task",
+                "summary": "First",
+                "due_date": "2024-01-31",
+            }
+        ]
+
+    def test_read_jsonl(self, tmp_path):
+        """Test reading rows from a JSONL file, skipping blank lines"""
+        path = tmp_path / "issues.jsonl"
+        path.write_text(
+            json.dumps({"project": "PROJ", "summary": "First", "priority": "Major"})
+            + "\n\n"
+        )
+        rows = list(read_rows(str(path)))
+        assert rows == [{"project": "PROJ", "summary": "First", "priority": "Major"}]
+
+    def test_validate_row_defaults(self):
+        """Test that issue type and Epic Name get the interactive defaults"""
+        row = {"project": "PROJ", "summary": "Epic work", "issue_type": "Epic"}
+        assert validate_row(row) is None
+        assert row["epic_name"] == "Epic work"
+
+        row = {"project": "PROJ", "summary": "Task work"}
+        assert validate_row(row) is None
+        assert row["issue_type"] == "Task"
+
+    def test_validate_row_missing_fields(self):
+        """Test that rows without project or summary are rejected"""
+        assert validate_row({"summary": "x"}) == "project is required"
+        assert validate_row({"project": "PROJ"}) == "summary is required"
+
+    def test_validate_row_due_date(self):
+        """Test that due dates are checked like scripted creations check them"""
+        row = {"project": "PROJ", "summary": "x", "due_date": "2024-01-31"}
+        assert validate_row(row) is None
+        row["due_date"] = "31/01/2024"
+        assert validate_row(row) == "'due_date' must be YYYY-MM-DD, got '31/01/2024'"
+
+
+class TestRateLimiter:
+    """Test request rate limiting"""
+
+    def test_rate_limiter_spaces_calls(self):
+        """Test that calls are spaced by the configured interval"""
+        limiter = RateLimiter(20)
+        started = time.monotonic()
+        for _ in range(4):
+            limiter.wait()
+        assert time.monotonic() - started >= 0.14
+
+    def test_rate_limiter_unlimited(self):
+        """Test that a rate of zero never waits"""
+        limiter = RateLimiter(0)
+        started = time.monotonic()
+        for _ in range(100):
+            limiter.wait()
+        assert time.monotonic() - started < 0.1
+
+
+class TestBulkCreate:
+    """Test concurrent creation with retries"""
+
+    @patch("bulk_create_issues.run_command")
+    def test_create_row_retries_then_succeeds(self, mock_run):
+        """Test that a failed attempt is retried"""
+        mock_run.side_effect = [
+            completed([], 1, stderr="503 Service Unavailable"),
+            completed([], 0, stdout="Created PROJ-7\n"),
+        ]
+        row = {"project": "PROJ", "issue_type": "Task", "summary": "First"}
+        result = create_row("jcli", row, RateLimiter(0), retries=2, backoff=0)
+        assert result == {"key": "PROJ-7", "output": "Created PROJ-7", "attempts": 2}
+
+    @patch("bulk_create_issues.run_command")
+    def test_create_row_gives_up(self, mock_run):
+        """Test that the last error is reported after all retries"""
+        mock_run.return_value = completed([], 1, stderr="429 Too Many Requests")
+        row = {"project": "PROJ", "issue_type": "Task", "summary": "First"}
+        result = create_row("jcli", row, RateLimiter(0), retries=1, backoff=0)
+        assert result == {"error": "429 Too Many Requests", "attempts": 2}
+
+    @patch("bulk_create_issues.run_command")
+    def test_create_row_does_not_retry_permanent_errors(self, mock_run):
+        """Test that errors every attempt would repeat fail the row at once"""
+        row = {"project": "PROJ", "issue_type": "Task", "summary": "First"}
+        mock_run.return_value = completed(
+            [], 1, stderr="400 Bad Request: project is not valid"
+        )
+        result = create_row("jcli", row, RateLimiter(0), retries=2, backoff=0)
+        assert result == {
+            "error": "400 Bad Request: project is not valid", "attempts": 1
+        }
+
+        mock_run.side_effect = OSError("jcli not found")
+        result = create_row("jcli", row, RateLimiter(0), retries=2, backoff=0)
+        assert result == {"error": "jcli not found", "attempts": 1}
+        assert mock_run.call_count == 2
+
+    def test_transient_errors(self):
+        """Test which jcli errors are worth retrying"""
+        assert is_transient_error("HTTP 502 Bad Gateway")
+        assert is_transient_error("ConnectionError: Connection refused")
+        assert is_transient_error("Too Many Requests")
+        assert not is_transient_error("400: issue type 'Story' is not valid")
+        assert not is_transient_error("PROJ-500 already exists")
+
+    @patch("bulk_create_issues.run_command")
+    def test_create_row_does_not_retry_timeouts(self, mock_run):
+        """Test that a create which may have gone through is not sent again"""
+        mock_run.side_effect = subprocess.TimeoutExpired(["jcli"], 60)
+        row = {"project": "PROJ", "issue_type": "Task", "summary": "First"}
+        result = create_row("jcli", row, RateLimiter(0), retries=2, backoff=0)
+        assert mock_run.call_count == 1
+        assert result["attempts"] == 1
+        assert "timed out" in result["error"]
+
+    @patch("bulk_create_issues.run_command")
+    def test_bulk_create_runs_concurrently_in_order(self, mock_run):
+        """Test that rows run in parallel and results keep input order"""
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def fake_run(cmd, timeout=None):
+            with lock:
+                running.append(cmd)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(cmd)
+            summary = cmd[cmd.index("--summary") + 1]
+            return completed(cmd, stdout=f"Created PROJ-{summary}\n")
+
+        mock_run.side_effect = fake_run
+        rows = [{"project": "PROJ", "summary": str(i)} for i in range(1, 9)]
+        rows.append({"project": "PROJ", "summary": ""})
+
+        results = bulk_create("jcli", rows, workers=4, rate=0, retries=0)
+
+        assert [result.get("key") for result in results[:8]] == [
+            f"PROJ-{i}" for i in range(1, 9)
+        ]
+        assert results[8] == {
+            "row": 9,
+            "summary": "",
+            "error": "summary is required",
+            "attempts": 0,
+        }
+        assert 1 < max(peak) <= 4
+
+    @patch("bulk_create_issues.get_jcli_latency_file")
+    @patch("bulk_create_issues.run_command")
+    def test_main_writes_results_file(self, mock_run, mock_latency_file, tmp_path):
+        """Test the command line entry point end to end"""
+        mock_latency_file.return_value = str(tmp_path / "jcli_latency.json")
+        mock_run.return_value = completed([], stdout="PROJ-1\n")
+        input_file = tmp_path / "issues.csv"
+        input_file.write_text("project,summary\nPROJ,First\n")
+
+        assert main([str(input_file), "--jcli", "jcli", "--rate", "0"]) == 0
+
+        results_file = tmp_path / "issues.results.jsonl"
+        result = json.loads(results_file.read_text())
+        assert result["row"] == 1
+        assert result["key"] == "PROJ-1"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
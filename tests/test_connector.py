@@ -0,0 +1,202 @@
+"""
+Tests and benchmarks for the in-process connector path
+
+These tests run ConnectorBackend and the import fallback of project
+discovery over HTTP against tests/fake_jira_server.py, so they need the
+`jira` client library that jcli's connector is built on; they are skipped
+where it is not installed. The stand-in's own contract is checked with the
+standard library.
+"""
+import base64
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+)
+from create_issue_interactive import (
+    ConnectorBackend,
+    IssueMirror,
+    fetch_projects,
+    sync_issue_mirror,
+)
+from fake_jira_server import EPIC_NAME_FIELD, FakeJiraServer
+
+
+def get_json(server, path, user="fake", password="secret"):
+    """GET a stand-in endpoint with basic auth, returning (status, body)"""
+    request = urllib.request.Request(f"{server.url}/rest/api/2/{path}")
+    token = base64.b64encode(f"{user}:{password}".encode()).decode()
+    request.add_header("Authorization", f"Basic {token}")
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as e:
+        return e.code, json.load(e)
+
+
+def connect(server, password="secret"):
+    """A logged-in connector like jcli's JiraConnector, for ConnectorBackend"""
+    jira = pytest.importorskip("jira")
+    client = jira.JIRA(
+        server=server.url, basic_auth=("fake", password), max_retries=0, timeout=10
+    )
+    return SimpleNamespace(jira=client)
+
+
+@pytest.fixture
+def server():
+    """A stand-in with a search page size below what callers ask for"""
+    with FakeJiraServer(issue_count=120, max_results=25) as server:
+        yield server
+
+
+@pytest.fixture(autouse=True)
+def quiet():
+    """Silence progress output"""
+    with patch("create_issue_interactive.print_info"), patch(
+        "create_issue_interactive.print_success"
+    ), patch("create_issue_interactive.print_error"):
+        yield
+
+
+class TestFakeJiraServer:
+    """Test the stand-in's pagination, auth and fault injection"""
+
+    def test_search_pages_capped(self, server):
+        """Test that searches page at the server's limit like JIRA"""
+        status, page = get_json(
+            server, 'search?jql=project+%3D+"PROJ"&startAt=50&maxResults=100'
+        )
+        assert status == 200
+        assert (page["total"], page["maxResults"]) == (60, 25)
+        assert page["issues"][0]["key"] == "PROJ-19"
+
+    def test_auth_and_injected_errors(self):
+        """Test that bad credentials and configured faults are reported"""
+        with FakeJiraServer(endpoints={"project": {"error_rate": 1}}) as server:
+            assert get_json(server, "myself", password="wrong")[0] == 401
+            assert get_json(server, "project")[0] == 503
+            assert get_json(server, "myself")[0] == 200
+            assert [request["status"] for request in server.requests] == [
+                401, 503, 200
+            ]
+
+
+class TestConnectorBackend:
+    """Test the in-process connector over HTTP"""
+
+    def test_auth(self, server):
+        """Test that the auth check follows the server's answer"""
+        assert ConnectorBackend(connect(server)).check_auth() is True
+        server.endpoints["myself"] = {"status": 401}
+        assert ConnectorBackend(connect(server)).check_auth() is False
+
+    def test_projects_meta_and_create(self, server):
+        """Test project listing, create metadata and field mapping on create"""
+        backend = ConnectorBackend(connect(server))
+
+        assert backend.list_projects() == ["NSTL - Nested Tasks", "PROJ - Project"]
+        meta = backend.get_create_meta("PROJ")
+        assert list(meta["issue_types"]) == ["Task", "Epic"]
+        assert meta["issue_types"]["Task"]["priorities"] == ["Major", "Minor"]
+        assert meta["issue_types"]["Task"]["labels"] is True
+        assert {"id": EPIC_NAME_FIELD, "name": "Epic Name"} in (
+            meta["issue_types"]["Epic"]["required_fields"]
+        )
+
+        key = backend.create_issue(
+            "PROJ", "Epic", "Checkout", epic_name="Checkout", idempotency_key="k1"
+        )
+        assert key == "PROJ-121"
+        fields = server.created[0]["fields"]
+        assert fields[EPIC_NAME_FIELD] == "Checkout"
+        assert backend.find_issue("k1") == "PROJ-121"
+
+    @pytest.mark.parametrize(
+        "version, endpoints",
+        [
+            ((8, 0, 0), ["createmeta"]),
+            ((9, 12, 0), ["issuetypes", "issuetype fields", "issuetype fields"]),
+        ],
+    )
+    def test_create_meta_by_server_version(self, version, endpoints):
+        """Test that JIRA 9, which dropped createmeta, is asked per issue type"""
+        with FakeJiraServer(version=version) as server:
+            backend = ConnectorBackend(connect(server))
+            meta = backend.get_create_meta("PROJ")
+
+        assert list(meta["issue_types"]) == ["Task", "Epic"]
+        assert meta["issue_types"]["Epic"]["priorities"] == ["Major", "Minor"]
+        assert {"id": EPIC_NAME_FIELD, "name": "Epic Name"} in (
+            meta["issue_types"]["Epic"]["required_fields"]
+        )
+        assert [
+            request["endpoint"]
+            for request in server.requests
+            if request["endpoint"] not in ("serverInfo", "myself")
+        ] == endpoints
+
+    def test_mirror_sync_pages_through_search(self, server, tmp_path):
+        """Test that seeding the mirror follows the server's short pages"""
+        backend = ConnectorBackend(connect(server))
+        mirror = IssueMirror(str(tmp_path / "mirror.sqlite3"), account="fake")
+
+        sync_issue_mirror(backend, mirror, "PROJ")
+
+        assert len(mirror.recent_summaries("PROJ", 1000)) == 60
+        searches = [r for r in server.requests if r["endpoint"] == "search"]
+        assert len(searches) > 2
+
+    def test_import_fallback_lists_projects(self, server):
+        """Test that discovery falls back to the connector's project list"""
+        connector = connect(server)
+        with patch(
+            "create_issue_interactive.iter_project_pages", return_value=iter([])
+        ), patch(
+            "create_issue_interactive.load_jira_connector", return_value=connector
+        ):
+            projects = fetch_projects("jcli")
+        assert projects == ["PROJ - Project", "NSTL - Nested Tasks"]
+
+    def test_create_throughput_is_serialized(self):
+        """Benchmark creates from several threads through one session
+
+        The backend serializes calls on its shared JIRA session, so the
+        server never sees two at once and throughput is one create per
+        round trip whatever the caller's concurrency.
+        """
+        latency = 0.05
+        with FakeJiraServer(endpoints={"create issue": {"latency": latency}}) as server:
+            backend = ConnectorBackend(connect(server))
+            backend.warm_up()
+            started = time.monotonic()
+            threads = [
+                threading.Thread(
+                    target=backend.create_issue, args=("PROJ", "Task", f"Load {i}")
+                )
+                for i in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.monotonic() - started
+
+        assert len(server.created) == 8
+        assert server.peak_concurrency == 1
+        assert elapsed >= 8 * latency
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -4,8 +4,13 @@ Tests for create_issue_interactive.py
 These tests focus on unit testing individual functions without requiring
 actual jcli installation or JIRA connectivity.
 """
+import io
+import json
 import os
+import subprocess
 import tempfile
+import threading
+import time
 import unittest.mock as mock
 from unittest.mock import MagicMock, patch
 
@@ -24,16 +29,88 @@ from create_issue_interactive import (
     print_error,
     print_info,
     check_jcli_command,
+    probe_jcli_locations,
+    get_jcli_fingerprint,
+    validate_jcli_command,
+    CancellationToken,
+    OperationCancelled,
+    check_jcli_auth,
+    check_auth_cached,
+    load_auth_check,
+    run_command,
+    JcliGuard,
+    JiraUnavailable,
+    main,
+    build_create_command,
+    extract_issue_key,
+    ConnectorBackend,
+    SubprocessBackend,
+    get_backend,
+    load_jira_connector,
+    HelperServer,
+    Tracer,
+    RPC_AUTH_FAILED,
+    RPC_INVALID_PARAMS,
+    RPC_METHOD_NOT_FOUND,
+    RPC_PARSE_ERROR,
+    RPC_SERVER_ERROR,
     get_user_input,
+    OptionIndex,
+    EventStream,
+    select_from_list,
     save_jcli_path,
     load_jcli_path,
     get_config_dir,
     get_jcli_path_file,
     get_epic_description_template,
     get_description_for_issue_type,
+    get_available_projects,
+    fetch_projects,
+    iter_project_pages,
+    start_daemon_task,
+    jcli_request_shape,
+    get_cached_projects,
+    load_jira_identity,
+    load_project_cache,
+    save_project_cache,
+    drain_spool,
+    load_spool,
+    replay_spool_entry,
+    spool_issue,
+    create_issue,
+    normalize_issue_spec,
+    create_issue_tree,
+    get_tree_specs,
+    load_issue_tree,
+    load_tree_state,
+    get_create_meta,
+    save_create_meta_cache,
+    get_issue_type_options,
+    get_missing_required_fields,
+    parse_create_meta,
+    can_label_issue,
+    SummaryIndex,
+    IssueMirror,
+    IssuePage,
+    MIRROR_SYNC_MAX_PAGES,
+    ALL_PROJECTS,
+    mirror_created_issue,
+    sync_issue_mirror,
+    sync_summary_index,
 )
 
 
+@pytest.fixture
+def meta_cache_file(tmp_path):
+    """Point the create metadata cache at a temporary file"""
+    cache_file = str(tmp_path / "create_meta_cache.json")
+    with patch(
+        "create_issue_interactive.get_create_meta_cache_file",
+        return_value=cache_file,
+    ):
+        yield cache_file
+
+
 class TestColors:
     """Test the Colors class has expected constants"""
 
@@ -96,30 +173,396 @@ class TestPrintFunctions:
 class TestJcliCommand:
     """Test jcli command related functions"""
 
-    @patch("subprocess.run")
+    @patch("create_issue_interactive.run_command")
     def test_check_jcli_command_success(self, mock_run):
         """Test successful jcli command check"""
         mock_run.return_value = MagicMock(returncode=0)
         result = check_jcli_command("/usr/bin/jcli")
         assert result is True
-        mock_run.assert_called_once_with(
-            ["/usr/bin/jcli", "--version"], capture_output=True, text=True, timeout=5
-        )
+        mock_run.assert_called_once_with(["/usr/bin/jcli", "--version"])
 
-    @patch("subprocess.run")
+    @patch("create_issue_interactive.run_command")
     def test_check_jcli_command_failure(self, mock_run):
         """Test failed jcli command check"""
         mock_run.return_value = MagicMock(returncode=1)
         result = check_jcli_command("/usr/bin/jcli")
         assert result is False
 
-    @patch("subprocess.run")
+    @patch("create_issue_interactive.run_command")
     def test_check_jcli_command_exception(self, mock_run):
         """Test jcli command check with exception"""
         mock_run.side_effect = Exception("Command failed")
         result = check_jcli_command("/usr/bin/jcli")
         assert result is False
 
+    @patch("create_issue_interactive.check_jcli_command")
+    def test_probe_jcli_locations_keeps_order(self, mock_check, tmp_path):
+        """Test that working candidates are returned in their original order"""
+        paths = []
+        for name in ["a", "b", "c"]:
+            path = tmp_path / name
+            path.write_text("#!/bin/sh\n")
+            path.chmod(0o755)
+            paths.append(str(path))
+        mock_check.side_effect = lambda location: not location.endswith("b")
+
+        assert probe_jcli_locations(paths) == [paths[0], paths[2]]
+
+    @patch("create_issue_interactive.check_jcli_command")
+    def test_probe_jcli_locations_skips_missing(self, mock_check, tmp_path):
+        """Test that non-executable candidates are never probed"""
+        missing = str(tmp_path / "missing")
+        not_executable = tmp_path / "plain"
+        not_executable.write_text("")
+
+        assert probe_jcli_locations([missing, str(not_executable)]) == []
+        mock_check.assert_not_called()
+
+    @patch("create_issue_interactive.check_jcli_command")
+    def test_probe_jcli_locations_dedupes_symlinks(self, mock_check, tmp_path):
+        """Test that two paths to the same binary are probed once"""
+        target = tmp_path / "jcli"
+        target.write_text("#!/bin/sh\n")
+        target.chmod(0o755)
+        link = tmp_path / "jcli-link"
+        link.symlink_to(target)
+        mock_check.return_value = True
+
+        assert probe_jcli_locations([str(target), str(link)]) == [str(target)]
+        mock_check.assert_called_once_with(str(target))
+
+    @patch("create_issue_interactive.check_jcli_command")
+    def test_probe_jcli_locations_deadline(self, mock_check, tmp_path):
+        """Test that probes still running at the deadline are dropped"""
+        path = tmp_path / "jcli"
+        path.write_text("#!/bin/sh\n")
+        path.chmod(0o755)
+        release = threading.Event()
+        mock_check.side_effect = lambda location: release.wait(5)
+
+        try:
+            assert probe_jcli_locations([str(path)], deadline=0.05) == []
+        finally:
+            release.set()
+
+
+class TestJcliValidationCache:
+    """Test the fingerprint-based validation cache for the saved jcli"""
+
+    @pytest.fixture
+    def jcli(self, tmp_path):
+        """Create a fake jcli whose shebang points at a fake interpreter"""
+        interpreter = tmp_path / "venv" / "bin" / "python"
+        interpreter.parent.mkdir(parents=True)
+        interpreter.write_text("")
+        jcli = tmp_path / "venv" / "bin" / "jcli"
+        jcli.write_text(f"#!{interpreter}\nimport jcli\n")
+        jcli.chmod(0o755)
+        with patch(
+            "create_issue_interactive.get_jcli_path_file",
+            return_value=str(tmp_path / "jcli_path"),
+        ):
+            yield jcli
+
+    def test_fingerprint_includes_shebang_target(self, jcli):
+        """Test that the fingerprint covers the file and its interpreter"""
+        fingerprint = get_jcli_fingerprint(str(jcli))
+        assert fingerprint["path"] == os.path.realpath(str(jcli))
+        assert fingerprint["shebang"]["path"].endswith("venv/bin/python")
+
+    def test_fingerprint_missing_file(self, tmp_path):
+        """Test that a missing file has no fingerprint"""
+        assert get_jcli_fingerprint(str(tmp_path / "missing")) is None
+
+    @patch("create_issue_interactive.check_jcli_command", return_value=True)
+    def test_validation_skips_subprocess_when_unchanged(self, mock_check, jcli):
+        """Test that a matching fingerprint skips the jcli --version check"""
+        assert validate_jcli_command(str(jcli)) is True
+        assert validate_jcli_command(str(jcli)) is True
+        mock_check.assert_called_once_with(str(jcli))
+
+    @patch("create_issue_interactive.check_jcli_command", return_value=True)
+    def test_validation_rechecks_when_binary_changes(self, mock_check, jcli):
+        """Test that modifying the binary forces a new check"""
+        validate_jcli_command(str(jcli))
+        with open(jcli, "a") as f:
+            f.write("# changed\n")
+        validate_jcli_command(str(jcli))
+        assert mock_check.call_count == 2
+
+    @patch("create_issue_interactive.check_jcli_command", return_value=True)
+    def test_validation_rechecks_when_venv_changes(self, mock_check, jcli, tmp_path):
+        """Test that replacing the shebang interpreter forces a new check"""
+        validate_jcli_command(str(jcli))
+        interpreter = tmp_path / "venv" / "bin" / "python"
+        interpreter.unlink()
+        interpreter.write_text("rebuilt venv")
+        validate_jcli_command(str(jcli))
+        assert mock_check.call_count == 2
+
+    @patch("create_issue_interactive.check_jcli_command", return_value=False)
+    def test_validation_failure_not_cached(self, mock_check, jcli):
+        """Test that a failing check is not recorded"""
+        assert validate_jcli_command(str(jcli)) is False
+        assert validate_jcli_command(str(jcli)) is False
+        assert mock_check.call_count == 2
+
+
+class TestRunCommand:
+    """Test cancellable subprocess execution"""
+
+    def test_run_command_captures_output(self):
+        """Test that stdout and the exit code are returned"""
+        result = run_command([sys.executable, "-c", "print('hi')"], timeout=10)
+        assert result.returncode == 0
+        assert result.stdout.strip() == "hi"
+
+    def test_run_command_cancelled_from_other_thread(self):
+        """Test that cancelling the token kills a running process"""
+        token = CancellationToken()
+        timer = threading.Timer(0.2, token.cancel)
+        timer.start()
+        started = time.monotonic()
+        with pytest.raises(OperationCancelled):
+            run_command(
+                [sys.executable, "-c", "import time; time.sleep(10)"],
+                timeout=10,
+                cancel_token=token,
+            )
+        assert time.monotonic() - started < 5
+
+    def test_run_command_already_cancelled(self):
+        """Test that nothing is spawned once the token is cancelled"""
+        token = CancellationToken()
+        token.cancel()
+        with patch("subprocess.Popen") as mock_popen:
+            with pytest.raises(OperationCancelled):
+                run_command(["jcli", "myself"], cancel_token=token)
+            mock_popen.assert_not_called()
+
+    def test_daemon_task_does_not_delay_exit(self):
+        """Test that background work nobody waits for is abandoned at exit"""
+        assert start_daemon_task(lambda x: x * 2, 21).result(timeout=5) == 42
+        with pytest.raises(ValueError):
+            start_daemon_task(int, "x").result(timeout=5)
+
+        import subprocess
+
+        script = (
+            "import time; from create_issue_interactive import start_daemon_task; "
+            "start_daemon_task(time.sleep, 30)"
+        )
+        src = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+        started = time.monotonic()
+        subprocess.run(
+            [sys.executable, "-c", script], cwd=src, check=True, timeout=20
+        )
+        assert time.monotonic() - started < 10
+
+    @patch("create_issue_interactive.print_success")
+    @patch("create_issue_interactive.run_command")
+    def test_check_jcli_auth_success(self, mock_run, mock_print_success):
+        """Test a successful authentication check"""
+        mock_run.return_value = MagicMock(returncode=0)
+        assert check_jcli_auth("jcli") is True
+        mock_run.assert_called_once_with(["jcli", "myself"])
+
+    @patch("create_issue_interactive.print_info")
+    @patch("create_issue_interactive.print_error")
+    @patch("create_issue_interactive.run_command")
+    def test_check_jcli_auth_failure(self, mock_run, mock_print_error, mock_print_info):
+        """Test a failed authentication check"""
+        mock_run.return_value = MagicMock(returncode=1, stderr="401")
+        assert check_jcli_auth("jcli") is False
+
+    @patch("create_issue_interactive.get_auth_cache_file")
+    @patch("create_issue_interactive.get_jcli_latency_file")
+    @patch("create_issue_interactive.print_header")
+    @patch("create_issue_interactive.print_info")
+    @patch("create_issue_interactive.check_jcli_auth", return_value=False)
+    @patch("create_issue_interactive.find_jcli_command", return_value="jcli")
+    def test_main_cancels_project_fetch_on_auth_failure(
+        self,
+        mock_find,
+        mock_auth,
+        mock_print_info,
+        mock_print_header,
+        mock_latency_file,
+        mock_auth_file,
+        tmp_path,
+    ):
+        """Test that project discovery started alongside auth is cancelled"""
+        mock_latency_file.return_value = str(tmp_path / "jcli_latency.json")
+        mock_auth_file.return_value = str(tmp_path / "auth_check.json")
+        tokens = []
+        started = threading.Event()
+
+        def fetch(jcli_cmd, ttl, force_refresh, cancel_token, on_page=None):
+            tokens.append(cancel_token)
+            started.set()
+            return ["PROJ"]
+
+        with patch("create_issue_interactive.get_cached_projects", side_effect=fetch):
+            assert main([]) == 1
+            assert started.wait(5)
+        assert tokens[0].cancelled
+
+
+class TestJcliGuard:
+    """Test adaptive jcli timeouts and the circuit breaker"""
+
+    def test_timeout_defaults_then_follows_p99(self):
+        """Test that timeouts switch from defaults to observed latencies"""
+        guard = JcliGuard()
+        assert guard.timeout_for("myself") == 10.0
+        assert guard.timeout_for("issues create") == 60.0
+        assert guard.timeout_for("unknown") == 30.0
+
+        for _ in range(9):
+            guard.record("myself", 0.2)
+        assert guard.timeout_for("myself") == 10.0
+        guard.record("myself", 0.2)
+        # Fast calls are held at the floor
+        assert guard.timeout_for("myself") == 2.0
+
+        for _ in range(100):
+            guard.record("myself", 1.5)
+        assert guard.timeout_for("myself") == 4.5
+        assert len(guard.samples["myself"]) == 100
+
+    def test_create_keeps_default_timeout(self):
+        """Test that creates, which a kill may duplicate, never get a learned timeout"""
+        guard = JcliGuard()
+        for _ in range(20):
+            guard.record("issues create", 0.1)
+        assert guard.timeout_for("issues create") == 60.0
+
+    def test_latencies_kept_per_request_shape(self):
+        """Test that slow pages do not stretch the timeout of one-issue lookups"""
+        guard = JcliGuard()
+        lookup = jcli_request_shape(
+            ["jcli", "issues", "list", "--jql", "labels = x", "--max-issues", "1"]
+        )
+        page = jcli_request_shape(["jcli", "issues", "list", "--max-issues", "100"])
+        assert (lookup, page) == (
+            "issues list --max-issues 1", "issues list --max-issues 100"
+        )
+        for _ in range(10):
+            guard.record("issues list", 0.2, shape=lookup)
+            guard.record("issues list", 4.0, shape=page)
+        assert guard.timeout_for("issues list", lookup) == 2.0
+        assert guard.timeout_for("issues list", page) == 12.0
+        # Shapes without samples of their own start from the subcommand default
+        assert guard.timeout_for("issues list", "issues list --max-issues 50") == 15.0
+
+    def test_breaker_opens_after_consecutive_timeouts(self):
+        """Test that repeated timeouts fail fast until the cooldown passes"""
+        guard = JcliGuard()
+        guard.record("issues list", 15.0, timed_out=True)
+        guard.record("myself", 10.0, timed_out=True)
+        guard.check("issues create")
+
+        guard.record("issues list", 15.0, timed_out=True)
+        with pytest.raises(JiraUnavailable, match="3 times in a row"):
+            guard.check("issues create")
+        # Local commands never reach JIRA, so they are not blocked
+        guard.check("--version")
+
+        with patch("time.time", return_value=time.time() + 31):
+            guard.check("issues create")
+        guard.record("issues create", 0.5)
+        guard.check("issues create")
+        assert guard.consecutive_timeouts == 0
+
+    def test_local_timeouts_do_not_trip_breaker(self):
+        """Test that slow jcli --version probes leave the breaker closed"""
+        guard = JcliGuard()
+        for _ in range(5):
+            guard.record("--version", 5.0, timed_out=True)
+        guard.check("myself")
+
+    def test_state_saved_between_runs(self, tmp_path):
+        """Test that latencies and breaker state survive a restart"""
+        path = str(tmp_path / "jcli_latency.json")
+        guard = JcliGuard()
+        guard.load(path)
+        for _ in range(3):
+            guard.record("myself", 10.0, timed_out=True)
+        guard.save()
+
+        restored = JcliGuard()
+        restored.load(path)
+        assert restored.samples == {"myself": [10.0, 10.0, 10.0]}
+        with pytest.raises(JiraUnavailable):
+            restored.check("myself")
+
+    def test_run_command_records_timeouts(self):
+        """Test that run_command feeds the guard and honours an open breaker"""
+        import subprocess
+
+        guard = JcliGuard()
+        cmd = [sys.executable, "-c", "import time; time.sleep(10)"]
+        with patch("create_issue_interactive.JCLI_GUARD", guard):
+            with pytest.raises(subprocess.TimeoutExpired):
+                run_command(cmd, timeout=0.2)
+            assert guard.consecutive_timeouts == 1
+
+            guard.open_until = time.time() + 30
+            with patch("subprocess.Popen") as mock_popen:
+                with pytest.raises(JiraUnavailable):
+                    run_command(cmd)
+                mock_popen.assert_not_called()
+
+
+class TestAuthCache:
+    """Test skipping the auth check while a recent one still vouches for it"""
+
+    @pytest.fixture(autouse=True)
+    def home(self, tmp_path):
+        """Point HOME and the auth record at temporary paths"""
+        (tmp_path / ".jira.yml").write_text("server: https://jira.example\nuser: me\n")
+        with patch.dict(os.environ, {"HOME": str(tmp_path)}), patch(
+            "create_issue_interactive.get_auth_cache_file",
+            return_value=str(tmp_path / "auth_check.json"),
+        ), patch("create_issue_interactive.print_success"):
+            yield tmp_path
+
+    def test_successful_check_skipped_within_ttl(self):
+        """Test that a passed check is reused until it expires"""
+        backend = MagicMock()
+        backend.check_auth.return_value = True
+        assert check_auth_cached(backend, ttl=60)
+        assert check_auth_cached(backend, ttl=60)
+        assert backend.check_auth.call_count == 1
+
+        with patch("create_issue_interactive.time.time", return_value=time.time() + 61):
+            assert not load_auth_check(ttl=60)
+        assert not load_auth_check(ttl=0)
+
+    def test_failed_check_not_recorded(self):
+        """Test that only successful checks are cached"""
+        backend = MagicMock()
+        backend.check_auth.return_value = False
+        assert not check_auth_cached(backend, ttl=60)
+        assert not load_auth_check(ttl=60)
+
+    def test_config_change_invalidates(self, home):
+        """Test that the record is keyed by server, user and config mtime"""
+        backend = MagicMock()
+        backend.check_auth.return_value = True
+        check_auth_cached(backend, ttl=60)
+        (home / ".jira.yml").write_text("server: https://jira.example\nuser: you\n")
+        assert not load_auth_check(ttl=60)
+
+    def test_auth_error_forgets_check(self):
+        """Test that a jcli call refused with 401 drops the record"""
+        backend = MagicMock()
+        backend.check_auth.return_value = True
+        check_auth_cached(backend, ttl=60)
+        script = "import sys; sys.stderr.write('HTTP 401 Unauthorized'); sys.exit(1)"
+        run_command([sys.executable, "-c", script])
+        assert not load_auth_check(ttl=60)
+
 
 class TestUserInput:
     """Test user input functions"""
@@ -146,6 +589,118 @@ class TestUserInput:
         assert result == "user_input"
 
 
+class TestOptionSearch:
+    """Test type-ahead filtering of long option lists"""
+
+    PROJECTS = [f"P{i:03d} - Project {i}" for i in range(500)] + [
+        "NSTL - Nested Tasks",
+        "WEB - Website",
+        "OPS - Web Operations",
+    ]
+
+    def test_search_ranking(self):
+        """Test that prefix matches rank above word and substring matches"""
+        index = OptionIndex(self.PROJECTS)
+        matches = [self.PROJECTS[i] for i in index.search("web")]
+        assert matches == ["WEB - Website", "OPS - Web Operations"]
+        assert [self.PROJECTS[i] for i in index.search("ested")] == [
+            "NSTL - Nested Tasks"
+        ]
+        assert index.search("") == list(range(len(self.PROJECTS)))
+        assert index.search("zzz") == []
+
+    @patch("builtins.input")
+    def test_filter_then_pick(self, mock_input, capsys):
+        """Test filtering a long list and picking the top match"""
+        mock_input.side_effect = ["nested", ""]
+        selected = select_from_list(self.PROJECTS, "Select project:")
+        assert selected == "NSTL - Nested Tasks"
+
+    @patch("builtins.input")
+    def test_number_picks_from_full_list(self, mock_input):
+        """Test that numbers keep their meaning until a filter is typed"""
+        mock_input.side_effect = ["120"]
+        assert select_from_list(self.PROJECTS, "Select project:") == self.PROJECTS[119]
+
+    @patch("builtins.input")
+    def test_paging_and_reset(self, mock_input, capsys):
+        """Test paging through matches and clearing the filter"""
+        mock_input.side_effect = ["project 1", "+", "*", ""]
+        assert select_from_list(self.PROJECTS, "Select project:", 3) == self.PROJECTS[3]
+        output = capsys.readouterr().out
+        assert "11. P019 - Project 19" in output
+
+    @patch("builtins.input")
+    def test_output_volume_constant(self, mock_input, capsys):
+        """Test that long lists print one page no matter their size"""
+        mock_input.side_effect = [""]
+        select_from_list(self.PROJECTS * 10, "Select project:")
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) < 20
+
+
+class TestEventProtocol:
+    """Test the --protocol jsonl event helpers"""
+
+    @pytest.fixture
+    def events(self):
+        """Enable a fresh event stream writing to a buffer"""
+        events = EventStream()
+        events.enable(io.StringIO())
+        with patch("create_issue_interactive.EVENTS", events):
+            yield events
+
+    @staticmethod
+    def written(events):
+        """Parse the events written so far"""
+        return [json.loads(line) for line in events.output.getvalue().splitlines()]
+
+    def test_print_functions_emit_progress(self, events, capsys):
+        """Test that print helpers emit progress events instead of text"""
+        print_header("PROJECT SELECTION")
+        print_error("Boom")
+        assert self.written(events) == [
+            {"type": "progress", "level": "header", "message": "PROJECT SELECTION"},
+            {"type": "progress", "level": "error", "message": "Boom"},
+        ]
+        assert capsys.readouterr().out == ""
+
+    @patch("builtins.input")
+    def test_select_emits_options(self, mock_input, events):
+        """Test that a selection accepts the option text after an invalid answer"""
+        mock_input.side_effect = ["9", "Epic"]
+        assert select_from_list(["Task", "Epic"], "Select issue type:") == "Epic"
+        written = self.written(events)
+        assert written[0] == {
+            "type": "options",
+            "message": "Select issue type:",
+            "options": ["Task", "Epic"],
+            "default": 0,
+        }
+        assert written[1]["level"] == "error"
+        assert written[2] == written[0]
+
+    @patch("builtins.input")
+    def test_prompt_event_default(self, mock_input, events):
+        """Test that an empty answer to a prompt event takes the default"""
+        mock_input.return_value = ""
+        assert get_user_input("\nCreate this issue? (y/n)", "y") == "y"
+        assert self.written(events) == [
+            {
+                "type": "prompt",
+                "kind": "text",
+                "message": "Create this issue? (y/n)",
+                "default": "y",
+            }
+        ]
+
+    def test_disabled_stream_writes_nothing(self):
+        """Test that events are dropped unless the protocol is enabled"""
+        events = EventStream()
+        events.emit("result", success=True)
+        assert events.output is None
+
+
 class TestConfigManagement:
     """Test configuration management functions"""
 
@@ -289,5 +844,1307 @@ class TestEpicTemplate:
         mock_input.assert_called_once_with("Enter issue description (optional)", "")
 
 
+class TestProjectCache:
+    """Test the on-disk project list cache"""
+
+    @pytest.fixture(autouse=True)
+    def cache_file(self, tmp_path):
+        """Point the cache at a temporary file and fix the JIRA identity"""
+        cache_file = str(tmp_path / "projects_cache.json")
+        with patch(
+            "create_issue_interactive.get_project_cache_file", return_value=cache_file
+        ), patch(
+            "create_issue_interactive.get_mirror_file",
+            return_value=str(tmp_path / "issue_mirror.sqlite3"),
+        ), patch(
+            "create_issue_interactive.load_jira_identity",
+            return_value=("https://jira.example.com", "user"),
+        ):
+            yield cache_file
+
+    def test_load_jira_identity(self, tmp_path):
+        """Test reading server and user from ~/.jira.yml"""
+        config = tmp_path / ".jira.yml"
+        config.write_text("server: https://jira.example.com\nusername: 'me'\n")
+        with patch("os.path.expanduser", return_value=str(config)):
+            assert load_jira_identity() == ("https://jira.example.com", "me")
+
+    def test_save_and_load_project_cache(self):
+        """Test round-tripping the project cache"""
+        save_project_cache(["PROJ - Project"])
+        projects, fetched_at = load_project_cache()
+        assert projects == ["PROJ - Project"]
+        assert fetched_at > 0
+
+    def test_project_cache_keyed_by_identity(self):
+        """Test that a different server/user does not see the cached list"""
+        save_project_cache(["PROJ - Project"])
+        with patch(
+            "create_issue_interactive.load_jira_identity",
+            return_value=("https://other.example.com", "user"),
+        ):
+            assert load_project_cache() is None
+
+    def test_load_project_cache_missing(self):
+        """Test loading when no cache exists"""
+        assert load_project_cache() is None
+
+    @patch("create_issue_interactive.fetch_projects")
+    def test_fresh_cache_skips_fetch(self, mock_fetch):
+        """Test that a fresh cache is served without contacting JIRA"""
+        save_project_cache(["PROJ - Project"])
+        assert get_cached_projects(SubprocessBackend("jcli")) == ["PROJ - Project"]
+        mock_fetch.assert_not_called()
+
+    @patch("create_issue_interactive.print_info")
+    @patch("threading.Thread")
+    def test_stale_cache_refreshes_in_background(self, mock_thread, mock_print_info):
+        """Test that a stale cache is served while a refresh is started"""
+        save_project_cache(["PROJ - Project"])
+        projects = get_cached_projects(SubprocessBackend("jcli"), ttl=-1)
+        assert projects == ["PROJ - Project"]
+        mock_thread.assert_called_once()
+        mock_thread.return_value.start.assert_called_once()
+
+    @patch("create_issue_interactive.print_info")
+    @patch("threading.Thread")
+    def test_abandoned_discovery_leaves_cache(self, mock_thread, mock_print_info):
+        """Test that pages found before a run exits are served by the next run"""
+        backend = MagicMock()
+
+        def list_projects(cancel_token=None, on_page=None):
+            on_page(["PROJ - Project"])
+            on_page(["NSTL - Nested", "PROJ - Project"])
+            raise OperationCancelled()
+
+        backend.list_projects.side_effect = list_projects
+        with pytest.raises(OperationCancelled):
+            get_cached_projects(backend)
+
+        # Served at once, but refreshed because discovery never finished
+        assert get_cached_projects(backend) == ["NSTL - Nested", "PROJ - Project"]
+        mock_thread.return_value.start.assert_called_once()
+        assert backend.list_projects.call_count == 1
+
+    @patch("create_issue_interactive.fetch_projects")
+    def test_force_refresh_fetches_and_saves(self, mock_fetch):
+        """Test that forcing a refresh ignores and replaces the cache"""
+        save_project_cache(["OLD - Old"])
+        mock_fetch.return_value = ["NEW - New"]
+        projects = get_cached_projects(SubprocessBackend("jcli"), force_refresh=True)
+        assert projects == ["NEW - New"]
+        assert load_project_cache()[0] == ["NEW - New"]
+
+    @patch("create_issue_interactive.print_info")
+    @patch("create_issue_interactive.fetch_projects")
+    def test_fallback_projects_not_cached(self, mock_fetch, mock_print_info):
+        """Test that the hardcoded fallback list is never cached"""
+        mock_fetch.return_value = None
+        assert get_available_projects(SubprocessBackend("jcli")) == ["NSTL", "OTHER"]
+        assert load_project_cache() is None
+
+
+class TestProjectDiscovery:
+    """Test paging through issues to discover projects"""
+
+    @staticmethod
+    def page(*keys):
+        """A CompletedProcess with one issue per project key"""
+        issues = [
+            {
+                "key": f"{key}-1",
+                "fields": {"project": {"key": key, "name": key.title()}},
+            }
+            for key in keys
+        ]
+        return mock.Mock(returncode=0, stdout=json.dumps({"issues": issues}))
+
+    @patch("create_issue_interactive.run_command")
+    def test_pages_until_short_page(self, mock_run):
+        """Test that paging continues past the first page and stops at a short one"""
+        mock_run.side_effect = [self.page("AAA", "BBB"), self.page("CCC")]
+        pages = list(iter_project_pages("jcli", page_size=2))
+
+        assert pages == [["AAA - Aaa", "BBB - Bbb"], ["CCC - Ccc"]]
+        first, second = [call.args[0] for call in mock_run.call_args_list]
+        assert "--start-at" not in first
+        assert second[second.index("--start-at") + 1] == "2"
+
+    @patch("create_issue_interactive.run_command")
+    def test_stops_after_stale_pages(self, mock_run):
+        """Test that paging stops once pages stop adding projects"""
+        mock_run.side_effect = [self.page("AAA", "BBB")] + [self.page("AAA", "AAA")] * 5
+        pages = list(iter_project_pages("jcli", page_size=2, stale_pages=2))
+
+        assert pages == [["AAA - Aaa", "BBB - Bbb"]]
+        assert mock_run.call_count == 3
+
+    @patch("create_issue_interactive.run_command")
+    def test_failed_page_keeps_earlier_results(self, mock_run):
+        """Test that a jcli rejecting --start-at still yields the first page"""
+        mock_run.side_effect = [
+            self.page("AAA", "BBB"),
+            mock.Mock(returncode=2, stdout="", stderr="unrecognized arguments"),
+        ]
+        on_page = MagicMock()
+        assert fetch_projects("jcli", on_page=on_page) == ["AAA - Aaa", "BBB - Bbb"]
+        on_page.assert_called_once_with(["AAA - Aaa", "BBB - Bbb"])
+
+
+class TestSpool:
+    """Test the offline creation spool and its replay"""
+
+    FIELDS = {"project": "PROJ", "issue_type": "Task", "summary": "Work"}
+
+    @pytest.fixture(autouse=True)
+    def spool_dir(self, tmp_path):
+        """Point the spool at a temporary directory"""
+        with patch(
+            "create_issue_interactive.get_spool_dir", return_value=str(tmp_path)
+        ), patch("create_issue_interactive.print_info"), patch(
+            "create_issue_interactive.print_success"
+        ), patch("create_issue_interactive.print_error"):
+            yield tmp_path
+
+    def test_spool_round_trip(self):
+        """Test that spooled creations are loaded oldest first"""
+        spool_issue(dict(self.FIELDS, summary="First"), "key1", "timed out")
+        spool_issue(dict(self.FIELDS, summary="Second"), "key2")
+        entries = load_spool()
+        assert [entry["idempotency_key"] for entry in entries] == ["key1", "key2"]
+        assert entries[0]["last_error"] == "timed out"
+
+    def test_idempotency_label_in_command(self):
+        """Test that the idempotency key is sent as a label"""
+        cmd = build_create_command("jcli", "PROJ", "Task", "Work", idempotency_key="k")
+        assert cmd[-3:] == ["--set-field", "labels", "jiracli-helpers-k"]
+
+    def test_replay_skips_existing_issue(self):
+        """Test that an issue created by an earlier attempt is not duplicated"""
+        spool_issue(self.FIELDS, "key1")
+        backend = MagicMock()
+        backend.find_issue.return_value = "PROJ-9"
+
+        result = replay_spool_entry(backend, load_spool()[0])
+
+        assert result == {"idempotency_key": "key1", "key": "PROJ-9", "existing": True}
+        backend.create_issue.assert_not_called()
+        assert load_spool() == []
+
+    def test_replay_without_label(self):
+        """Test that an entry spooled without its label is created without one"""
+        spool_issue(self.FIELDS, "key1", labelled=False)
+        backend = MagicMock()
+        backend.create_issue.return_value = "Created PROJ-4"
+
+        result = replay_spool_entry(backend, load_spool()[0])
+
+        assert result == {"idempotency_key": "key1", "key": "PROJ-4"}
+        backend.find_issue.assert_not_called()
+        assert backend.create_issue.call_args[1]["idempotency_key"] is None
+
+        # Nothing could tell whether a failed attempt created it, so no retry
+        spool_issue(self.FIELDS, "key2", labelled=False)
+        backend.create_issue.side_effect = RuntimeError("read timed out")
+        result = replay_spool_entry(backend, load_spool()[0], retries=2, backoff=0)
+        assert result == {"idempotency_key": "key2", "error": "read timed out"}
+        assert backend.create_issue.call_count == 2
+
+    def test_replay_retries_then_keeps_entry(self):
+        """Test that an entry that keeps failing stays spooled with its error"""
+        spool_issue(self.FIELDS, "key1")
+        backend = MagicMock()
+        backend.find_issue.return_value = None
+        backend.create_issue.side_effect = RuntimeError("VPN down")
+
+        result = replay_spool_entry(backend, load_spool()[0], retries=2, backoff=0)
+
+        assert result == {"idempotency_key": "key1", "error": "VPN down"}
+        assert backend.create_issue.call_count == 3
+        entry = load_spool()[0]
+        assert entry["attempts"] == 3
+        assert entry["last_error"] == "VPN down"
+
+    def test_drain_spool_concurrently(self):
+        """Test that drained entries are created in parallel with their keys"""
+        for i in range(4):
+            spool_issue(dict(self.FIELDS, summary=str(i)), f"key{i}")
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def create(*args, idempotency_key=None, extra_fields=None):
+            with lock:
+                running.append(idempotency_key)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(idempotency_key)
+            return f"Created PROJ-{args[2]}"
+
+        backend = MagicMock()
+        backend.find_issue.return_value = None
+        backend.create_issue.side_effect = create
+
+        results = drain_spool(backend, workers=4)
+
+        assert [result["key"] for result in results] == [f"PROJ-{i}" for i in range(4)]
+        assert max(peak) > 1
+        assert load_spool() == []
+
+
+CREATEMETA = {
+    "projects": [
+        {
+            "key": "PROJ",
+            "issuetypes": [
+                {
+                    "name": "Bug",
+                    "fields": {
+                        "summary": {"name": "Summary", "required": True},
+                        "priority": {
+                            "name": "Priority",
+                            "required": False,
+                            "allowedValues": [{"name": "High"}, {"name": "Low"}],
+                        },
+                        "customfield_1": {"name": "Component", "required": True},
+                        "labels": {"name": "Labels", "required": False},
+                        "reporter": {
+                            "name": "Reporter",
+                            "required": True,
+                            "hasDefaultValue": True,
+                        },
+                    },
+                },
+                {"name": "Sub-task", "subtask": True, "fields": {}},
+                {"name": "Epic", "fields": {}},
+            ],
+        }
+    ]
+}
+
+# Metadata letting Tasks and Epics carry the idempotency label
+LABELLED_META = {
+    "issue_types": {
+        name: {"required_fields": [], "priorities": None, "labels": True}
+        for name in ("Task", "Epic")
+    }
+}
+
+
+@pytest.mark.usefixtures("meta_cache_file")
+class TestCreateMeta:
+    """Test per-project create metadata"""
+
+    @pytest.fixture(autouse=True)
+    def jira_identity(self):
+        """Fix the JIRA identity the cache is keyed by"""
+        with patch(
+            "create_issue_interactive.load_jira_identity",
+            return_value=("https://jira.example.com", "user"),
+        ):
+            yield
+
+    def test_parse_create_meta(self):
+        """Test reducing createmeta to issue types, priorities and required fields"""
+        meta = parse_create_meta(CREATEMETA, "PROJ")
+        assert get_issue_type_options(meta) == ["Bug", "Epic"]
+        assert get_priority_options("PROJ", meta, "Bug") == ["High", "Low"]
+        # Epic has no priority field on its create screen
+        assert get_priority_options("PROJ", meta, "Epic") == []
+        assert meta["issue_types"]["Bug"]["required_fields"] == [
+            {"id": "summary", "name": "Summary"},
+            {"id": "customfield_1", "name": "Component"},
+        ]
+        assert parse_create_meta(CREATEMETA, "OTHER") is None
+
+    def test_defaults_without_meta(self):
+        """Test the built-in menus when no metadata is available"""
+        assert get_issue_type_options(None) == ["Task", "Epic"]
+        assert get_priority_options("PROJ", None, "Task")[3] == "Normal"
+
+    def test_missing_required_fields(self):
+        """Test finding required fields that would not be sent"""
+        meta = parse_create_meta(CREATEMETA, "PROJ")
+        fields = {"issue_type": "Bug", "summary": "Broken"}
+        assert get_missing_required_fields(meta, "Bug", fields) == ["Component"]
+        assert get_missing_required_fields(
+            meta, "Bug", fields, {"Component": "UI"}
+        ) == []
+        assert get_missing_required_fields(None, "Bug", fields) == []
+
+    def test_idempotency_label_only_when_settable(self):
+        """Test that the label is sent only to issue types with a labels field"""
+        meta = parse_create_meta(CREATEMETA, "PROJ")
+        assert can_label_issue(meta, "Bug") is True
+        assert can_label_issue(meta, "Epic") is False
+        assert can_label_issue(None, "Bug") is False
+
+        backend = MagicMock()
+        backend.get_create_meta.return_value = meta
+        backend.find_issue.return_value = None
+        backend.create_issue.return_value = "Created PROJ-1"
+        spec = {"project": "PROJ", "summary": "x", "idempotency_key": "k"}
+        create_issue(
+            dict(spec, issue_type="Bug", extra_fields={"Component": "UI"}), backend
+        )
+        assert backend.create_issue.call_args[1]["idempotency_key"] == "k"
+        backend.find_issue.assert_called_once_with("k")
+
+        # A key the issue cannot carry is refused, not silently dropped
+        with pytest.raises(ValueError, match="idempotency_key"):
+            create_issue(dict(spec, issue_type="Epic"), backend)
+        result = create_issue(
+            dict(spec, issue_type="Epic", idempotency_key=None), backend
+        )
+        assert result["idempotent"] is False
+        assert backend.create_issue.call_args[1]["idempotency_key"] is None
+        assert backend.find_issue.call_count == 1
+
+        # A required labels field is only filled by the label where it is sent
+        for issue_type in meta["issue_types"].values():
+            issue_type["required_fields"].append({"id": "labels", "name": "Labels"})
+        fields = {"summary": "x", "extra_fields": {"Component": "UI"}}
+        assert get_missing_required_fields(
+            meta, "Bug", fields, fields["extra_fields"]
+        ) == []
+        assert get_missing_required_fields(meta, "Epic", fields) == ["Labels"]
+
+    def test_create_meta_cached(self):
+        """Test that metadata is fetched once and served from the cache"""
+        backend = MagicMock()
+        backend.get_create_meta.return_value = parse_create_meta(CREATEMETA, "PROJ")
+
+        first = get_create_meta(backend, "PROJ")
+        second = get_create_meta(backend, "PROJ")
+
+        assert first == second
+        backend.get_create_meta.assert_called_once_with("PROJ")
+        get_create_meta(backend, "PROJ", force_refresh=True)
+        assert backend.get_create_meta.call_count == 2
+        get_create_meta(backend, "PROJ", ttl=-1)
+        assert backend.get_create_meta.call_count == 3
+
+    def test_concurrent_saves_keep_every_project(self, meta_cache_file):
+        """Test that metadata saved from several threads at once is all kept"""
+        meta = parse_create_meta(CREATEMETA, "PROJ")
+        threads = [
+            threading.Thread(target=save_create_meta_cache, args=(f"P{i}", meta))
+            for i in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with open(meta_cache_file) as f:
+            assert len(json.load(f)) == 20
+        assert os.listdir(os.path.dirname(meta_cache_file)) == [
+            "create_meta_cache.json"
+        ]
+
+    def test_create_meta_unavailable(self):
+        """Test that a backend error leaves the built-in menus in place"""
+        backend = MagicMock()
+        backend.get_create_meta.side_effect = ImportError("No module named 'jcli'")
+        assert get_create_meta(backend, "PROJ") is None
+
+    def test_connector_backend_create_meta(self):
+        """Test that the connector backend asks JIRA Cloud for createmeta"""
+        connector = MagicMock()
+        connector.jira.server_info.return_value = {"deploymentType": "Cloud"}
+        connector.jira.createmeta.return_value = CREATEMETA
+        meta = ConnectorBackend(connector).get_create_meta("PROJ")
+        assert list(meta["issue_types"]) == ["Bug", "Epic"]
+        connector.jira.createmeta.assert_called_once_with(
+            projectKeys="PROJ", expand="projects.issuetypes.fields"
+        )
+
+    def test_create_issue_rejects_missing_fields(self):
+        """Test that create_issue validates before calling jcli"""
+        backend = MagicMock()
+        backend.get_create_meta.return_value = parse_create_meta(CREATEMETA, "PROJ")
+
+        with pytest.raises(ValueError, match="missing required fields: Component"):
+            create_issue(
+                {"project": "PROJ", "issue_type": "Bug", "summary": "x"}, backend
+            )
+        with pytest.raises(ValueError, match="'Task' is not one of: Bug, Epic"):
+            create_issue({"project": "PROJ", "summary": "x"}, backend)
+        backend.create_issue.assert_not_called()
+
+        backend.create_issue.return_value = "Created PROJ-1"
+        create_issue(
+            {
+                "project": "PROJ",
+                "issue_type": "Bug",
+                "summary": "x",
+                "extra_fields": {"Component": "UI"},
+            },
+            backend,
+        )
+        assert backend.create_issue.call_args[1]["extra_fields"] == {"Component": "UI"}
+
+
+class TestIssueMirror:
+    """Test the SQLite issue mirror and duplicate detection from it"""
+
+    @pytest.fixture(autouse=True)
+    def mirror_file(self, tmp_path):
+        """Point the mirror at a temporary file and fix the JIRA identity"""
+        mirror_file = str(tmp_path / "issue_mirror.sqlite3")
+        with patch(
+            "create_issue_interactive.get_mirror_file", return_value=mirror_file
+        ), patch(
+            "create_issue_interactive.load_jira_identity",
+            return_value=("https://jira.example.com", "user"),
+        ):
+            yield mirror_file
+
+    @staticmethod
+    def issue(key, summary="", updated="2024-01-01T00:00:00.000+0000", name="Project"):
+        """An issue as JiraBackend.search_issues returns it"""
+        return {
+            "key": key,
+            "summary": summary,
+            "project": key.rsplit("-", 1)[0],
+            "project_name": name,
+            "updated": updated,
+        }
+
+    def test_similar_ranking(self):
+        """Test that reworded summaries rank above unrelated ones"""
+        index = SummaryIndex({
+            "PROJ-3": "Login page crashes on Safari",
+            "PROJ-2": "Update the release notes",
+            "PROJ-1": "Safari login page crash",
+        })
+        similar = index.similar("Fix login page crash on Safari")
+        assert [key for key, _, _ in similar] == ["PROJ-1", "PROJ-3"]
+        assert similar[0][1] == "Safari login page crash"
+        assert 0.75 <= similar[1][2] < similar[0][2] < 1
+        assert index.similar("Login page crashes on Safari")[0][2] == 1.0
+        assert index.similar("") == []
+        assert SummaryIndex({}).similar("anything") == []
+
+    def test_similar_ignores_one_shared_word(self):
+        """Test that short summaries sharing only one word are not duplicates"""
+        index = SummaryIndex({"PROJ-1": "My summary", "PROJ-2": "Login crash"})
+        assert index.similar("Events summary") == []
+        assert index.similar("Update summary") == []
+
+    def test_similar_limit_prefers_recent(self):
+        """Test that equally similar issues are cut off newest first"""
+        index = SummaryIndex({f"PROJ-{i}": "Flaky test" for i in range(5, 0, -1)})
+        similar = index.similar("flaky TEST", limit=2)
+        assert [key for key, _, _ in similar] == ["PROJ-5", "PROJ-4"]
+
+    def test_mirror_upserts_and_orders(self):
+        """Test that upserts replace issues and reads return newest first"""
+        mirror = IssueMirror()
+        mirror.upsert([
+            self.issue("PROJ-1", "Old", "2024-01-01T00:00:00.000+0000"),
+            self.issue("PROJ-2", "Newer", "2024-02-01T00:00:00.000+0000"),
+            self.issue("OTHER-1", "Elsewhere", name="Other"),
+        ])
+        mirror.upsert([self.issue("PROJ-1", "Renamed", "2024-03-01T00:00:00.000+0000")])
+
+        assert mirror.recent_summaries("PROJ", 10) == {
+            "PROJ-1": "Renamed", "PROJ-2": "Newer"
+        }
+        assert list(mirror.recent_summaries("PROJ", 1)) == ["PROJ-1"]
+        assert mirror.projects() == ["OTHER - Other", "PROJ - Project"]
+
+        # A created issue with no project name keeps the known one
+        mirror_created_issue("PROJ-3", "PROJ", "Just created")
+        assert list(mirror.recent_summaries("PROJ", 10))[0] == "PROJ-3"
+        assert mirror.projects() == ["OTHER - Other", "PROJ - Project"]
+
+        # A new name replaces the known one
+        mirror.add_projects(["OTHER - Renamed", "NEW"])
+        assert mirror.projects() == ["NEW", "OTHER - Renamed", "PROJ - Project"]
+
+    def test_mirror_keyed_by_identity(self):
+        """Test that a different server/user sees none of the mirrored data"""
+        mirror = IssueMirror()
+        mirror.upsert([self.issue("PROJ-1", "Mine")])
+        mirror.set_watermark("PROJ", 100.0)
+        other = IssueMirror(account="https://other.example.com|user")
+        assert other.recent_summaries("PROJ", 10) == {}
+        assert other.projects() == []
+        assert other.get_watermark("PROJ") is None
+        assert mirror.get_watermark("PROJ") == 100.0
+
+    def test_sync_seeds_then_fetches_changes(self):
+        """Test that the first sync seeds and later ones ask for changes only"""
+        mirror = IssueMirror()
+        backend = MagicMock()
+        backend.search_issues.return_value = IssuePage(
+            [self.issue("PROJ-1", "First")], total=1
+        )
+
+        assert sync_issue_mirror(backend, mirror, "PROJ") == 1
+        backend.search_issues.assert_called_once_with(
+            'project = "PROJ" ORDER BY updated DESC', 100, 0
+        )
+        synced_at = mirror.get_watermark("PROJ")
+        assert synced_at is not None
+        assert mirror.get_watermark(ALL_PROJECTS) is None
+
+        # Ten minutes later only issues updated since then are fetched
+        backend.search_issues.reset_mock()
+        backend.search_issues.side_effect = [
+            IssuePage([self.issue(f"PROJ-{i}") for i in range(100)], total=101),
+            IssuePage([self.issue("PROJ-100")], total=101),
+        ]
+        with patch("time.time", return_value=synced_at + 600):
+            assert sync_issue_mirror(backend, mirror, "PROJ") == 101
+        jql = 'project = "PROJ" AND updated >= "-12m" ORDER BY updated ASC'
+        assert backend.search_issues.call_args_list == [
+            mock.call(jql, 100, 0),
+            mock.call(jql, 100, 100),
+        ]
+        assert mirror.get_watermark("PROJ") == synced_at + 600
+        assert len(mirror.recent_summaries("PROJ", 1000)) == 101
+
+    def test_sync_pages_past_capped_pages(self):
+        """Test that pages shorter than asked for do not end the sync"""
+        mirror = IssueMirror()
+        backend = MagicMock()
+        backend.search_issues.side_effect = [
+            IssuePage([self.issue(f"PROJ-{i}") for i in range(50)]),
+            IssuePage([self.issue(f"PROJ-{i}") for i in range(50, 60)]),
+            IssuePage(),
+        ]
+
+        assert sync_issue_mirror(backend, mirror, "PROJ") == 60
+        assert [call.args[2] for call in backend.search_issues.call_args_list] == [
+            0, 50, 60
+        ]
+
+    def test_truncated_sync_resumes_after_last_change(self):
+        """Test that a sync cut short at its page limit does not skip the rest"""
+        mirror = IssueMirror()
+        mirror.set_watermark("PROJ", 1_700_000_000.0)
+        newest = "2023-11-14T23:00:00.000+0000"
+        pages = [
+            IssuePage([self.issue(f"PROJ-{i}") for i in range(100)], total=5000)
+            for _ in range(MIRROR_SYNC_MAX_PAGES - 1)
+        ]
+        pages.append(IssuePage(
+            [self.issue(f"PROJ-{i}", updated=newest) for i in range(100)], total=5000
+        ))
+        backend = MagicMock()
+        backend.search_issues.side_effect = pages
+
+        with patch("time.time", return_value=1_700_000_000.0 + 86400):
+            assert sync_issue_mirror(backend, mirror, "PROJ") == 2000
+        assert "ORDER BY updated ASC" in backend.search_issues.call_args.args[0]
+        assert mirror.get_watermark("PROJ") == 1_700_002_800.0
+
+        # An unreadable timestamp keeps the old watermark
+        pages[-1] = IssuePage([self.issue("PROJ-1", updated="")] * 100, total=5000)
+        backend.search_issues.side_effect = pages
+        with patch("time.time", return_value=1_700_000_000.0 + 86400):
+            sync_issue_mirror(backend, mirror, "PROJ")
+        assert mirror.get_watermark("PROJ") == 1_700_002_800.0
+
+    def test_sync_only_when_stale(self):
+        """Test that a fresh mirror is served without asking JIRA"""
+        backend = MagicMock()
+        backend.search_issues.return_value = IssuePage(
+            [self.issue("PROJ-9", "Recent")], total=1
+        )
+
+        assert sync_summary_index(backend, "PROJ") == {"PROJ-9": "Recent"}
+        assert sync_summary_index(backend, "PROJ") == {"PROJ-9": "Recent"}
+        backend.search_issues.assert_called_once()
+
+        backend.search_issues.side_effect = RuntimeError("502 Bad Gateway")
+        assert sync_summary_index(backend, "PROJ", ttl=-1) == {"PROJ-9": "Recent"}
+
+    def test_projects_answered_from_mirror(self):
+        """Test that project discovery runs once, then only changes are fetched"""
+        backend = MagicMock()
+        backend.list_projects.return_value = ["PROJ - Project"]
+        with patch("create_issue_interactive.save_project_cache"):
+            assert get_available_projects(backend) == ["PROJ - Project"]
+            backend.search_issues.return_value = IssuePage(
+                [self.issue("NEW-1", name="New")], total=1
+            )
+            assert get_available_projects(backend) == ["NEW - New", "PROJ - Project"]
+            backend.list_projects.assert_called_once()
+
+            # Refreshing always runs the full discovery
+            get_available_projects(backend, use_mirror=False)
+            assert backend.list_projects.call_count == 2
+
+    @patch("create_issue_interactive.run_command")
+    def test_subprocess_backend_search_issues(self, mock_run):
+        """Test searching issues through jcli issues list"""
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=json.dumps({"total": 102, "issues": [
+                {
+                    "key": "PROJ-2",
+                    "fields": {
+                        "summary": "Second",
+                        "project": {"key": "PROJ", "name": "Project"},
+                        "updated": "2024-01-02T00:00:00.000+0000",
+                    },
+                },
+                {"key": "PROJ-1", "fields": {"summary": None}},
+            ]}),
+        )
+        issues = SubprocessBackend("jcli").search_issues("project = PROJ", 50, 100)
+        assert issues == [
+            self.issue("PROJ-2", "Second", "2024-01-02T00:00:00.000+0000"),
+            self.issue("PROJ-1", "", "", ""),
+        ]
+        assert issues.total == 102
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("--jql") + 1] == "project = PROJ"
+        assert cmd[cmd.index("--max-issues") + 1] == "50"
+        assert cmd[cmd.index("--start-at") + 1] == "100"
+
+
+@pytest.mark.usefixtures("meta_cache_file")
+class TestCreateIssueApi:
+    """Test non-interactive creation through create_issue(spec)"""
+
+    def test_normalize_issue_spec_defaults(self):
+        """Test that specs get the defaults the prompts would give"""
+        fields = normalize_issue_spec(
+            {"project": "PROJ - Project", "issue_type": "Epic", "summary": "Work"}
+        )
+        assert fields["project"] == "PROJ"
+        assert fields["epic_name"] == "Work"
+        fields = normalize_issue_spec({"project": "P", "summary": "S"})
+        assert fields["issue_type"] == "Task"
+
+    def test_normalize_issue_spec_rejects_bad_fields(self):
+        """Test that missing fields and malformed dates are rejected"""
+        with pytest.raises(ValueError, match="'summary' is required"):
+            normalize_issue_spec({"project": "PROJ"})
+        with pytest.raises(ValueError, match="YYYY-MM-DD"):
+            normalize_issue_spec({"project": "P", "summary": "S", "due_date": "31/01"})
+
+    def test_create_issue_returns_key_and_timings(self):
+        """Test that create_issue passes the fields to the backend"""
+        backend = MagicMock()
+        backend.create_issue.return_value = "Created PROJ-5\n"
+
+        result = create_issue(
+            {"project": "PROJ", "summary": "Work", "due_date": "2024-01-31"}, backend
+        )
+
+        assert result["key"] == "PROJ-5"
+        assert result["existing"] is False
+        assert set(result["timings"]) == {"metadata_ms", "create_ms", "total_ms"}
+        args, kwargs = backend.create_issue.call_args
+        assert args == ("PROJ", "Task", "Work", "", "2024-01-31", "", None)
+        # Without metadata showing a labels field, no label is sent
+        assert kwargs["idempotency_key"] is None
+        assert result["idempotency_key"]
+        backend.find_issue.assert_not_called()
+
+    def test_create_issue_with_existing_idempotency_key(self):
+        """Test that a caller-supplied key returns an issue it already created"""
+        backend = MagicMock()
+        backend.get_create_meta.return_value = LABELLED_META
+        backend.find_issue.return_value = "PROJ-3"
+
+        result = create_issue(
+            {"project": "PROJ", "summary": "Work", "idempotency_key": "abc"}, backend
+        )
+
+        assert result["key"] == "PROJ-3"
+        assert result["existing"] is True
+        backend.create_issue.assert_not_called()
+
+    def test_create_issue_refuses_key_without_metadata(self):
+        """Test that a key is refused when nothing shows it can be sent"""
+        backend = MagicMock()
+        backend.get_create_meta.return_value = None
+
+        with pytest.raises(ValueError, match="idempotency_key"):
+            create_issue(
+                {"project": "PROJ", "summary": "Work", "idempotency_key": "abc"},
+                backend,
+            )
+        backend.find_issue.assert_not_called()
+        backend.create_issue.assert_not_called()
+
+    @patch("create_issue_interactive.get_jcli_latency_file")
+    @patch("create_issue_interactive.detect_jcli_command", return_value="jcli")
+    @patch("create_issue_interactive.print_info")
+    @patch("create_issue_interactive.run_command")
+    def test_main_json_flags(
+        self,
+        mock_run,
+        mock_print_info,
+        mock_detect,
+        mock_latency_file,
+        tmp_path,
+        capsys,
+    ):
+        """Test that the CLI flags create an issue and print JSON"""
+        mock_latency_file.return_value = str(tmp_path / "jcli_latency.json")
+        mock_run.return_value = MagicMock(returncode=0, stdout="Created PROJ-8\n")
+
+        assert main(
+            ["--project", "PROJ", "--summary", "Work", "--priority", "Major", "--json"]
+        ) == 0
+
+        result = json.loads(capsys.readouterr().out)
+        assert result["key"] == "PROJ-8"
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("--summary") + 1] == "Work"
+        assert cmd[9:12] == ["--set-field", "priority", "Major"]
+
+    @patch("create_issue_interactive.get_spool_dir")
+    @patch("create_issue_interactive.get_jcli_latency_file")
+    @patch("create_issue_interactive.detect_jcli_command", return_value="jcli")
+    @patch("create_issue_interactive.print_info")
+    @patch("create_issue_interactive.run_command")
+    def test_main_spools_failed_creation(
+        self,
+        mock_run,
+        mock_print_info,
+        mock_detect,
+        mock_latency_file,
+        mock_spool_dir,
+        tmp_path,
+        capsys,
+    ):
+        """Test that a creation JIRA fails is spooled, and an invalid spec is not"""
+        mock_latency_file.return_value = str(tmp_path / "jcli_latency.json")
+        mock_spool_dir.return_value = str(tmp_path / "spool")
+        os.makedirs(mock_spool_dir.return_value)
+        mock_run.return_value = subprocess.CompletedProcess(
+            [], 1, "", "503 Service Unavailable\n"
+        )
+
+        assert main(["--project", "PROJ", "--summary", "Work", "--json"]) == 1
+
+        assert json.loads(capsys.readouterr().out) == {
+            "error": "503 Service Unavailable", "spooled": True
+        }
+        [entry] = load_spool()
+        assert entry["fields"]["summary"] == "Work"
+        assert entry["last_error"] == "503 Service Unavailable"
+        assert entry["labelled"] is False
+
+        assert main(
+            ["--project", "PROJ", "--summary", "Late", "--due", "soon", "--json"]
+        ) == 1
+        assert json.loads(capsys.readouterr().out)["spooled"] is False
+        assert len(load_spool()) == 1
+
+    def test_main_requires_project_and_summary(self):
+        """Test that a partial set of creation flags is rejected"""
+        with pytest.raises(SystemExit):
+            main(["--summary", "Work"])
+
+
+@pytest.mark.usefixtures("meta_cache_file")
+class TestIssueTree:
+    """Test creating an Epic and its children from a tree spec"""
+
+    TREE = {
+        "project": "PROJ",
+        "epic": {"summary": "Checkout"},
+        "children": [
+            {"summary": "Cart"}, {"summary": "Payment"}, {"summary": "Receipt"}
+        ],
+    }
+
+    @staticmethod
+    def backend(fail=()):
+        """A backend numbering created issues, failing for summaries in fail"""
+        created = []
+        lock = threading.Lock()
+
+        def create(project, issue_type, summary, *args, **kwargs):
+            time.sleep(0.05)
+            if summary in fail:
+                raise RuntimeError("503 Service Unavailable")
+            with lock:
+                created.append((summary, kwargs["extra_fields"]))
+                return f"Created {project}-{len(created)}"
+
+        backend = MagicMock()
+        backend.get_create_meta.return_value = LABELLED_META
+        backend.find_issue.return_value = None
+        backend.create_issue.side_effect = create
+        backend.created = created
+        return backend
+
+    def test_tree_specs_defaults(self):
+        """Test that nodes inherit the project and the Epic gets its template"""
+        epic, children = get_tree_specs(self.TREE)
+        assert epic["issue_type"] == "Epic"
+        assert epic["description"] == get_epic_description_template()
+        assert [child["project"] for child in children] == ["PROJ"] * 3
+
+    def test_invalid_tree_rejected(self, tmp_path):
+        """Test that a bad node is reported before anything is created"""
+        path = tmp_path / "tree.json"
+        path.write_text(json.dumps({"project": "PROJ", "epic": {"summary": "E"},
+                                    "children": [{"summary": "A"}, {}]}))
+        with pytest.raises(ValueError, match="child 2: 'summary' is required"):
+            load_issue_tree(str(path))
+        path.write_text(json.dumps({"project": "PROJ", "children": []}))
+        with pytest.raises(ValueError, match="'epic'"):
+            load_issue_tree(str(path))
+
+    def test_epic_first_then_children_linked(self):
+        """Test that children are created concurrently under the new Epic"""
+        backend = self.backend()
+        started = time.monotonic()
+
+        state = create_issue_tree(self.TREE, backend, workers=3)
+
+        assert time.monotonic() - started < 0.15 + 0.05 * 2
+        assert backend.created[0] == ("Checkout", {})
+        assert sorted(backend.created[1:]) == [
+            (summary, {"Epic Link": "PROJ-1"})
+            for summary in ("Cart", "Payment", "Receipt")
+        ]
+        assert state["epic"]["key"] == "PROJ-1"
+        assert all(entry.get("key") for entry in state["children"])
+        backend.find_issue.assert_not_called()
+
+    def test_failed_epic_skips_children(self):
+        """Test that no child is attempted without an Epic to link to"""
+        backend = self.backend(fail={"Checkout"})
+        state = create_issue_tree(self.TREE, backend)
+        assert state["epic"]["error"] == "503 Service Unavailable"
+        assert not any(entry.get("attempted") for entry in state["children"])
+
+    def test_resume_creates_only_missing_children(self, tmp_path):
+        """Test that a rerun looks up and creates only the failed children"""
+        state_file = str(tmp_path / "tree.state.json")
+        saves = []
+
+        def save(state):
+            saves.append(json.loads(json.dumps(state)))
+            with open(state_file, "w") as f:
+                json.dump(state, f)
+
+        backend = self.backend(fail={"Payment"})
+        state = create_issue_tree(
+            self.TREE, backend, load_tree_state(state_file, self.TREE), save
+        )
+        assert [entry.get("error") for entry in state["children"]] == [
+            None, "503 Service Unavailable", None
+        ]
+        # Every node is marked attempted before its creation is sent
+        assert saves[0]["epic"]["attempted"] and "key" not in saves[0]["epic"]
+
+        backend = self.backend()
+        state = create_issue_tree(
+            self.TREE, backend, load_tree_state(state_file, self.TREE), save
+        )
+        assert backend.created == [("Payment", {"Epic Link": "PROJ-1"})]
+        backend.find_issue.assert_called_once_with(
+            state["children"][1]["idempotency_key"]
+        )
+        assert "error" not in state["children"][1]
+
+    def test_changed_tree_starts_afresh(self, tmp_path):
+        """Test that saved progress is only reused for unchanged nodes"""
+        state_file = tmp_path / "tree.state.json"
+        state = load_tree_state(str(state_file), self.TREE)
+        state["epic"]["key"] = "PROJ-1"
+        state["children"][0]["key"] = "PROJ-2"
+        state_file.write_text(json.dumps(state))
+
+        tree = dict(self.TREE, children=[{"summary": "Cart"}, {"summary": "Refund"}])
+        resumed = load_tree_state(str(state_file), tree)
+        assert resumed["children"][0]["key"] == "PROJ-2"
+        assert "key" not in resumed["children"][1]
+
+        tree = dict(self.TREE, epic={"summary": "Checkout v2"})
+        resumed = load_tree_state(str(state_file), tree)
+        assert not any("key" in entry for entry in resumed["children"])
+
+
+class TestBackends:
+    """Test the subprocess and in-process JIRA backends"""
+
+    def test_build_create_command_minimal(self):
+        """Test the create command with only required fields"""
+        cmd = build_create_command("jcli", "PROJ", "Task", "Summary")
+        assert cmd == [
+            "jcli", "issues", "create",
+            "--project", "PROJ",
+            "--issue-type", "Task",
+            "--summary", "Summary",
+        ]
+
+    def test_build_create_command_all_fields(self):
+        """Test the create command with every optional field"""
+        cmd = build_create_command(
+            "jcli", "PROJ", "Epic", "Summary", "Desc", "2024-01-31", "Major", "Name"
+        )
+        assert cmd[-11:] == [
+            "--description", "Desc",
+            "--set-field", "duedate", "2024-01-31",
+            "--set-field", "priority", "Major",
+            "--set-field", "Epic Name", "Name",
+        ]
+
+    def test_extract_issue_key(self):
+        """Test finding the created issue key in jcli output"""
+        assert extract_issue_key("Created issue PROJ-123 (url)") == "PROJ-123"
+        assert extract_issue_key("no key here") is None
+
+    @patch("create_issue_interactive.print_info")
+    @patch("create_issue_interactive.run_command")
+    def test_subprocess_backend_create_issue(self, mock_run, mock_print_info):
+        """Test that the subprocess backend runs jcli issues create"""
+        mock_run.return_value = MagicMock(stdout="PROJ-1\n")
+        output = SubprocessBackend("jcli").create_issue("PROJ", "Task", "Summary")
+        assert output == "PROJ-1\n"
+        assert mock_run.call_args[0][0][:3] == ["jcli", "issues", "create"]
+
+    @patch("create_issue_interactive.print_info")
+    def test_connector_backend_create_issue(self, mock_print_info):
+        """Test that the connector backend maps fields onto one session"""
+        connector = MagicMock()
+        connector.jira.fields.return_value = [
+            {"name": "Epic Name", "id": "customfield_10011"}
+        ]
+        connector.jira.create_issue.return_value = MagicMock(key="PROJ-2")
+        backend = ConnectorBackend(connector)
+
+        key = backend.create_issue(
+            "PROJ", "Epic", "Summary", "", "2024-01-31", "Major", "Name"
+        )
+
+        assert key == "PROJ-2"
+        fields = connector.jira.create_issue.call_args[1]["fields"]
+        assert fields["project"] == {"key": "PROJ"}
+        assert fields["priority"] == {"name": "Major"}
+        assert fields["duedate"] == "2024-01-31"
+        assert fields["customfield_10011"] == "Name"
+        assert "description" not in fields
+
+    def test_connector_backend_list_projects(self):
+        """Test that the connector backend formats projects"""
+        connector = MagicMock()
+        project = MagicMock(key="PROJ")
+        project.name = "Project"
+        connector.jira.projects.return_value = [project]
+        assert ConnectorBackend(connector).list_projects() == ["PROJ - Project"]
+
+    @patch("create_issue_interactive.print_error")
+    @patch("create_issue_interactive.print_info")
+    def test_connector_backend_auth_failure(self, mock_print_info, mock_print_error):
+        """Test that a failing myself() call reports an auth failure"""
+        connector = MagicMock()
+        connector.jira.myself.side_effect = Exception("401 Unauthorized")
+        assert ConnectorBackend(connector).check_auth() is False
+
+    def test_get_backend_defaults_to_subprocess(self):
+        """Test that the subprocess backend is used unless asked otherwise"""
+        assert isinstance(get_backend("jcli"), SubprocessBackend)
+
+    @patch("create_issue_interactive.load_jira_connector")
+    def test_get_backend_in_process(self, mock_load):
+        """Test selecting the in-process backend"""
+        assert isinstance(get_backend("jcli", in_process=True), ConnectorBackend)
+
+    @patch("create_issue_interactive.print_info")
+    @patch("create_issue_interactive.load_jira_connector")
+    def test_get_backend_falls_back_on_import_error(self, mock_load, mock_print_info):
+        """Test falling back to subprocesses when jcli cannot be imported"""
+        mock_load.side_effect = ImportError("No module named 'jcli'")
+        backend = get_backend("jcli", in_process=True)
+        assert isinstance(backend, SubprocessBackend)
+        assert backend.jcli_cmd == "jcli"
+
+    @patch("create_issue_interactive.load_jira_connector")
+    def test_subprocess_create_meta_loads_connector_once(self, mock_load):
+        """Test that the connector, or its failure, is kept for the whole run"""
+        mock_load.return_value.jira.server_info.return_value = {
+            "deploymentType": "Cloud"
+        }
+        mock_load.return_value.jira.createmeta.return_value = CREATEMETA
+        backend = SubprocessBackend("jcli")
+        assert backend.get_create_meta("PROJ") == backend.get_create_meta("PROJ")
+        mock_load.assert_called_once_with("jcli")
+
+        mock_load.side_effect = ImportError("No module named 'jcli'")
+        backend = SubprocessBackend("jcli")
+        for _ in range(2):
+            with pytest.raises(ImportError):
+                backend.get_create_meta("PROJ")
+        assert mock_load.call_count == 2
+
+    def test_load_jira_connector_uses_matching_site_packages(self, tmp_path):
+        """Test that only this Python's venv site-packages is appended for the import"""
+        version = f"python{sys.version_info.major}.{sys.version_info.minor}"
+        site_packages = tmp_path / "lib" / version / "site-packages"
+        other = tmp_path / "lib" / "python2.7" / "site-packages"
+        for path in (site_packages / "jcli", other):
+            path.mkdir(parents=True)
+        (site_packages / "jcli" / "__init__.py").write_text("")
+        (site_packages / "jcli" / "connector.py").write_text(
+            "import sys\n"
+            "class JiraConnector:\n"
+            "    jira = None\n"
+            "    def login(self):\n"
+            "        self.jira = list(sys.path)\n"
+        )
+        (tmp_path / "bin").mkdir()
+        original_path = list(sys.path)
+
+        try:
+            jobj = load_jira_connector(str(tmp_path / "bin" / "jcli"))
+        finally:
+            for name in ["jcli.connector", "jcli"]:
+                sys.modules.pop(name, None)
+
+        assert jobj.jira[-1] == str(site_packages)
+        assert str(other) not in jobj.jira
+        assert sys.path == original_path
+
+
+class TestTracer:
+    """Test --trace span recording"""
+
+    def test_disabled_tracer_records_nothing(self):
+        """Test that spans are dropped until the tracer is enabled"""
+        tracer = Tracer()
+        with tracer.span("phase"):
+            pass
+        assert tracer.spans == []
+
+    def test_spans_written_as_jsonl(self, tmp_path):
+        """Test that finished spans are appended to the trace file"""
+        trace_file = tmp_path / "trace.jsonl"
+        tracer = Tracer()
+        tracer.enable(str(trace_file))
+
+        with tracer.span("find_jcli_command", attempt=1) as span:
+            span.set(path="/usr/bin/jcli")
+        with pytest.raises(ValueError):
+            with tracer.span("check_auth"):
+                raise ValueError("boom")
+
+        spans = [json.loads(line) for line in trace_file.read_text().splitlines()]
+        assert [span["name"] for span in spans] == ["find_jcli_command", "check_auth"]
+        assert spans[0]["kind"] == "phase"
+        assert spans[0]["attempt"] == 1
+        assert spans[0]["path"] == "/usr/bin/jcli"
+        assert spans[0]["duration_ms"] >= 0
+        assert spans[0]["thread"] == threading.current_thread().name
+        assert spans[1]["error"] == "ValueError: boom"
+
+    def test_command_span(self, tmp_path):
+        """Test that subprocess spans are named after the jcli subcommand"""
+        tracer = Tracer()
+        tracer.enable(str(tmp_path / "trace.jsonl"))
+        cmd = ["/venv/bin/jcli", "issues", "create", "--project", "PROJ"]
+        with tracer.command_span(cmd) as span:
+            span.set_result(mock.Mock(returncode=0, stdout="PROJ-1\n", stderr=""))
+        with tracer.command_span(["/venv/bin/jcli", "--version"]):
+            pass
+
+        assert tracer.spans[0]["name"] == "jcli issues create"
+        assert tracer.spans[0]["kind"] == "subprocess"
+        assert tracer.spans[0]["cmd"] == cmd
+        assert tracer.spans[0]["exit_code"] == 0
+        assert tracer.spans[0]["stdout_bytes"] == 7
+        assert tracer.spans[1]["name"] == "jcli --version"
+
+    def test_format_summary(self, tmp_path):
+        """Test the summary table totals spans by name"""
+        tracer = Tracer()
+        tracer.enable(str(tmp_path / "trace.jsonl"))
+        for duration in (10.0, 30.0):
+            tracer.record({"name": "jcli myself", "duration_ms": duration})
+        tracer.record({"name": "total", "duration_ms": 100.0})
+
+        lines = tracer.format_summary().splitlines()
+        assert lines[2].split() == ["total", "1", "100.0", "100.0"]
+        assert lines[3].split() == ["jcli", "myself", "2", "40.0", "30.0"]
+
+
+@pytest.mark.usefixtures("meta_cache_file")
+class TestHelperServer:
+    """Test the JSON-RPC --serve mode"""
+
+    @pytest.fixture
+    def backend(self):
+        """A fake backend that authenticates and creates PROJ-1"""
+        backend = MagicMock()
+        backend.check_auth.return_value = True
+        backend.create_issue.return_value = "Created PROJ-1\n"
+        return backend
+
+    @pytest.fixture(autouse=True)
+    def spool_dir(self, tmp_path):
+        """Keep the spool in a temporary directory"""
+        with patch(
+            "create_issue_interactive.get_spool_dir", return_value=str(tmp_path)
+        ):
+            yield tmp_path
+
+    @pytest.fixture
+    def server(self, backend):
+        """A server wired to the fake backend"""
+        server = HelperServer(output=io.StringIO())
+        server.backend = backend
+        server.jcli_cmd = "jcli"
+        return server
+
+    def request(self, server, method, params=None, request_id=1):
+        """Send one request line and return the response"""
+        message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+        if params is not None:
+            message["params"] = params
+        return server.handle_line(json.dumps(message))
+
+    def test_create_issue(self, server, backend):
+        """Test creating an issue over JSON-RPC"""
+        response = self.request(
+            server,
+            "create_issue",
+            {"project": "PROJ - Project", "issue_type": "Epic", "summary": "Work"},
+        )
+        assert response["result"]["key"] == "PROJ-1"
+        assert response["result"]["existing"] is False
+        args, kwargs = backend.create_issue.call_args
+        assert args == ("PROJ", "Epic", "Work", "", "", "", "Work")
+        backend.find_issue.assert_not_called()
+
+    def test_create_issue_validated_against_metadata(self, server, backend):
+        """Test that the project's create metadata is checked before creating"""
+        backend.get_create_meta.return_value = LABELLED_META
+        spec = {"project": "PROJ", "issue_type": "Bug", "summary": "S"}
+        response = self.request(server, "create_issue", spec)
+        assert response["error"]["code"] == RPC_INVALID_PARAMS
+        assert "'Bug' is not one of: Task, Epic" in response["error"]["message"]
+        backend.create_issue.assert_not_called()
+
+    def test_create_issue_idempotent(self, server, backend):
+        """Test that a known idempotency key returns the issue it created"""
+        backend.get_create_meta.return_value = LABELLED_META
+        backend.find_issue.return_value = "PROJ-3"
+        spec = {"project": "P", "summary": "S", "idempotency_key": "k"}
+        response = self.request(server, "create_issue", spec)
+        assert response["result"]["key"] == "PROJ-3"
+        assert response["result"]["existing"] is True
+        backend.create_issue.assert_not_called()
+
+    def test_get_create_meta(self, server, backend):
+        """Test that the menus get the issue types and priorities JIRA allows"""
+        backend.get_create_meta.return_value = parse_create_meta(CREATEMETA, "PROJ")
+        response = self.request(server, "get_create_meta", {"project": "PROJ - P"})
+        assert response["result"] == {
+            "issue_types": ["Bug", "Epic"],
+            "priorities": {"Bug": ["High", "Low"], "Epic": []},
+        }
+        backend.get_create_meta.assert_called_once_with("PROJ")
+
+        # Without metadata, the prompts' built-in lists are offered
+        backend.get_create_meta.return_value = None
+        params = {"project": "OTHER", "refresh": True}
+        result = self.request(server, "get_create_meta", params)["result"]
+        assert result["issue_types"] == ["Task", "Epic"]
+        assert result["priorities"]["Task"] == get_priority_options("OTHER")
+
+        response = self.request(server, "get_create_meta", {})
+        assert response["error"]["code"] == RPC_INVALID_PARAMS
+
+    def test_idempotency_key_refused_without_labels(self, server, backend):
+        """Test that a key the issue cannot carry is refused, not dropped"""
+        backend.get_create_meta.return_value = None
+        spec = {"project": "P", "summary": "S", "idempotency_key": "abc"}
+        for request_id in range(2):
+            response = self.request(server, "create_issue", spec, request_id)
+            assert response["error"]["code"] == RPC_INVALID_PARAMS
+        backend.create_issue.assert_not_called()
+        assert load_spool() == []
+
+        # Without a key the issue is created, and says it has no label
+        del spec["idempotency_key"]
+        response = self.request(server, "create_issue", spec)
+        assert response["result"]["idempotent"] is False
+
+    def test_failed_create_spooled(self, server, backend):
+        """Test that a creation JIRA rejects is kept for --drain-spool"""
+        backend.create_issue.side_effect = RuntimeError("502 Bad Gateway")
+        spec = {"project": "P", "summary": "S"}
+        response = self.request(server, "create_issue", spec)
+        assert response["error"]["code"] == RPC_SERVER_ERROR
+        assert response["error"]["message"] == "502 Bad Gateway (saved to the spool)"
+        [entry] = load_spool()
+        assert entry["fields"]["summary"] == "S"
+        assert entry["last_error"] == "502 Bad Gateway"
+
+    def test_auth_checked_once(self, server, backend):
+        """Test that auth state stays warm between requests"""
+        for request_id in range(3):
+            self.request(
+                server, "create_issue", {"project": "P", "summary": "S"}, request_id
+            )
+        backend.check_auth.assert_called_once()
+
+    def test_auth_failure(self, server, backend):
+        """Test that an auth failure is reported as an error"""
+        backend.check_auth.return_value = False
+        response = self.request(
+            server, "create_issue", {"project": "P", "summary": "S"}
+        )
+        assert response["error"]["code"] == RPC_AUTH_FAILED
+        assert server.authenticated is False
+
+    @patch(
+        "create_issue_interactive.get_cached_projects", return_value=["PROJ - Project"]
+    )
+    def test_list_projects_kept_in_memory(self, mock_projects, server):
+        """Test that projects are only loaded once unless refreshed"""
+        assert self.request(server, "list_projects")["result"]["projects"] == [
+            "PROJ - Project"
+        ]
+        self.request(server, "list_projects")
+        assert mock_projects.call_count == 1
+        self.request(server, "list_projects", {"refresh": True})
+        assert mock_projects.call_count == 2
+
+    def test_missing_field(self, server):
+        """Test that required fields are validated"""
+        response = self.request(server, "create_issue", {"project": "PROJ"})
+        assert response["error"]["code"] == RPC_INVALID_PARAMS
+
+    def test_unknown_method_and_parse_error(self, server):
+        """Test protocol-level errors"""
+        assert self.request(server, "nope")["error"]["code"] == RPC_METHOD_NOT_FOUND
+        assert server.handle_line("{not json")["error"]["code"] == RPC_PARSE_ERROR
+
+    def test_notification_has_no_response(self, server):
+        """Test that requests without an id get no response"""
+        assert server.handle_line(json.dumps({"method": "status"})) is None
+
+    @patch("create_issue_interactive.get_cached_projects", return_value=["PROJ"])
+    def test_serve_writes_only_responses_to_stdout(self, mock_projects, server):
+        """Test that the serve loop answers requests and stops on shutdown"""
+        requests = [
+            json.dumps({"jsonrpc": "2.0", "id": 1, "method": "status"}) + "\n",
+            "\n",
+            json.dumps({"jsonrpc": "2.0", "id": 2, "method": "shutdown"}) + "\n",
+            json.dumps({"jsonrpc": "2.0", "id": 3, "method": "status"}) + "\n",
+        ]
+        with patch("sys.stderr", new_callable=io.StringIO):
+            server.serve(requests)
+        responses = [json.loads(line) for line in server.output.getvalue().splitlines()]
+        assert [response["id"] for response in responses] == [1, 2]
+        assert responses[0]["result"]["jcli_path"] == "jcli"
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
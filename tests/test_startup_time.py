@@ -0,0 +1,80 @@
+"""
+Cold-start budget tests for create_issue_interactive.py
+
+These tests run the script under `python -X importtime` and check that the
+cheap command paths only import what they need.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "src",
+    "create_issue_interactive.py",
+)
+
+# Import time (microseconds) the script may add on top of a bare interpreter.
+# Generous enough for slow CI runners, small enough to catch an eager import.
+HELP_IMPORT_BUDGET_US = 50000
+
+# Modules that only the interactive and server paths need
+HEAVY_MODULES = {
+    "calendar",
+    "concurrent.futures",
+    "datetime",
+    "glob",
+    "json",
+    "subprocess",
+    "threading",
+}
+
+
+def import_times(args, home):
+    """Run Python with -X importtime and return {module: self time in us}"""
+    env = dict(os.environ, HOME=str(home))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, module = line[len("import time:"):].split("|")
+        times[module.strip()] = int(self_us)
+    return result, times
+
+
+@pytest.fixture
+def baseline(tmp_path):
+    """Modules a bare interpreter imports on its own"""
+    _, times = import_times(["-c", "pass"], tmp_path)
+    return times
+
+
+def test_help_skips_heavy_modules(tmp_path, baseline):
+    """Test that --help does not import modules only other paths use"""
+    result, times = import_times([SCRIPT, "--help"], tmp_path)
+    assert result.returncode == 0
+    assert "usage:" in result.stdout
+    assert not HEAVY_MODULES & set(times) - set(baseline)
+
+
+def test_help_import_budget(tmp_path, baseline):
+    """Test that --help stays within its cold-start import budget"""
+    _, times = import_times([SCRIPT, "--help"], tmp_path)
+    extra = sum(us for module, us in times.items() if module not in baseline)
+    assert extra < HELP_IMPORT_BUDGET_US, f"--help imports took {extra}us"
+
+
+def test_clear_path_skips_heavy_modules(tmp_path, baseline):
+    """Test that --clear-path does not import modules only other paths use"""
+    result, times = import_times([SCRIPT, "--clear-path"], tmp_path)
+    assert result.returncode == 0
+    assert not HEAVY_MODULES & set(times) - set(baseline)